@@ -1,8 +1,13 @@
+import heapq
+import itertools
+import os
+import pickle
 import time
 from world.game import Directions, Agent
 import algorithms.search as search
 import algorithms.problems as problems
 import algorithms.heuristics as heuristics
+import algorithms.utils as utils
 
 
 class SearchAgent(Agent):
@@ -22,21 +27,33 @@ class SearchAgent(Agent):
         fn="tinyHouseSearch",
         prob="SimpleSurvivorProblem",
         heuristic="nullHeuristic",
+        frontier=None,
+        maxNodes=None,
+        timeBudget=None,
+        maxExpansions=None,
+        maxTime=None,
+        maxMemory=None,
     ):
         """
         fn: Name of search function (dfs, bfs, ucs, astar)
         prob: Name of problem class
         heuristic: Name of heuristic function (for A*)
+        frontier: Name of the priority queue class in utils.py (for UCS/A*)
+        maxNodes: Most nodes kept in memory (for memory-bounded searches)
+        timeBudget: Seconds to plan (for anytime searches, e.g. ARA*)
+        maxExpansions, maxTime, maxMemory: Limits of the search budget
+            (expansions, seconds, MB of resident memory); any search stops with
+            a partial plan when one is hit
         """
         # Get the search function from the name
         if fn not in dir(search):
             raise AttributeError(fn + " is not a search function in search.py.")
         func = getattr(search, fn)
+        searchArgs = {}
 
         # Check if this search function uses a heuristic
         if "heuristic" not in func.__code__.co_varnames:
             print("[SearchAgent] using function " + fn)
-            self.searchFunction = func
         else:
             # For A*, we need to bind the heuristic
             if heuristic in globals().keys():
@@ -46,7 +63,41 @@ class SearchAgent(Agent):
             else:
                 raise AttributeError(heuristic + " is not a function in heuristics.py")
             print("[SearchAgent] using function %s and heuristic %s" % (fn, heuristic))
-            self.searchFunction = lambda x: func(x, heuristic=heur)
+            searchArgs["heuristic"] = heur
+
+        # Optionally bind the frontier data structure
+        if frontier is not None:
+            if "frontier" not in func.__code__.co_varnames:
+                raise AttributeError(fn + " does not take a frontier.")
+            if frontier not in dir(utils):
+                raise AttributeError(frontier + " is not a priority queue in utils.py")
+            print("[SearchAgent] using frontier " + frontier)
+            searchArgs["frontier"] = getattr(utils, frontier)
+
+        # Optionally bind the memory cap
+        if maxNodes is not None:
+            if "maxNodes" not in func.__code__.co_varnames:
+                raise AttributeError(fn + " does not take a node limit.")
+            print("[SearchAgent] using at most %d nodes" % maxNodes)
+            searchArgs["maxNodes"] = maxNodes
+
+        # Optionally bind the planning deadline
+        if timeBudget is not None:
+            if "timeBudget" not in func.__code__.co_varnames:
+                raise AttributeError(fn + " does not take a time budget.")
+            print("[SearchAgent] using a time budget of %.2f seconds" % timeBudget)
+            searchArgs["timeBudget"] = timeBudget
+
+        self.searchFunction = lambda x: func(x, **searchArgs)
+
+        # Optional search budget, applied to every search through the problem
+        self.budgetLimits = None
+        if (maxExpansions, maxTime, maxMemory) != (None, None, None):
+            self.budgetLimits = (maxExpansions, maxTime, maxMemory)
+            print(
+                "[SearchAgent] using a search budget of %s expansions, %s seconds, %s MB"
+                % self.budgetLimits
+            )
 
         # Get the problem class
         if prob not in dir(problems):
@@ -62,12 +113,37 @@ class SearchAgent(Agent):
             raise Exception("No search function provided for SearchAgent")
 
         starttime = time.time()
+        self.actionIndex = 0
         problem = self.searchType(state)  # Create the search problem
-        self.actions = self.searchFunction(problem)  # Find path using search algorithm
+        self.actions = self.runSearch(problem, self.budgetLimits)  # Find path using search algorithm
+
+        # A partial plan is followed and then the agent plans again from
+        # where it ends (see getAction)
+        self.replan = False
+        if isinstance(self.actions, utils.SearchResult):
+            result = self.actions
+            if result.status == utils.SearchResult.INCUMBENT:
+                print(
+                    "Search stopped by its budget; following the best complete plan found, of %d actions"
+                    % len(result.actions)
+                )
+            else:
+                self.replan = len(result.actions) > 0
+                print(
+                    "Search stopped by its %s budget; following a partial plan of %d actions"
+                    % (result.status, len(result.actions))
+                )
+            if result.bound is not None:
+                print("Lower bound on the optimal cost: %s" % result.bound)
+            self.actions = result.actions
 
         if self.actions is None:
             self.actions = []
 
+        # Planes sobre un grafo reducido: cada arista vuelve a ser sus pasos
+        if "expandActions" in dir(problem):
+            self.actions = problem.expandActions(self.actions)
+
         totalCost = problem.getCostOfActions(self.actions)
         print(
             "Path found with total cost of %d in %.1f seconds"
@@ -75,6 +151,29 @@ class SearchAgent(Agent):
         )
         if "_expanded" in dir(problem):
             print("Search nodes expanded: %d" % problem._expanded)
+        if "_iterations" in dir(problem):
+            print("Search iterations: %d" % problem._iterations)
+        if "_reexpanded" in dir(problem):
+            print("Search nodes re-expanded: %d" % problem._reexpanded)
+        if "_pruned" in dir(problem):
+            print("Search nodes pruned by the upper bound: %d" % problem._pruned)
+        if "_weight" in dir(problem):
+            print("Suboptimality bound: %.3f" % problem._weight)
+
+    def runSearch(self, problem, budgetLimits):
+        """
+        Runs the search function on problem within budgetLimits (expansions,
+        seconds, MB; None for no budget). Returns what the search returns,
+        or an empty SearchResult if it stopped without building one.
+        """
+        if budgetLimits is not None:
+            utils.SearchBudget(*budgetLimits).attach(problem)
+
+        try:
+            return self.searchFunction(problem)
+        except utils.BudgetExceeded as exceeded:
+            # Searches that don't build a SearchResult themselves
+            return utils.SearchResult(exceeded.reason, expanded=getattr(problem, "_expanded", 0))
 
     def getAction(self, state):
         """
@@ -86,7 +185,306 @@ class SearchAgent(Agent):
         i = self.actionIndex
         self.actionIndex += 1
 
+        if i >= len(self.actions) and getattr(self, "replan", False):
+            self.registerInitialState(state)
+            self.actionIndex = 1
+            i = 0
+
         if i < len(self.actions):
             return self.actions[i]
         else:
             return Directions.STOP
+
+
+class BudgetSearchAgent(SearchAgent):
+    """
+    SearchAgent for tight search budgets (--max-expansions, --max-time,
+    --max-memory), where following partial plans alone may never reach the
+    goal. A search that stops before any progress is run again with every
+    limit doubled, and so is a search from a position where an earlier
+    partial plan started: with the same budget the agent would walk back
+    and forth for ever. A doubled budget is kept for the rest of the mission.
+    """
+
+    def registerInitialState(self, state):
+        """
+        Plans like SearchAgent, remembering where each partial plan starts.
+        """
+        if not getattr(self, "replanning", False):
+            # Nueva mision: presupuesto original y ningun replanteo previo
+            self.currentLimits = self.budgetLimits
+            self.replanStarts = set()
+        self.searchState = state
+        SearchAgent.registerInitialState(self, state)
+
+    def runSearch(self, problem, budgetLimits):
+        """
+        Runs the search, doubling the budget until it makes some progress.
+        """
+        start = problem.getStartState()
+        budgetLimits = self.currentLimits
+        if budgetLimits is not None and start in self.replanStarts:
+            budgetLimits = self.currentLimits = _doubled(budgetLimits)
+            print(
+                "Back where an earlier partial plan started; using %s expansions, %s seconds, %s MB"
+                % budgetLimits
+            )
+
+        while True:
+            result = SearchAgent.runSearch(self, problem, budgetLimits)
+            if not isinstance(result, utils.SearchResult) or result.status == utils.SearchResult.INCUMBENT:
+                return result
+            if result.actions or problem.isGoalState(start):
+                self.replanStarts.add(start)
+                return result
+            # Un plan parcial vacio dejaria al agente quieto para siempre
+            budgetLimits = _doubled(budgetLimits)
+            print(
+                "Search stopped by its %s budget before any progress; retrying with %s expansions, %s seconds, %s MB"
+                % ((result.status,) + budgetLimits)
+            )
+            problem = self.searchType(self.searchState)
+
+    def getAction(self, state):
+        """
+        Returns the next action, planning again (not a new mission) when a
+        partial plan runs out.
+        """
+        self.replanning = True
+        action = SearchAgent.getAction(self, state)
+        self.replanning = False
+        return action
+
+
+def _doubled(limits):
+    """
+    Returns a (expansions, seconds, MB) search budget with every limit doubled.
+    """
+    return tuple(None if limit is None else 2 * limit for limit in limits)
+
+
+class ReplanningAgent(Agent):
+    """
+    Rescue agent for SimpleSurvivorProblem that keeps a D* Lite search
+    alive for the whole mission. Before every move it reads the wall and
+    terrain changes reported on the layout (RescueLayout.setWall /
+    setTerrain, which the mission calls for the changes scheduled in the
+    layout's .changes file) and repairs only the part of the search they
+    affect, instead of planning again from scratch.
+    """
+
+    def __init__(self, prob="SimpleSurvivorProblem"):
+        if prob != "SimpleSurvivorProblem":
+            raise AttributeError("ReplanningAgent only supports SimpleSurvivorProblem.")
+        self.planner = None
+        print("[ReplanningAgent] using D* Lite on SimpleSurvivorProblem")
+
+    def registerInitialState(self, state):
+        """
+        Runs the first (full) search.
+        """
+        starttime = time.time()
+        self.problem = problems.SimpleSurvivorProblem(state)
+        self.planner = search.DStarLite(self.problem)
+        self.seenChanges = len(state.getLayout().changes)
+
+        plan = self.planner.getPlan()
+        print(
+            "Path found with total cost of %d in %.1f seconds"
+            % (self.problem.getCostOfActions(plan), time.time() - starttime)
+        )
+        print("Search nodes expanded: %d" % self.problem._expanded)
+
+    def getAction(self, state):
+        """
+        Applies the changes reported since the last move and returns the
+        first action of the repaired plan.
+        """
+        layout = state.getLayout()
+        changes = layout.getChangesSince(self.seenChanges)
+        self.seenChanges += len(changes)
+
+        self.planner.moveTo(state.getRescuerPosition())
+        for position in changes:
+            self.planner.updateCell(
+                position, layout.isWall(position), layout.getTerrainCost(*position)
+            )
+
+        expanded = self.problem._expanded
+        action = self.planner.getNextAction()
+        if changes:
+            print(
+                "Replanned after %d map changes: %d nodes expanded"
+                % (len(changes), self.problem._expanded - expanded)
+            )
+        return action if action is not None else Directions.STOP
+
+
+# Default number of expansions of each RealTimeAgent lookahead search
+LOOKAHEAD = 64
+
+# Heuristic values learned by RealTimeAgent, by (problem, layout text); each
+# table maps compact states to their learned h
+LEARNED_HEURISTICS = {}
+
+
+class RealTimeAgent(Agent):
+    """
+    Real-time rescue agent (RTAA*, Koenig and Likhachev): before every move
+    it runs an A* lookahead of at most lookahead expansions (and at most
+    msPerMove milliseconds) from where it stands, raises the heuristic of
+    every state it expanded to f(best frontier node) - g(state), and takes
+    the first action towards that frontier node.
+
+    The learned values are kept in a compact table (integer state -> h)
+    shared by every mission on the same layout, and saved to tableFile
+    when one is given, so repeated missions converge to an optimal path.
+    The heuristic must be admissible.
+
+    MultiSurvivorProblem runs as CompactMultiSurvivorProblem (the same
+    problem with integer states).
+    """
+
+    def __init__(
+        self,
+        prob="SimpleSurvivorProblem",
+        heuristic="nullHeuristic",
+        lookahead=LOOKAHEAD,
+        msPerMove=None,
+        tableFile=None,
+    ):
+        """
+        prob: Name of problem class
+        heuristic: Name of heuristic function in heuristics.py
+        lookahead: Most expansions of each per-move search
+        msPerMove: Milliseconds each per-move search may take
+        tableFile: File the learned heuristic table is loaded from and
+            saved to
+        """
+        if prob == "MultiSurvivorProblem":
+            prob = "CompactMultiSurvivorProblem"
+        if prob not in ("SimpleSurvivorProblem", "CompactMultiSurvivorProblem"):
+            raise AttributeError("RealTimeAgent does not support " + prob)
+        if heuristic not in dir(heuristics):
+            raise AttributeError(heuristic + " is not a function in heuristics.py")
+        if lookahead < 1:
+            raise ValueError("lookahead must be at least 1")
+
+        self.searchType = getattr(problems, prob)
+        self.heuristic = getattr(heuristics, heuristic)
+        self.lookahead = lookahead
+        self.msPerMove = msPerMove
+        self.tableFile = tableFile
+        if tableFile is not None and os.path.exists(tableFile):
+            with open(tableFile, "rb") as f:
+                LEARNED_HEURISTICS.update(pickle.load(f))
+        self.missions = 0
+        print(
+            "[RealTimeAgent] using problem type %s and heuristic %s, %d expansions per move%s"
+            % (prob, heuristic, lookahead, "" if msPerMove is None else ", %g ms per move" % msPerMove)
+        )
+
+    def registerInitialState(self, state):
+        """
+        Builds the problem and picks the learned table of this layout.
+        No search is run before the first move.
+        """
+        self.problem = self.searchType(state)
+        self.compiled = state.getCompiledLayout()
+        key = (self.searchType.__name__, tuple(state.getLayoutText()))
+        self.table = LEARNED_HEURISTICS.setdefault(key, {})
+        self.missions += 1
+        self.moves = 0
+        self.slowestMove = 0
+
+    def _state(self, state):
+        """
+        Returns the problem state of a RescueState.
+        """
+        position = state.getRescuerPosition()
+        if self.searchType is problems.SimpleSurvivorProblem:
+            return position
+        survivors = state.getSurvivors()
+        mask = 0
+        for i, (x, y) in enumerate(self.problem.survivorList):
+            if survivors[x][y]:
+                mask |= 1 << i
+        return (self.problem.encodePosition(position), mask)
+
+    def _key(self, s):
+        """
+        Returns the integer key of a problem state in the learned table.
+        """
+        if self.searchType is problems.SimpleSurvivorProblem:
+            return self.compiled.positionToCell(s)
+        cell, mask = s
+        return mask * len(self.compiled.positions) + cell
+
+    def _h(self, s):
+        h = self.table.get(self._key(s))
+        return self.heuristic(s, self.problem) if h is None else h
+
+    def getAction(self, state):
+        """
+        Runs the lookahead search, learns from it and returns the first
+        action towards the best node of its frontier.
+        """
+        starttime = time.perf_counter()
+        deadline = None if self.msPerMove is None else starttime + self.msPerMove / 1000.0
+        problem = self.problem
+        inicio = self._state(state)
+
+        # A* acotado desde la posicion actual
+        contador = itertools.count()
+        g = {inicio: 0}
+        padres = {inicio: (None, None)}
+        frontera = [(self._h(inicio), next(contador), inicio)]
+        cerrados = []
+        expandidos = set()
+        mejor = None
+        while frontera:
+            f, _, s = heapq.heappop(frontera)
+            if s in expandidos or g[s] + self._h(s) < f:
+                continue  # entrada vieja
+            if problem.isGoalState(s) or len(cerrados) >= self.lookahead or (
+                deadline is not None and cerrados and time.perf_counter() >= deadline
+            ):
+                mejor = (f, s)
+                break
+            cerrados.append(s)
+            expandidos.add(s)
+            for sucesor, accion, costo in problem.getSuccessors(s):
+                nuevoG = g[s] + costo
+                if nuevoG < g.get(sucesor, float("inf")):
+                    g[sucesor] = nuevoG
+                    padres[sucesor] = (s, accion)
+                    heapq.heappush(frontera, (nuevoG + self._h(sucesor), next(contador), sucesor))
+
+        if mejor is None:
+            return Directions.STOP  # no queda ningun camino a la meta
+
+        # Aprendizaje: h(s) = f(mejor) - g(s) para todo estado expandido
+        fMejor, s = mejor
+        for cerrado in cerrados:
+            self.table[self._key(cerrado)] = max(self._h(cerrado), fMejor - g[cerrado])
+
+        # Primer paso del camino al mejor nodo de la frontera
+        accion = None
+        while s != inicio:
+            s, accion = padres[s]
+
+        self.moves += 1
+        self.slowestMove = max(self.slowestMove, time.perf_counter() - starttime)
+        return accion
+
+    def final(self, state):
+        """
+        Reports the mission and saves the learned table.
+        """
+        print(
+            "Mission %d: %d moves, %d nodes expanded, slowest move %.1f ms, %d learned states"
+            % (self.missions, self.moves, self.problem._expanded, self.slowestMove * 1000, len(self.table))
+        )
+        if self.tableFile is not None:
+            with open(self.tableFile, "wb") as f:
+                pickle.dump(LEARNED_HEURISTICS, f)
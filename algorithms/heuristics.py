@@ -2,6 +2,7 @@ import math
 from typing import Any, Tuple
 from algorithms import utils
 from algorithms.problems import MultiSurvivorProblem
+from world.rescue_layout import UNREACHABLE
 
 
 def nullHeuristic(state, problem=None):
@@ -52,11 +53,29 @@ def euclideanHeuristic(state, problem):
     return math.sqrt((x - mx) ** 2 + (y - my) ** 2)
 
 
+def compactStateAdapter(heuristic):
+    """
+    Wraps a heuristic that reads (position, survivors_grid) states directly
+    so it can be used with CompactMultiSurvivorProblem, whose states are
+    (cell_index, survivors_mask). Heuristics that go through
+    problem.getRescuerPosition / problem.getSurvivorPositions (such as
+    survivorHeuristic) already work with both and don't need it.
+    """
+
+    def adapted(state, problem):
+        if hasattr(problem, "decodeState"):
+            state = problem.decodeState(state)
+        return heuristic(state, problem)
+
+    return adapted
+
+
 def survivorHeuristic(state: Tuple[Tuple, Any], problem: MultiSurvivorProblem):
     """
     Your heuristic for the MultiSurvivorProblem.
 
-    state: (position, survivors_grid)
+    state: (position, survivors_grid), or (cell_index, survivors_mask) for
+           CompactMultiSurvivorProblem
     problem: MultiSurvivorProblem instance
 
     This must be admissible and preferably consistent.
@@ -109,15 +128,11 @@ def survivorHeuristic(state: Tuple[Tuple, Any], problem: MultiSurvivorProblem):
     #Versión final
     # h(n) = distancia(agente, sobreviviente más cercano) + MST(sobrevivientes restantes)  
     
-    position, survivors_grid = state
-    agent_x, agent_y = position
+    # El problema sabe decodificar su propio estado (grid o bitmask compacto)
+    agent_x, agent_y = problem.getRescuerPosition(state)
     
-    # Obtener la lista de sobrevivientes a partir de survivors_grid
-    survivors = []
-    for x in range(survivors_grid.width):
-        for y in range(survivors_grid.height):
-            if survivors_grid[x][y]:
-                survivors.append((x, y))
+    # Obtener la lista de sobrevivientes que faltan por rescatar
+    survivors = problem.getSurvivorPositions(state)
     
     # Si no hay sobrevivientes, el costo es 0
     if not survivors:
@@ -161,3 +176,135 @@ def survivorHeuristic(state: Tuple[Tuple, Any], problem: MultiSurvivorProblem):
     mst_costos = problem.heuristicInfo[tupla_survivors]
     
     return min_distance + mst_costos
+
+
+def _distanceFields(problem):
+    """
+    Returns {survivor position: array with the cheapest terrain-aware cost
+    from every cell (x * height + y) to that survivor, UNREACHABLE if it
+    can't reach it}.
+
+    The fields are the ones CompiledLayout.getDistancesTo computes (one
+    backward Dijkstra per survivor) and keeps; only the dict that maps
+    survivors to them is cached in problem.heuristicInfo.
+    """
+    fields = problem.heuristicInfo.get("distanceFields")
+    if fields is None:
+        layout = problem.compiled
+        if hasattr(problem, "getSurvivorPositions"):
+            targets = problem.getSurvivorPositions(problem.getStartState())
+        else:
+            targets = [problem.goal]
+
+        fields = {target: layout.getDistancesTo(layout.positionToCell(target)) for target in targets}
+        problem.heuristicInfo["distanceFields"] = fields
+    return fields
+
+
+def mazeDistanceHeuristic(state, problem):
+    """
+    Exact cheapest terrain-aware cost from state to the goal of a
+    SimpleSurvivorProblem, read from a precomputed distance field. Unlike
+    manhattanHeuristic it accounts for walls and terrain costs.
+    """
+    # Con un costFn propio el campo de distancias no corresponde al problema
+    if problem.compiled is None:
+        return 0
+    field = _distanceFields(problem)[problem.goal]
+    return field[problem.compiled.positionToCell(state)]
+
+
+def mazeSurvivorHeuristic(state, problem: MultiSurvivorProblem):
+    """
+    Like survivorHeuristic, but with exact maze distances instead of
+    Manhattan ones:
+
+    h(n) = cost to the nearest remaining survivor + MST of the remaining
+    survivors, where the weight of an MST edge is min(d(a, b), d(b, a)).
+
+    Any walk that rescues every survivor pays at least that much, so the
+    heuristic is admissible (and consistent).
+    """
+    survivors = problem.getSurvivorPositions(state)
+    if not survivors:
+        return 0
+
+    fields = _distanceFields(problem)
+    layout = problem.compiled
+    cell = layout.positionToCell(problem.getRescuerPosition(state))
+
+    # Costo exacto hasta el sobreviviente mas cercano
+    nearest = min(fields[survivor][cell] for survivor in survivors)
+
+    # MST de los sobrevivientes restantes, cacheado por conjunto
+    key = ("mazeMST", tuple(survivors))
+    mst = problem.heuristicInfo.get(key)
+    if mst is None:
+        mst = _mazeMST(survivors, fields, layout)
+        problem.heuristicInfo[key] = mst
+
+    return nearest + mst
+
+
+def _mazeMST(survivors, fields, layout):
+    """
+    Prim's algorithm over the survivors with edge weights
+    min(d(a, b), d(b, a)) taken from the distance fields.
+    """
+    cells = [layout.positionToCell(survivor) for survivor in survivors]
+    inTree = [False] * len(survivors)
+    best = [float("inf")] * len(survivors)
+    best[0] = 0
+    total = 0
+
+    for _ in range(len(survivors)):
+        i = min((j for j in range(len(survivors)) if not inTree[j]), key=best.__getitem__)
+        inTree[i] = True
+        total += best[i]
+        fromI = fields[survivors[i]]
+        for j in range(len(survivors)):
+            if not inTree[j]:
+                weight = min(fromI[cells[j]], fields[survivors[j]][cells[i]])
+                if weight < best[j]:
+                    best[j] = weight
+
+    return total
+
+
+def greedyTourHeuristic(state, problem):
+    """
+    Inadmissible estimate of the cost still to pay: the length of the tour
+    that always goes to the nearest remaining survivor. Uses exact maze
+    distances when the problem has a compiled layout and Manhattan
+    distances otherwise.
+
+    Meant as the distance-to-go estimate of focalSearch and
+    explicitEstimationSearch, not as an A* heuristic.
+    """
+    if hasattr(problem, "getSurvivorPositions"):
+        position = problem.getRescuerPosition(state)
+        pending = list(problem.getSurvivorPositions(state))
+    else:
+        position = state
+        pending = [] if state == problem.goal else [problem.goal]
+
+    if getattr(problem, "compiled", None) is not None:
+        fields = _distanceFields(problem)
+        cellOf = problem.compiled.positionToCell
+
+        def distance(a, b):
+            return fields[b][cellOf(a)]
+
+    else:
+
+        def distance(a, b):
+            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    # Vecino mas cercano: siempre al sobreviviente mas cercano que falta
+    total = 0
+    while pending:
+        nearest = min(pending, key=lambda survivor: distance(position, survivor))
+        total += distance(position, nearest)
+        pending.remove(nearest)
+        position = nearest
+    return total
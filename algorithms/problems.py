@@ -1,5 +1,5 @@
 from algorithms import utils
-from world.game import Directions, Actions
+from world.game import Directions, Actions, Grid
 from world.rescue_state import RescueState
 
 
@@ -101,11 +101,17 @@ class SimpleSurvivorProblem(SearchProblem):
                         % (len(survivors), str(self.goal))
                     )
 
-        # Use terrain cost from rescue state so search cost matches game cumulative cost
+        # Use terrain cost from rescue state so search cost matches game cumulative cost.
+        # With the default terrain costs successors come straight from the
+        # precomputed adjacency table of the compiled layout.
+        self.terrainCosts = costFn is None
         if costFn is None:
             costFn = lambda pos: rescueState.getTerrainCost(pos[0], pos[1])
+            rescueState.getCompiledLayout()  # se compila aqui y no durante la busqueda
         self.costFn = costFn
         self.visualize = visualize
+        self.layoutText = rescueState.getLayoutText()
+        self.layout = rescueState.getLayout()
 
         # Optional sanity warning: goal should contain a survivor in the single-survivor case
         # (If you put the survivor elsewhere or you're using a beacon-cell idea, you may want warn=False)
@@ -117,6 +123,16 @@ class SimpleSurvivorProblem(SearchProblem):
 
         # For visualization/statistics
         self._visited, self._visitedlist, self._expanded = {}, [], 0
+        self.heuristicInfo = {}  # For caching heuristic computations
+
+    @property
+    def compiled(self):
+        """
+        CompiledLayout of the layout, or None with a custom costFn. It is
+        asked of the layout every time, so wall and terrain changes
+        reported on it (RescueLayout.setWall / setTerrain) apply at once.
+        """
+        return self.layout.compile() if self.terrainCosts else None
 
     def getStartState(self):
         return self.startState
@@ -144,21 +160,30 @@ class SimpleSurvivorProblem(SearchProblem):
 
         This is where terrain costs come into play via costFn.
         """
-        successors = []
-        for action in [
-            Directions.NORTH,
-            Directions.SOUTH,
-            Directions.EAST,
-            Directions.WEST,
-        ]:
-            x, y = state
-            dx, dy = Actions.directionToVector(action)
-            nextx, nexty = int(x + dx), int(y + dy)
+        successors = self._moves(state)
+
+        # Bookkeeping for display
+        self._expanded += 1
+        if state not in self._visited:
+            self._visited[state] = True
+            self._visitedlist.append(state)
 
-            if not self.walls[nextx][nexty]:
-                nextState = (nextx, nexty)
-                cost = self.costFn(nextState)
-                successors.append((nextState, action, cost))
+        return successors
+
+    def getPredecessors(self, state):
+        """
+        Returns the states that reach 'state' in one move, as triples
+        (predecessor, action, stepCost), where 'action' takes predecessor to
+        state and stepCost is the cost of entering state. Moves are
+        reversible, so the predecessors are the neighbors of state.
+
+        Used by searches that also run backwards from the goal.
+        """
+        stepCost = self.costFn(state)
+        predecessors = [
+            (prevState, Actions.reverseDirection(action), stepCost)
+            for prevState, action, _ in self._moves(state)
+        ]
 
         # Bookkeeping for display
         self._expanded += 1
@@ -166,6 +191,35 @@ class SimpleSurvivorProblem(SearchProblem):
             self._visited[state] = True
             self._visitedlist.append(state)
 
+        return predecessors
+
+    def _moves(self, state):
+        """
+        Returns the legal (nextState, action, cost) moves out of state.
+        """
+        compiled = self.compiled
+        if compiled is not None:
+            positions = compiled.positions
+            successors = [
+                (positions[nextCell], action, cost)
+                for nextCell, action, cost in compiled.getEdges(compiled.positionToCell(state))
+            ]
+        else:
+            successors = []
+            for action in [
+                Directions.NORTH,
+                Directions.SOUTH,
+                Directions.EAST,
+                Directions.WEST,
+            ]:
+                x, y = state
+                dx, dy = Actions.directionToVector(action)
+                nextx, nexty = int(x + dx), int(y + dy)
+
+                if not self.walls[nextx][nexty]:
+                    nextState = (nextx, nexty)
+                    cost = self.costFn(nextState)
+                    successors.append((nextState, action, cost))
         return successors
 
     def getCostOfActions(self, actions):
@@ -175,14 +229,23 @@ class SimpleSurvivorProblem(SearchProblem):
         if actions is None:
             return 999999
 
+        # With the default terrain costs the schedule of the layout (if any)
+        # decides the cost of each step
+        timed = self.compiled is not None and self.layout.isTimed()
+
         x, y = self.getStartState()
         cost = 0
-        for action in actions:
+        for time, action in enumerate(actions, 1):
             dx, dy = Actions.directionToVector(action)
             x, y = int(x + dx), int(y + dy)
             if self.walls[x][y]:
                 return 999999
-            cost += self.costFn((x, y))
+            if timed:
+                if self.layout.isBlockedAt((x, y), time):
+                    return 999999
+                cost += self.layout.getTerrainCostAt(x, y, time)
+            else:
+                cost += self.costFn((x, y))
         return cost
 
 
@@ -203,16 +266,39 @@ class MultiSurvivorProblem(SearchProblem):
             startingMissionState.getSurvivors(),
         )
         self.walls = startingMissionState.getWalls()
+        self.layout = startingMissionState.getLayout()
+        self.layout.compile()  # se compila aqui y no durante la busqueda
+        self.layoutText = startingMissionState.getLayoutText()
         self.startingMissionState = startingMissionState
         self._expanded = 0
         self.heuristicInfo = {}  # For caching heuristic computations
 
+    @property
+    def compiled(self):
+        """
+        CompiledLayout of the layout, asked of it every time so wall and
+        terrain changes reported on it apply at once.
+        """
+        return self.layout.compile()
+
     def getStartState(self):
         return self.start
 
     def isGoalState(self, state):
         return state[1].count() == 0
 
+    def getRescuerPosition(self, state):
+        """
+        Returns the (x, y) position of the rescuer in the given state.
+        """
+        return state[0]
+
+    def getSurvivorPositions(self, state):
+        """
+        Returns the list of (x, y) positions of the survivors still to rescue.
+        """
+        return state[1].asList()
+
     def getSuccessors(self, state):
         """
         Returns successor states, the actions they require, and the terrain cost of the destination cell.
@@ -220,21 +306,13 @@ class MultiSurvivorProblem(SearchProblem):
         successors = []
         self._expanded += 1
 
-        for direction in [
-            Directions.NORTH,
-            Directions.SOUTH,
-            Directions.EAST,
-            Directions.WEST,
-        ]:
-            x, y = state[0]
-            dx, dy = Actions.directionToVector(direction)
-            nextx, nexty = int(x + dx), int(y + dy)
-
-            if not self.walls[nextx][nexty]:
-                nextSurvivors = state[1].copy()
-                nextSurvivors[nextx][nexty] = False  # Rescue survivor if present
-                stepCost = self.startingMissionState.getTerrainCost(nextx, nexty)
-                successors.append((((nextx, nexty), nextSurvivors), direction, stepCost))
+        compiled = self.compiled
+        positions = compiled.positions
+        for nextCell, direction, stepCost in compiled.getEdges(compiled.positionToCell(state[0])):
+            nextx, nexty = positions[nextCell]
+            nextSurvivors = state[1].copy()
+            nextSurvivors[nextx][nexty] = False  # Rescue survivor if present
+            successors.append((((nextx, nexty), nextSurvivors), direction, stepCost))
 
         return successors
 
@@ -243,7 +321,7 @@ class MultiSurvivorProblem(SearchProblem):
         Returns the cost of a particular sequence of actions.
         Uses terrain cost per cell (same as game cumulative cost).
         """
-        x, y = self.getStartState()[0]
+        x, y = self.getRescuerPosition(self.getStartState())
         cost = 0
         for action in actions:
             dx, dy = Actions.directionToVector(action)
@@ -252,3 +330,192 @@ class MultiSurvivorProblem(SearchProblem):
                 return 999999
             cost += self.startingMissionState.getTerrainCost(x, y)
         return cost
+
+
+class CompactMultiSurvivorProblem(MultiSurvivorProblem):
+    """
+    Same problem as MultiSurvivorProblem with an integer-encoded state.
+
+    Survivors are indexed once when the problem is built, so a state is
+    (cell_index, survivors_mask):
+    - cell_index: x * height + y (the same order used by Grid)
+    - survivors_mask: bit i is set while survivor i is still to be rescued
+
+    Hashing, equality, goal tests and successor generation are O(1) instead
+    of copying and scanning a full Grid.
+    """
+
+    def __init__(self, startingMissionState: RescueState):
+        MultiSurvivorProblem.__init__(self, startingMissionState)
+        self.height = self.walls.height
+
+        # Survivor i <-> bit i, in the same order as Grid.asList()
+        self.survivorList = startingMissionState.getSurvivorsAsList()
+        self.survivorBits = [0] * (self.walls.width * self.height)
+        for i, (x, y) in enumerate(self.survivorList):
+            self.survivorBits[self.encodePosition((x, y))] = 1 << i
+
+        self.start = (
+            self.encodePosition(startingMissionState.getRescuerPosition()),
+            (1 << len(self.survivorList)) - 1,
+        )
+
+    def encodePosition(self, position):
+        """
+        Returns the cell index of an (x, y) position.
+        """
+        x, y = position
+        return x * self.height + y
+
+    def decodePosition(self, cell):
+        """
+        Returns the (x, y) position of a cell index.
+        """
+        return divmod(cell, self.height)
+
+    def decodeState(self, state):
+        """
+        Returns the equivalent MultiSurvivorProblem state: (position, survivors_grid).
+        """
+        survivors = Grid(self.walls.width, self.height, False)
+        for x, y in self.getSurvivorPositions(state):
+            survivors[x][y] = True
+        return (self.decodePosition(state[0]), survivors)
+
+    def isGoalState(self, state):
+        return state[1] == 0
+
+    def getRescuerPosition(self, state):
+        return self.decodePosition(state[0])
+
+    def getSurvivorPositions(self, state):
+        mask = state[1]
+        return [pos for i, pos in enumerate(self.survivorList) if mask >> i & 1]
+
+    def getSuccessors(self, state):
+        """
+        Returns successor states, the actions they require, and the terrain cost of the destination cell.
+        """
+        self._expanded += 1
+
+        cell, mask = state
+        survivorBits = self.survivorBits
+        # Rescue survivor if present by clearing its bit
+        return [
+            ((nextCell, mask & ~survivorBits[nextCell]), direction, stepCost)
+            for nextCell, direction, stepCost in self.compiled.getEdges(cell)
+        ]
+
+
+def expandActions(actions):
+    """
+    Expands the corridor edges of a plan on a ReducedLayout (tuples of
+    moves) back into primitive actions. Primitive actions are kept as is.
+    """
+    if actions is None:
+        return None
+    expanded = []
+    for action in actions:
+        if isinstance(action, tuple):
+            expanded.extend(action)
+        else:
+            expanded.append(action)
+    return expanded
+
+
+class ReducedSimpleSurvivorProblem(SimpleSurvivorProblem):
+    """
+    SimpleSurvivorProblem searched on the ReducedLayout of the map: dead
+    ends are gone and every corridor is a single move, whose action is the
+    tuple of primitive moves it stands for (see expandActions).
+
+    States are still (x, y) positions, but only of junctions, the rescuer
+    and the goal. Costs are unchanged, so heuristics stay admissible.
+    """
+
+    def __init__(self, rescueState, **kwargs):
+        SimpleSurvivorProblem.__init__(self, rescueState, **kwargs)
+        if self.compiled is None:
+            raise ValueError("ReducedSimpleSurvivorProblem needs the default terrain costs")
+        self.keptCells = frozenset(
+            [self.compiled.positionToCell(self.startState), self.compiled.positionToCell(self.goal)]
+        )
+
+    @property
+    def reduced(self):
+        """
+        ReducedLayout of the current compiled layout (see compiled).
+        """
+        return self.compiled.reduce(self.keptCells)
+
+    def _moves(self, state):
+        compiled = self.compiled
+        positions = compiled.positions
+        return [
+            (positions[nextCell], actions, cost)
+            for nextCell, actions, cost in compiled.reduce(self.keptCells).getEdges(
+                compiled.positionToCell(state)
+            )
+        ]
+
+    def getPredecessors(self, state):
+        """
+        Returns the (predecessor, action, stepCost) triples of the edges
+        that end at state.
+        """
+        compiled, reduced = self.compiled, self.reduced
+        cell = compiled.positionToCell(state)
+        predecessors = []
+        for prevCell, _, _ in reduced.getEdges(cell):
+            for nextCell, actions, cost in reduced.getEdges(prevCell):
+                if nextCell == cell:
+                    predecessors.append((compiled.positions[prevCell], actions, cost))
+
+        self._expanded += 1
+        return predecessors
+
+    def expandActions(self, actions):
+        return expandActions(actions)
+
+    def getCostOfActions(self, actions):
+        return SimpleSurvivorProblem.getCostOfActions(self, expandActions(actions))
+
+
+class ReducedMultiSurvivorProblem(CompactMultiSurvivorProblem):
+    """
+    CompactMultiSurvivorProblem searched on the ReducedLayout of the map:
+    dead ends without survivors are gone and every corridor is a single
+    move, whose action is the tuple of primitive moves it stands for (see
+    expandActions). Survivors are nodes of the reduced graph, so a
+    corridor never rescues anyone on the way.
+    """
+
+    def __init__(self, startingMissionState: RescueState):
+        CompactMultiSurvivorProblem.__init__(self, startingMissionState)
+        self.keptCells = frozenset([self.start[0]] + [self.encodePosition(pos) for pos in self.survivorList])
+
+    @property
+    def reduced(self):
+        """
+        ReducedLayout of the current compiled layout (see compiled).
+        """
+        return self.compiled.reduce(self.keptCells)
+
+    def getSuccessors(self, state):
+        """
+        Returns successor states, the corridor each one takes, and its cost.
+        """
+        self._expanded += 1
+
+        cell, mask = state
+        survivorBits = self.survivorBits
+        return [
+            ((nextCell, mask & ~survivorBits[nextCell]), actions, cost)
+            for nextCell, actions, cost in self.reduced.getEdges(cell)
+        ]
+
+    def expandActions(self, actions):
+        return expandActions(actions)
+
+    def getCostOfActions(self, actions):
+        return CompactMultiSurvivorProblem.getCostOfActions(self, expandActions(actions))
@@ -1,7 +1,30 @@
-from algorithms.problems import SearchProblem
+import copy
+import heapq
+import itertools
+import multiprocessing
+import os
+import queue
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from algorithms.problems import (
+    SearchProblem,
+    SimpleSurvivorProblem,
+    MultiSurvivorProblem,
+    CompactMultiSurvivorProblem,
+)
+import algorithms.heuristics as heuristics
 import algorithms.utils as utils
-from world.game import Directions
-from algorithms.heuristics import nullHeuristic
+from world.game import Directions, Actions
+from world.rescue_layout import INFINITY, RescueLayout
+from world.rescue_state import RescueState
+from algorithms.heuristics import nullHeuristic, greedyTourHeuristic
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; heldKarpSearch falls back to pure Python
+    np = None
 
 
 def tinyHouseSearch(problem: SearchProblem):
@@ -14,89 +37,199 @@ def tinyHouseSearch(problem: SearchProblem):
     return [s, s, w, s, w, w, s, w]
     
 
-def depthFirstSearch(problem: SearchProblem):
-    """
-    Search the deepest nodes in the search tree first.
+# Duplicate detection policies of bestFirstSearch
+EXPANDED = "expanded"  # skip states that were already expanded (DFS)
+GENERATED = "generated"  # never queue a state twice (BFS)
+CHEAPER = "cheaper"  # queue a state again only through a cheaper path (UCS, A*)
 
-    Your search algorithm needs to return a list of actions that reaches the
-    goal. Make sure to implement a graph search algorithm.
 
-    To get started, you might want to try some of these simple commands to
-    understand the search problem that is being passed in:
+def bestFirstSearch(
+    problem: SearchProblem,
+    heuristic=None,
+    frontier=utils.PriorityQueue,
+    gWeight=1,
+    hWeight=1,
+    duplicates=CHEAPER,
+    upperBound=None,
+    incumbent=None,
+):
+    """
+    Generic graph search shared by every search in this module.
 
-    print("Start:", problem.getStartState())
-    print("Is the start a goal?", problem.isGoalState(problem.getStartState()))
-    print("Start's successors:", problem.getSuccessors(problem.getStartState()))
+    frontier: open-list class. utils.Stack and utils.Queue are used in
+        insertion order (DFS, BFS); any priority queue gets nodes with
+        priority gWeight * g(n) + hWeight * h(n). Monotone queues
+        (utils.BucketQueue, utils.RadixHeap) are replaced by
+        utils.PriorityQueue unless the priority is g(n) or g(n) + h(n).
+    heuristic: h(n); None means h(n) = 0 without calling anything.
+    duplicates: EXPANDED, GENERATED or CHEAPER (see above).
+    upperBound, incumbent: cost and actions of a known plan (branch and
+        bound, for UCS/A*). Nodes with g(n) + h(n) at or above the bound are
+        never queued, goals found while generating lower it, and if nothing
+        cheaper turns up the best plan known is returned.
+
+    Returns the list of actions to the first goal popped from the frontier,
+    or [] if there is none. If the utils.SearchBudget attached to the
+    problem runs out, returns a utils.SearchResult with the best plan known
+    (branch and bound) or else the path to the node being expanded and, for
+    UCS/A*, its f as lower bound.
     """
-    # Pila LIFO: expande primero el nodo más profundo descubierto.
-    frontera = utils.Stack()
-    estado_inicial = problem.getStartState()
+    # Variables locales para no buscar atributos en cada iteracion
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
+    Node = utils.SearchNode
+    prioritized = not issubclass(frontier, (utils.Stack, utils.Queue))
+    # Las colas monotonas (BucketQueue, RadixHeap) solo sirven si las
+    # prioridades son f = g + h; con pesos (weighted A*, greedy) van al heap
+    if getattr(frontier, "monotone", False) and (gWeight != 1 or hWeight not in (0, 1)):
+        frontier = utils.PriorityQueue
+    expandedOnly = duplicates == EXPANDED
+    cheaperOnly = duplicates == CHEAPER
 
-    # Cada elemento de la frontera es: (estado, lista_de_acciones_hasta_ese_estado).
-    frontera.push((estado_inicial, []))
+    frontera = frontier()
+    push, pop, isEmpty = frontera.push, frontera.pop, frontera.isEmpty
 
-    # Conjunto de estados ya expandidos para evitar ciclos.
-    visitados = set()
+    inicio = problem.getStartState()
+    if prioritized:
+        h = heuristic(inicio, problem) if heuristic is not None else 0
+        push(Node(inicio), hWeight * h)
+    else:
+        push(Node(inicio))
 
-    while not frontera.isEmpty():
-        # Sacamos el último estado agregado a la pila.
-        estado, acciones = frontera.pop()
+    # Estados vistos: mejor costo conocido (CHEAPER), generados (GENERATED)
+    # o expandidos (EXPANDED)
+    vistos = {} if expandedOnly else {inicio: 0}
+    mejorCosto = vistos.get
+    infinito = float("inf")
 
-        # Si alcanzamos la meta, devolvemos el camino de acciones.
-        if problem.isGoalState(estado):
-            return acciones
+    # Cota superior: costo del mejor plan conocido
+    acotado = prioritized and upperBound is not None
+    cota = upperBound if acotado else infinito
+    mejorNodo = None
+    if acotado:
+        problem._pruned = 0
 
-        # Si ya se expandió este estado, lo saltamos.
-        if estado in visitados:
-            continue
+    try:
+        while not isEmpty():
+            nodo = pop()
+            estado, costo = nodo.state, nodo.cost
+
+            # encolado antes de que bajara la cota
+            if mejorNodo is not None and costo + (
+                hWeight * heuristic(estado, problem) if heuristic is not None else 0
+            ) >= cota:
+                continue
+
+            if cheaperOnly:
+                # si ya hay un camino mas barato a este estado, lo saltamos
+                if costo > mejorCosto(estado, infinito):
+                    continue
+            elif expandedOnly and estado in vistos:
+                continue
+
+            # la meta se revisa al sacar el nodo, asi UCS y A* son optimos
+            if isGoalState(estado):
+                return nodo.getPath()
+
+            if expandedOnly:
+                vistos[estado] = costo
+
+            for sucesor, accion, paso in getSuccessors(estado):
+                nuevoCosto = costo + paso
+                if cheaperOnly:
+                    if nuevoCosto >= mejorCosto(sucesor, infinito):
+                        continue
+                    vistos[sucesor] = nuevoCosto
+                elif sucesor in vistos:
+                    continue
+                elif not expandedOnly:
+                    vistos[sucesor] = nuevoCosto
 
-        # Marcamos como visitado justo cuando lo expandimos.
-        visitados.add(estado)
+                hijo = Node(sucesor, nodo, accion, nuevoCosto)
+                if prioritized:
+                    h = heuristic(sucesor, problem) if heuristic is not None else 0
+                    if acotado:
+                        # Poda: con h admisible este nodo no mejora la cota
+                        if nuevoCosto + hWeight * h >= cota:
+                            problem._pruned += 1
+                            continue
+                        if isGoalState(sucesor):
+                            cota, mejorNodo = nuevoCosto, hijo
+                            continue
+                    push(hijo, gWeight * nuevoCosto + hWeight * h)
+                else:
+                    push(hijo)
+    except utils.BudgetExceeded as agotado:
+        # nodo es el que se estaba expandiendo: el mas prometedor hasta
+        # ahora. Con prioridad g + h su f es una cota inferior del optimo.
+        inferior = None
+        if prioritized and gWeight == 1 and hWeight in (0, 1):
+            h = heuristic(nodo.state, problem) if heuristic is not None and hWeight else 0
+            inferior = nodo.cost + h
+        # Con un plan completo conocido (branch and bound) se devuelve ese
+        if mejorNodo is not None or acotado and incumbent:
+            plan = mejorNodo.getPath() if mejorNodo is not None else incumbent
+            if inferior is not None:
+                inferior = min(inferior, cota)
+            return _stoppedResult(problem, agotado, plan, inferior, completo=True)
+        return _stoppedResult(problem, agotado, nodo.getPath(), inferior)
 
-        # Agregamos sucesores no visitados para seguir profundizando.
-        for sucesor, accion, _ in problem.getSuccessors(estado):
-            if sucesor not in visitados:
-                frontera.push((sucesor, acciones + [accion]))
+    # Nada fue mas barato que el mejor plan conocido
+    if mejorNodo is not None:
+        return mejorNodo.getPath()
+    if acotado and incumbent is not None:
+        return incumbent
 
     # Si no hay solución, retornamos lista vacía.
-    return [] 
+    return []
 
 
-def breadthFirstSearch(problem: SearchProblem):
+def _stoppedResult(problem, agotado, acciones, cota=None, completo=False):
     """
-    Search the shallowest nodes in the search tree first.
+    SearchResult of a search stopped by its budget (agotado, the
+    utils.BudgetExceeded raised): acciones is the best complete plan found
+    if completo, and the partial plan to the most promising node otherwise.
     """
-    # Cola FIFO: expande primero los nodos más cercanos al estado inicial.
-    frontera = utils.Queue()
-    estado_inicial = problem.getStartState()
+    estado = utils.SearchResult.INCUMBENT if completo else agotado.reason
+    return utils.SearchResult(estado, acciones, cota, getattr(problem, "_expanded", 0))
 
-    # Cada elemento de la frontera es: (estado, lista_de_acciones_hasta_ese_estado).
-    frontera.push((estado_inicial, []))
 
-    # En BFS marcamos visitado al encolar para no duplicar estados en la cola.
-    visitados = {estado_inicial}
+def depthFirstSearch(problem: SearchProblem):
+    """
+    Search the deepest nodes in the search tree first.
+
+    Your search algorithm needs to return a list of actions that reaches the
+    goal. Make sure to implement a graph search algorithm.
 
-    while not frontera.isEmpty():
-        # Sacamos el estado más antiguo en la cola (orden por niveles).
-        estado, acciones = frontera.pop()
+    To get started, you might want to try some of these simple commands to
+    understand the search problem that is being passed in:
 
-        # Si llegamos al objetivo, devolvemos el camino de acciones.
-        if problem.isGoalState(estado):
-            return acciones
+    print("Start:", problem.getStartState())
+    print("Is the start a goal?", problem.isGoalState(problem.getStartState()))
+    print("Start's successors:", problem.getSuccessors(problem.getStartState()))
+    """
+    # Pila LIFO: expande primero el nodo más profundo descubierto; un estado
+    # se marca como visitado justo cuando se expande.
+    return bestFirstSearch(problem, frontier=utils.Stack, duplicates=EXPANDED)
 
-        # Expandimos sucesores no visitados y los encolamos al final.
-        for sucesor, accion, _ in problem.getSuccessors(estado):
-            if sucesor not in visitados:
-                visitados.add(sucesor)
-                frontera.push((sucesor, acciones + [accion]))
 
-    # Si no existe solución, retornamos lista vacía.
-    return []
+def breadthFirstSearch(problem: SearchProblem):
+    """
+    Search the shallowest nodes in the search tree first.
+    """
+    # Cola FIFO: expande primero los nodos más cercanos al estado inicial; en
+    # BFS marcamos visitado al encolar para no duplicar estados en la cola.
+    return bestFirstSearch(problem, frontier=utils.Queue, duplicates=GENERATED)
 
 
-def uniformCostSearch(problem: SearchProblem):
+def uniformCostSearch(problem: SearchProblem, frontier=utils.PriorityQueue):
     """
     Search the node of least total cost first.
+
+    frontier: priority queue class for the open list, e.g. utils.BucketQueue
+    or utils.RadixHeap for integer terrain costs, or utils.IndexedPriorityQueue
+    to lower the cost of queued states in place (decrease-key) instead of
+    pushing duplicates.
     """
 
     # =====================================================================
@@ -154,44 +287,19 @@ def uniformCostSearch(problem: SearchProblem):
     # =====================================================================
 
     # VERSION FINAL
-
-    inicio = problem.getStartState()
-
-    # chequeo edge case: si ya estamos en la meta no nos movemos
-    if problem.isGoalState(inicio):
-        return []
-
-    # cola de prioridad, la prioridad es el costo acumulado
-    cola = utils.PriorityQueue()
-    cola.push((inicio, [], 0), 0)
-
-    # en vez de un set usamos diccionario para guardar el mejor costo a cada nodo
-    mejor_costo = {inicio: 0}
-
-    while not cola.isEmpty():
-        nodo, acciones, costo = cola.pop()
-
-        # si ya hay un camino mas barato a este nodo, lo saltamos
-        if costo > mejor_costo.get(nodo, float("inf")):
-            continue
-
-        if problem.isGoalState(nodo):
-            return acciones
-
-        for siguiente, accion, paso in problem.getSuccessors(nodo):
-            nuevo_costo = costo + paso
-
-            # solo lo metemos si es mejor que lo que ya teniamos
-            if nuevo_costo < mejor_costo.get(siguiente, float("inf")):
-                mejor_costo[siguiente] = nuevo_costo
-                cola.push((siguiente, acciones + [accion], nuevo_costo), nuevo_costo)
-
-    return []
+    # el ciclo vive en bestFirstSearch: prioridad = costo acumulado, y un
+    # estado solo se vuelve a meter si llega con un costo mejor
+    return bestFirstSearch(problem, frontier=frontier, hWeight=0, duplicates=CHEAPER)
 
 
-def aStarSearch(problem: SearchProblem, heuristic=nullHeuristic):
+def aStarSearch(problem: SearchProblem, heuristic=nullHeuristic, frontier=utils.PriorityQueue):
     """
     Search the node that has the lowest combined cost and heuristic first.
+
+    frontier: priority queue class for the open list, e.g. utils.BucketQueue
+    or utils.RadixHeap when both costs and heuristic are integers, or
+    utils.IndexedPriorityQueue to lower the f of queued states in place
+    (decrease-key) instead of pushing duplicates.
     """
 
       # =====================================================================
@@ -250,49 +358,2181 @@ def aStarSearch(problem: SearchProblem, heuristic=nullHeuristic):
     # =====================================================================
 
     # VERSION FINAL
+    # el ciclo vive en bestFirstSearch: prioridad = g(n) + h(n), y un estado
+    # solo se vuelve a meter si llega con un costo mejor
+    return bestFirstSearch(problem, heuristic, frontier, duplicates=CHEAPER)
+
+
+def weightedAStarSearch(
+    problem: SearchProblem, heuristic=nullHeuristic, weight=2, frontier=utils.PriorityQueue
+):
+    """
+    A* with an inflated heuristic, f(n) = g(n) + weight * h(n). With an
+    admissible heuristic the plan costs at most weight times the optimum.
+    """
+    return bestFirstSearch(problem, heuristic, frontier, hWeight=weight, duplicates=CHEAPER)
+
+
+def branchAndBoundAStarSearch(problem: SearchProblem, heuristic=nullHeuristic, frontier=utils.PriorityQueue):
+    """
+    A* that first builds a cheap plan and uses its cost as an upper bound:
+    nodes whose g(n) + h(n) reach it are never queued, and it drops every
+    time a cheaper goal is generated. With an admissible heuristic no node
+    of a cheaper plan is ever cut, so the plan is still optimal, with a
+    smaller frontier.
+
+    The first plan comes from nearestSurvivorSearch for MultiSurvivorProblem
+    and from greedySearch with the same heuristic otherwise. Nodes cut are
+    counted in problem._pruned.
+    """
+    if isinstance(problem, MultiSurvivorProblem):
+        incumbente = nearestSurvivorSearch(problem)
+    else:
+        incumbente = greedySearch(problem, heuristic)
+    if isinstance(incumbente, utils.SearchResult):
+        # El presupuesto se acabo buscando el primer plan
+        return incumbente
+    cota = problem.getCostOfActions(incumbente) if incumbente else None
+    return bestFirstSearch(
+        problem, heuristic, frontier, duplicates=CHEAPER, upperBound=cota, incumbent=incumbente
+    )
+
+
+# Weight schedule of anytimeRepairingAStarSearch
+ARA_INITIAL_WEIGHT = 3.0
+ARA_WEIGHT_STEP = 0.5
+
+
+def anytimeRepairingAStarSearch(
+    problem: SearchProblem,
+    heuristic=nullHeuristic,
+    timeBudget=None,
+    initialWeight=ARA_INITIAL_WEIGHT,
+    weightStep=ARA_WEIGHT_STEP,
+):
+    """
+    Anytime Repairing A* (ARA*). Runs weighted A* with weight initialWeight
+    and then lowers the weight by weightStep until it reaches 1, reusing the
+    costs found so far: each new pass only re-expands the states whose cost
+    improved (kept in an INCONS list) instead of starting from scratch.
+
+    timeBudget: seconds. When it runs out, the best plan found so far is
+    returned; before the first plan, a SearchResult with status TIME, the
+    path to the next node to expand and a lower bound on the optimal cost.
+    None runs until the weight is 1, so the plan is optimal if h is
+    consistent.
+
+    Sets problem._iterations and problem._weight, the proven suboptimality
+    bound of the returned plan (cost <= _weight * optimal cost).
+    """
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
+    Node = utils.SearchNode
+    infinito = float("inf")
+    limite = None if timeBudget is None else time.perf_counter() + timeBudget
+
+    # Los conjuntos guardan nodos (no estados) para no calcular el hash del
+    # estado en cada consulta; solo el mejor nodo de cada estado esta vigente
+    inicio = problem.getStartState()
+    raiz = Node(inicio)
+    mejores = {inicio: raiz}  # estado -> nodo con el menor g conocido
+    hNodo = {raiz: heuristic(inicio, problem)}
+    meta = None  # mejor nodo meta encontrado
+    peso = initialWeight
+    abiertos = {raiz}  # OPEN
+    inconsistentes = set()  # INCONS: mejorados despues de cerrarse
+    iteracion = 0
+    sinTiempo = False
+
+    try:
+        while True:
+            iteracion += 1
+            cerrados = set()
+            frontera = utils.PriorityQueue()
+            for nodo in abiertos:
+                frontera.push(nodo, nodo.cost + peso * hNodo[nodo])
+
+            # ImprovePath: A* con peso hasta que ningun nodo abierto pueda
+            # mejorar la meta actual
+            while not frontera.isEmpty():
+                if meta is not None and meta.cost <= frontera.peekPriority():
+                    break
+                if limite is not None and time.perf_counter() >= limite:
+                    if meta is None:
+                        # Sin ningun plan: se detiene como con un presupuesto,
+                        # con el camino al nodo que seguia
+                        nodo = frontera.pop()
+                        raise utils.BudgetExceeded(utils.SearchResult.TIME)
+                    sinTiempo = True
+                    break
+                nodo = frontera.pop()
+                if nodo not in abiertos:
+                    continue
+                abiertos.remove(nodo)
+                cerrados.add(nodo)
+
+                if isGoalState(nodo.state):
+                    if meta is None or nodo.cost < meta.cost:
+                        meta = nodo
+                    continue
+
+                for sucesor, accion, paso in getSuccessors(nodo.state):
+                    nuevoCosto = nodo.cost + paso
+                    anterior = mejores.get(sucesor)
+                    if anterior is None:
+                        h = heuristic(sucesor, problem)
+                    elif nuevoCosto >= anterior.cost:
+                        continue
+                    else:
+                        h = hNodo.pop(anterior)
+                    hijo = mejores[sucesor] = Node(sucesor, nodo, accion, nuevoCosto)
+                    hNodo[hijo] = h
+                    inconsistentes.discard(anterior)
+                    if anterior in cerrados:
+                        inconsistentes.add(hijo)
+                    else:
+                        abiertos.discard(anterior)
+                        abiertos.add(hijo)
+                        frontera.push(hijo, nuevoCosto + peso * h)
+
+            if meta is None:
+                problem._iterations, problem._weight = iteracion, infinito
+                return []
+
+            # Cota demostrada: costo de la meta / menor g + h de lo pendiente
+            pendientes = abiertos | inconsistentes
+            # la meta misma sigue siendo candidata, asi la cota nunca baja de 1
+            cota = min((nodo.cost + hNodo[nodo] for nodo in pendientes), default=meta.cost)
+            cota = min(cota, meta.cost)
+            problem._iterations = iteracion
+            problem._weight = min(peso, meta.cost / cota) if cota > 0 else peso
+
+            if peso <= 1 or sinTiempo:
+                return meta.getPath()
+            if limite is not None and time.perf_counter() >= limite:
+                return meta.getPath()
+
+            peso = max(1, peso - weightStep)
+            abiertos = pendientes
+            inconsistentes = set()
+    except utils.BudgetExceeded as agotado:
+        # nodo es el que se estaba expandiendo; su g + h tambien cuenta
+        pendientes = abiertos | inconsistentes | {nodo}
+        cota = min(n.cost + hNodo[n] for n in pendientes)
+        problem._iterations = iteracion
+        if meta is None:
+            return _stoppedResult(problem, agotado, nodo.getPath(), cota)
+        cota = min(cota, meta.cost)
+        problem._weight = min(peso, meta.cost / cota) if cota > 0 else peso
+        return _stoppedResult(problem, agotado, meta.getPath(), cota, completo=True)
+
+
+def _topeVivo(monticulo, muertos):
+    """
+    Drops the entries of expanded or outdated nodes (the node is the last
+    field of every entry) from the top of a heap and returns the first live
+    entry, or None if there is none.
+    """
+    while monticulo and monticulo[0][-1] in muertos:
+        heapq.heappop(monticulo)
+    return monticulo[0] if monticulo else None
+
+
+def _provenBound(costo, fMin, weight):
+    """
+    Suboptimality bound proven when a plan of cost costo is returned while
+    the lowest f = g + h (admissible h) among the open nodes is fMin.
+    """
+    if fMin <= 0:
+        return 1 if costo == 0 else weight
+    return min(weight, costo / fMin)
+
+
+def focalSearch(
+    problem: SearchProblem,
+    heuristic=nullHeuristic,
+    weight=2,
+    distanceHeuristic=greedyTourHeuristic,
+):
+    """
+    Focal search (A*_epsilon). The open list is ordered by f = g + h with
+    an admissible h, and FOCAL holds the open nodes with f <= weight * fMin.
+    The node expanded is the one in FOCAL that looks closest to the goal
+    according to distanceHeuristic (which may be inadmissible), so the
+    returned plan costs at most weight times the optimal one.
+
+    Sets problem._weight to the proven suboptimality bound.
+    """
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
+    Node = utils.SearchNode
+    contador = itertools.count()
+
+    abiertos = []  # (f, n, nodo)
+    pendientes = []  # (f, n, d, nodo): abiertos que aun no estan en FOCAL
+    focal = []  # (d, f, n, nodo)
+    muertos = set()  # nodos expandidos o reemplazados por un camino mas barato
+
+    def agregar(nodo):
+        f = nodo.cost + heuristic(nodo.state, problem)
+        n = next(contador)
+        heapq.heappush(abiertos, (f, n, nodo))
+        heapq.heappush(pendientes, (f, n, distanceHeuristic(nodo.state, problem), nodo))
+
+    inicio = problem.getStartState()
+    raiz = Node(inicio)
+    mejores = {inicio: raiz}
+    agregar(raiz)
+
+    try:
+        while True:
+            tope = _topeVivo(abiertos, muertos)
+            if tope is None:
+                return []
+            fMin = tope[0]
+            cota = weight * fMin
+
+            # FOCAL crece a medida que sube fMin
+            while pendientes and pendientes[0][0] <= cota:
+                f, n, d, nodo = heapq.heappop(pendientes)
+                heapq.heappush(focal, (d, f, n, nodo))
+
+            while True:
+                d, f, n, nodo = heapq.heappop(focal)
+                if nodo in muertos:
+                    continue
+                if f > cota:
+                    # fMin bajo (h inconsistente): vuelve a esperar fuera de FOCAL
+                    heapq.heappush(pendientes, (f, n, d, nodo))
+                    continue
+                break
+            muertos.add(nodo)
+
+            if isGoalState(nodo.state):
+                problem._weight = _provenBound(nodo.cost, fMin, weight)
+                return nodo.getPath()
+
+            for sucesor, accion, paso in getSuccessors(nodo.state):
+                nuevoCosto = nodo.cost + paso
+                anterior = mejores.get(sucesor)
+                if anterior is not None:
+                    if nuevoCosto >= anterior.cost:
+                        continue
+                    muertos.add(anterior)
+                hijo = mejores[sucesor] = Node(sucesor, nodo, accion, nuevoCosto)
+                agregar(hijo)
+    except utils.BudgetExceeded as agotado:
+        # nodo es el que se estaba expandiendo
+        return _stoppedResult(problem, agotado, nodo.getPath(), fMin)
+
+
+def explicitEstimationSearch(
+    problem: SearchProblem,
+    heuristic=nullHeuristic,
+    weight=2,
+    distanceHeuristic=greedyTourHeuristic,
+    costHeuristic=greedyTourHeuristic,
+):
+    """
+    Explicit Estimation Search (EES). Besides f = g + h with the admissible
+    heuristic, every node gets an inadmissible cost estimate
+    fHat = g + max(h, costHeuristic) and a distance-to-go estimate d from
+    distanceHeuristic. FOCAL holds the nodes with fHat <= weight * fHatMin;
+    each step expands, in order of preference:
+
+    1. the node of FOCAL with the smallest d, if its fHat <= weight * fMin
+    2. the node with the smallest fHat, if fHat <= weight * fMin
+    3. the node with the smallest f
 
+    so the returned plan costs at most weight times the optimal one.
+
+    Sets problem._weight to the proven suboptimality bound.
+    """
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
+    Node = utils.SearchNode
+    contador = itertools.count()
+
+    abiertos = []  # (f, n, nodo)
+    abiertosHat = []  # (fHat, n, nodo)
+    pendientes = []  # (fHat, n, d, nodo): abiertos que aun no estan en FOCAL
+    focal = []  # (d, fHat, n, nodo)
+    muertos = set()
+
+    def agregar(nodo):
+        h = heuristic(nodo.state, problem)
+        fHat = nodo.cost + max(h, costHeuristic(nodo.state, problem))
+        n = next(contador)
+        heapq.heappush(abiertos, (nodo.cost + h, n, nodo))
+        heapq.heappush(abiertosHat, (fHat, n, nodo))
+        heapq.heappush(pendientes, (fHat, n, distanceHeuristic(nodo.state, problem), nodo))
 
-    # Se pone el estado inicial
     inicio = problem.getStartState()
+    raiz = Node(inicio)
+    mejores = {inicio: raiz}
+    agregar(raiz)
+
+    try:
+        while True:
+            tope = _topeVivo(abiertos, muertos)
+            if tope is None:
+                return []
+            fMin = tope[0]
+            fHatMin = _topeVivo(abiertosHat, muertos)[0]
+            cota = weight * fHatMin
+
+            while pendientes and pendientes[0][0] <= cota:
+                fHat, n, d, nodo = heapq.heappop(pendientes)
+                heapq.heappush(focal, (d, fHat, n, nodo))
+            while True:
+                mejorD = _topeVivo(focal, muertos)
+                if mejorD[1] <= cota:
+                    break
+                d, fHat, n, nodo = heapq.heappop(focal)
+                heapq.heappush(pendientes, (fHat, n, d, nodo))
+
+            if mejorD[1] <= weight * fMin:
+                nodo = mejorD[-1]
+            elif fHatMin <= weight * fMin:
+                nodo = abiertosHat[0][-1]
+            else:
+                nodo = tope[-1]
+            muertos.add(nodo)
+
+            if isGoalState(nodo.state):
+                problem._weight = _provenBound(nodo.cost, fMin, weight)
+                return nodo.getPath()
+
+            for sucesor, accion, paso in getSuccessors(nodo.state):
+                nuevoCosto = nodo.cost + paso
+                anterior = mejores.get(sucesor)
+                if anterior is not None:
+                    if nuevoCosto >= anterior.cost:
+                        continue
+                    muertos.add(anterior)
+                hijo = mejores[sucesor] = Node(sucesor, nodo, accion, nuevoCosto)
+                agregar(hijo)
+    except utils.BudgetExceeded as agotado:
+        return _stoppedResult(problem, agotado, nodo.getPath(), fMin)
+
+
+def greedySearch(problem: SearchProblem, heuristic=nullHeuristic, frontier=utils.PriorityQueue):
+    """
+    Search the node with the lowest heuristic value first (ignores g(n)).
+    """
+    return bestFirstSearch(problem, heuristic, frontier, gWeight=0, duplicates=CHEAPER)
+
+
+def bidirectionalSearch(problem: SearchProblem, heuristic=None):
+    """
+    Bidirectional UCS / A* for problems with a single known goal whose
+    moves are reversible (SimpleSurvivorProblem): one search runs forward
+    from the start and one backward from problem.goal through
+    problem.getPredecessors, and both stop once they prove that the
+    cheapest meeting point found so far (mu) can't be improved.
+
+    Terrain costs are asymmetric (a move costs the entered cell), so the
+    backward search charges a move x -> y the cost of y, and a meeting at
+    x costs gF(x) + gB(x) with no cell counted twice.
+
+    heuristic: h(n) towards the goal, assumed consistent. Both sides use
+    the average potential p(n) = (hF(n) - hB(n)) / 2, where hB(n) is h
+    towards the start (measured on a copy of the problem whose goal is the
+    start, plus cost(n) - cost(start) because the cost of a move is the one
+    of the cell it enters): the forward side orders by gF + p and the
+    backward side by gB - p. That keeps both consistent, so the search
+    stops, as bidirectional Dijkstra does, when topF + topB >= mu. Each
+    step expands the side with fewer open nodes.
+    """
+    inicio = problem.getStartState()
+    meta = problem.goal
+    if inicio == meta:
+        return []
+
+    Node = utils.SearchNode
+    infinito = float("inf")
+
+    if heuristic is None:
+        potencial = lambda estado: 0
+    else:
+        # h hacia el inicio: el mismo problema con el inicio como meta
+        reverso = copy.copy(problem)
+        reverso.goal, reverso.heuristicInfo = inicio, {}
+        costoInicio = problem.costFn(inicio)
+
+        def potencial(estado):
+            hB = heuristic(estado, reverso) + problem.costFn(estado) - costoInicio
+            return (heuristic(estado, problem) - hB) / 2
+
+    adelante, atras = utils.PriorityQueue(), utils.PriorityQueue()
+    adelante.push(Node(inicio), potencial(inicio))
+    atras.push(Node(meta), -potencial(meta))
 
-    # Caso donde ya estoy en la meta
-    if problem.isGoalState(inicio):
+    # Mejor costo y mejor nodo conocidos en cada direccion
+    costoF, costoB = {inicio: 0}, {meta: 0}
+    nodosF, nodosB = {inicio: Node(inicio)}, {meta: Node(meta)}
+
+    mu = infinito
+    encuentro = None
+    ultimoF = None  # ultimo nodo expandido hacia adelante
+    topF = topB = 0
+
+    try:
+        while not adelante.isEmpty() and not atras.isEmpty():
+            # Todo camino que falta cuesta al menos topF + topB
+            topF, topB = adelante.peekPriority(), atras.peekPriority()
+            if topF + topB >= mu:
+                break
+
+            # Se expande el lado con menos nodos abiertos (regla de Pohl)
+            haciaAdelante = len(adelante.heap) <= len(atras.heap)
+            if haciaAdelante:
+                nodo = ultimoF = adelante.pop()
+                vecinos = problem.getSuccessors
+                costos, otros, nodos, cola, signo = costoF, costoB, nodosF, adelante, 1
+            else:
+                nodo = atras.pop()
+                vecinos = problem.getPredecessors
+                costos, otros, nodos, cola, signo = costoB, costoF, nodosB, atras, -1
+
+            # entrada vieja: ya hay un camino mas barato a este estado
+            if nodo.cost > costos[nodo.state]:
+                continue
+
+            for vecino, accion, paso in vecinos(nodo.state):
+                nuevoCosto = nodo.cost + paso
+                if nuevoCosto >= costos.get(vecino, infinito):
+                    continue
+                costos[vecino] = nuevoCosto
+                hijo = Node(vecino, nodo, accion, nuevoCosto)
+                nodos[vecino] = hijo
+                cola.push(hijo, nuevoCosto + signo * potencial(vecino))
+
+                # Si el otro lado ya llego a este estado, hay un camino completo
+                if vecino in otros and nuevoCosto + otros[vecino] < mu:
+                    mu = nuevoCosto + otros[vecino]
+                    encuentro = vecino
+    except utils.BudgetExceeded as agotado:
+        # Cota inferior del optimo segun la condicion de parada
+        cota = min(mu, topF + topB)
+        if encuentro is not None:
+            camino = _bidirectionalPath(nodosF[encuentro], nodosB[encuentro])
+            return _stoppedResult(problem, agotado, camino, cota, completo=True)
+        return _stoppedResult(problem, agotado, ultimoF.getPath() if ultimoF else [], cota)
+
+    if encuentro is None:
         return []
+    return _bidirectionalPath(nodosF[encuentro], nodosB[encuentro])
+
+
+def _bidirectionalPath(nodoF, nodoB):
+    """
+    Joins the forward node and the backward node of bidirectionalSearch
+    that meet at the same state into the plan from the start to the goal.
+    """
+    # Camino hacia adelante hasta el encuentro y luego la cadena de padres del
+    # lado de atras, cuyas acciones ya van en el sentido inicio -> meta
+    camino = nodoF.getPath()
+    nodo = nodoB
+    while nodo.parent is not None:
+        camino.append(nodo.action)
+        nodo = nodo.parent
+    return camino
+
+
+def bidirectionalUniformCostSearch(problem: SearchProblem):
+    """
+    Bidirectional Dijkstra for SimpleSurvivorProblem.
+    """
+    return bidirectionalSearch(problem)
+
+
+def bidirectionalAStarSearch(problem: SearchProblem, heuristic=nullHeuristic):
+    """
+    Bidirectional A* for SimpleSurvivorProblem.
+    """
+    return bidirectionalSearch(problem, heuristic)
+
+
+def jumpPointSearch(problem: SearchProblem, heuristic=nullHeuristic):
+    """
+    Jump Point Search for SimpleSurvivorProblem, adapted to 4-connected
+    moves and terrain costs.
+
+    Paths are canonicalized "horizontal first": after a horizontal move the
+    search may continue or turn up/down, after a vertical move it only
+    continues, unless a side cell is a forced neighbor (the cell behind it
+    on that side is blocked). Jumps skip over cells with no such decision,
+    so A* only queues the jump points.
+
+    Swapping two moves of a path only keeps its cost when the cells involved
+    cost the same, so cells of a different cost count as blocked for the
+    pruning rules, and every cell next to a terrain-cost boundary (plus the
+    start and the goal) is a stop point expanded in all four directions.
+    States are (cell, direction of arrival), None for stop points.
+
+    Requires the default terrain costs (problem.compiled); with a custom
+    costFn it falls back to aStarSearch. problem._expanded counts expanded
+    jump points.
+    """
+    layout = problem.compiled
+    if layout is None:
+        return aStarSearch(problem, heuristic)
+
+    walls, costs, positions = layout.walls, layout.costs, layout.positions
+    N, S, E, W = Directions.NORTH, Directions.SOUTH, Directions.EAST, Directions.WEST
+    desplazamiento = {N: 1, S: -1, E: layout.height, W: -layout.height}
+    horizontales = (E, W)
+    todas = (N, S, E, W)
 
-    # frontera que evalua la prioridad de A* que es: g(n) + h(n)
+    inicio = layout.positionToCell(problem.getStartState())
+    meta = layout.positionToCell(problem.goal)
+
+    # Puntos de parada: celdas con un vecino de otro costo, y la meta
+    parada = [False] * len(walls)
+    for celda in range(len(walls)):
+        if not walls[celda]:
+            for vecina, _, costo in layout.getEdges(celda):
+                if costo != costs[celda]:
+                    parada[celda] = True
+                    break
+    parada[meta] = True
+
+    def forzadas(celda, direccion):
+        # Lados a los que hay que girar tras un movimiento vertical: la celda
+        # de al lado esta libre pero la de atras en ese lado esta bloqueada
+        atras = celda - desplazamiento[direccion]
+        lados = []
+        for lado in horizontales:
+            d = desplazamiento[lado]
+            if not walls[celda + d] and (walls[atras + d] or costs[atras + d] != costs[celda]):
+                lados.append(lado)
+        return lados
+
+    def hayPuntoVertical(celda, direccion):
+        paso = desplazamiento[direccion]
+        while True:
+            celda += paso
+            if walls[celda]:
+                return False
+            if parada[celda] or forzadas(celda, direccion):
+                return True
+
+    def saltar(celda, direccion):
+        # Avanza en linea recta hasta el siguiente punto de salto; devuelve
+        # (celda, pasos, costo) o None si choca con una pared
+        paso = desplazamiento[direccion]
+        pasos = costo = 0
+        while True:
+            celda += paso
+            if walls[celda]:
+                return None
+            pasos += 1
+            costo += costs[celda]
+            if parada[celda]:
+                return celda, pasos, costo
+            if direccion in horizontales:
+                if hayPuntoVertical(celda, N) or hayPuntoVertical(celda, S):
+                    return celda, pasos, costo
+            elif forzadas(celda, direccion):
+                return celda, pasos, costo
+
+    def plan(nodo):
+        # Cada accion de un nodo es un salto (direccion, pasos)
+        camino = []
+        while nodo.parent is not None:
+            direccion, pasos = nodo.action
+            camino += [direccion] * pasos
+            nodo = nodo.parent
+        camino.reverse()
+        return camino
+
+    tick = utils.budgetTick(problem)
     frontera = utils.PriorityQueue()
-    frontera.push((inicio, [], 0), heuristic(inicio, problem))
+    raiz = utils.SearchNode((inicio, None))
+    frontera.push(raiz, heuristic(positions[inicio], problem))
+    mejor_costo = {raiz.state: 0}
 
-    #Guarda el mejor costo que se puede obtener
-    mejor_costo = {inicio: 0}
+    try:
+        while not frontera.isEmpty():
+            nodo = frontera.pop()
+            celda, llegada = nodo.state
+            if nodo.cost > mejor_costo[nodo.state]:
+                continue
 
-    while not frontera.isEmpty():
-        estado, camino, costo_camino = frontera.pop()
+            if celda == meta:
+                return plan(nodo)
 
-        # En el caso de que sea peor que el mejor costo conocido no se expande
-        if costo_camino > mejor_costo.get(estado, float("inf")):
-            continue
+            tick()
+            problem._expanded += 1
+            if llegada is None:
+                direcciones = todas
+            elif llegada in horizontales:
+                direcciones = (llegada, N, S)
+            else:
+                direcciones = [llegada] + forzadas(celda, llegada)
+
+            for direccion in direcciones:
+                salto = saltar(celda, direccion)
+                if salto is None:
+                    continue
+                destino, pasos, costo = salto
+                estado = (destino, None if parada[destino] else direccion)
+                nuevo_costo = nodo.cost + costo
+                if nuevo_costo < mejor_costo.get(estado, float("inf")):
+                    mejor_costo[estado] = nuevo_costo
+                    hijo = utils.SearchNode(estado, nodo, (direccion, pasos), nuevo_costo)
+                    frontera.push(hijo, nuevo_costo + heuristic(positions[destino], problem))
+    except utils.BudgetExceeded as agotado:
+        # nodo es el punto de salto que se iba a expandir, el de menor f
+        cota = nodo.cost + heuristic(positions[celda], problem)
+        return _stoppedResult(problem, agotado, plan(nodo), cota)
+
+    return []
+
+
+class DStarLite:
+    """
+    D* Lite (Koenig and Likhachev) for SimpleSurvivorProblem: A* run
+    backwards from the goal that keeps its g-values, so when the rescuer
+    moves or cells change (walls collapse, fire spreads) only the part of
+    the search the change affects is repaired.
+
+        planner = DStarLite(problem)
+        planner.getPlan()
+        ...
+        planner.moveTo(position)
+        planner.updateCell(position, isWall, cost)
+        planner.getNextAction()
+
+    Entering a cell costs its terrain (problem.costFn), and h is the
+    Manhattan distance, admissible while no cell costs less than 1.
+    Expansions are added to problem._expanded and counted against the
+    problem's search budget, if any.
+    """
+
+    def __init__(self, problem):
+        self.problem = problem
+        self.tick = utils.budgetTick(problem)
+        self.width, self.height = problem.walls.width, problem.walls.height
+        self.walls = set(problem.walls.asList())
+        self.costs = {}  # costos cambiados durante la mision
+        self.goal = problem.goal
+        self.start = self.last = problem.getStartState()
+        self.km = 0
+        self.g = {}
+        self.rhs = {self.goal: 0}
+        self.queue = []
+        self.keys = {}  # clave vigente de cada estado en la cola
+        self._push(self.goal)
+
+    def _h(self, a, b):
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    def _cost(self, u, v):
+        """
+        Cost of the move u -> v: the terrain of v, or inf if either is a wall.
+        """
+        if u in self.walls or v in self.walls:
+            return float("inf")
+        cost = self.costs.get(v)
+        return self.problem.costFn(v) if cost is None else cost
+
+    def _neighbors(self, position):
+        x, y = position
+        for vecino in ((x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y)):
+            if 0 <= vecino[0] < self.width and 0 <= vecino[1] < self.height:
+                yield vecino
+
+    def _key(self, s):
+        infinito = float("inf")
+        valor = min(self.g.get(s, infinito), self.rhs.get(s, infinito))
+        return (valor + self._h(self.start, s) + self.km, valor)
+
+    def _push(self, s):
+        clave = self.keys[s] = self._key(s)
+        heapq.heappush(self.queue, (clave, s))
+
+    def _topKey(self):
+        # Descarta entradas viejas (la clave cambio o el estado salio)
+        while self.queue:
+            clave, s = self.queue[0]
+            if self.keys.get(s) == clave:
+                return clave
+            heapq.heappop(self.queue)
+        return (float("inf"), float("inf"))
+
+    def _updateVertex(self, u):
+        infinito = float("inf")
+        if u != self.goal:
+            self.rhs[u] = min(
+                (self._cost(u, v) + self.g.get(v, infinito) for v in self._neighbors(u)),
+                default=infinito,
+            )
+        self.keys.pop(u, None)
+        if self.g.get(u, infinito) != self.rhs.get(u, infinito):
+            self._push(u)
+
+    def computeShortestPath(self):
+        """
+        Expands inconsistent states until the start is consistent and no
+        queued state can improve it.
+        """
+        infinito = float("inf")
+        g, rhs = self.g, self.rhs
+        while self._topKey() < self._key(self.start) or rhs.get(self.start, infinito) != g.get(
+            self.start, infinito
+        ):
+            self.tick()
+            claveVieja, u = heapq.heappop(self.queue)
+            del self.keys[u]
+            self.problem._expanded += 1
+            claveNueva = self._key(u)
+            if claveVieja < claveNueva:
+                self._push(u)
+            elif g.get(u, infinito) > rhs.get(u, infinito):
+                # Sobre-consistente: el costo bajo, se propaga a los vecinos
+                g[u] = rhs[u]
+                for v in self._neighbors(u):
+                    self._updateVertex(v)
+            else:
+                # Sub-consistente: el costo subio, se recalculan u y sus vecinos
+                g[u] = infinito
+                self._updateVertex(u)
+                for v in self._neighbors(u):
+                    self._updateVertex(v)
+
+    def moveTo(self, position):
+        """
+        Moves the start of the search to the rescuer's new position.
+        """
+        self.start = position
+
+    def updateCell(self, position, isWall, cost):
+        """
+        Applies a wall or terrain change reported for a cell and queues the
+        states whose cost may have changed.
+        """
+        self.km += self._h(self.last, self.start)
+        self.last = self.start
+        if isWall:
+            self.walls.add(position)
+        else:
+            self.walls.discard(position)
+        self.costs[position] = cost
+        self._updateVertex(position)
+        for vecino in self._neighbors(position):
+            self._updateVertex(vecino)
+
+    def getNextAction(self):
+        """
+        Returns the first action of a cheapest plan from the current start,
+        or None if the goal can't be reached.
+        """
+        plan = self.getPlan(maxLength=1)
+        return plan[0] if plan else None
+
+    def getPlan(self, maxLength=None):
+        """
+        Repairs the search and returns a cheapest plan from the current
+        start to the goal ([] if there is none), following the neighbor
+        with the lowest cost + g.
+        """
+        self.computeShortestPath()
+        infinito = float("inf")
+        if self.g.get(self.start, infinito) == infinito:
+            return []
+
+        plan = []
+        s = self.start
+        limite = maxLength if maxLength is not None else self.width * self.height
+        while s != self.goal and len(plan) < limite:
+            siguiente = min(self._neighbors(s), key=lambda v: self._cost(s, v) + self.g.get(v, infinito))
+            plan.append(Actions.vectorToDirection((siguiente[0] - s[0], siguiente[1] - s[1])))
+            s = siguiente
+        return plan
+
+    def getPartialPlan(self):
+        """
+        First move of an unfinished search: towards the neighbor with the
+        lowest cost + g, or cost + Manhattan distance to the goal if the
+        search hasn't reached it yet. [] if the rescuer can't move.
+        """
+        infinito = float("inf")
+        s = self.start
+        mejor, siguiente = infinito, None
+        for v in self._neighbors(s):
+            resto = min(self.g.get(v, infinito), self.rhs.get(v, infinito))
+            estimado = self._cost(s, v) + (self._h(v, self.goal) if resto == infinito else resto)
+            if estimado < mejor:
+                mejor, siguiente = estimado, v
+        if siguiente is None:
+            return []
+        return [Actions.vectorToDirection((siguiente[0] - s[0], siguiente[1] - s[1]))]
+
+
+def dStarLiteSearch(problem: SearchProblem):
+    """
+    Plans once with DStarLite (see ReplanningAgent for the incremental use).
+    """
+    planner = DStarLite(problem)
+    try:
+        return planner.getPlan()
+    except utils.BudgetExceeded as agotado:
+        # La clave mas baja de la cola acota por debajo el costo desde el inicio
+        return _stoppedResult(problem, agotado, planner.getPartialPlan(), planner._topKey()[0])
+
+
+def contractionHierarchySearch(problem: SearchProblem):
+    """
+    Answers SimpleSurvivorProblem with the ContractionHierarchy of its
+    layout (see RescueLayout.getContractionHierarchy): the preprocessing is
+    built once per map and saved to disk, and each query only climbs the
+    hierarchy from both ends before unpacking its shortcuts into moves.
+    The cells the query settles are counted in problem._expanded.
+    """
+    hierarchy = problem.layout.getContractionHierarchy()
+    tick = utils.budgetTick(problem)
+
+    def asentar():
+        # Cada celda asentada por la consulta cuenta como una expansion
+        problem._expanded += 1
+        tick()
+
+    try:
+        actions = hierarchy.getPath(problem.getStartState(), problem.goal, asentar)
+    except utils.BudgetExceeded as agotado:
+        return _stoppedResult(problem, agotado, [])
+    return actions if actions is not None else []
+
+
+def safeIntervalPathPlanning(problem: SearchProblem, heuristic=nullHeuristic):
+    """
+    Safe Interval Path Planning (Phillips and Likhachev) for
+    SimpleSurvivorProblem on layouts with a schedule (see
+    RescueLayout.addTimedTerrain and addBlockedInterval).
+
+    Every action, Stop included, takes one timestep and costs the terrain
+    of the cell the rescuer ends up in, at that timestep. Instead of
+    (cell, timestep) pairs a state is a (cell, safe interval) pair, where a
+    safe interval is a stretch of time in which the cell is free and costs
+    the same, so the state space doesn't grow with the horizon. Neighbors
+    are entered at the earliest timestep of each of their safe intervals.
+
+    Since waiting costs the terrain of the cell, a node also keeps its wait
+    profile: the cells behind it where the rescuer could have waited
+    instead, at what cost per step and for how long without leaving their
+    safe intervals. Forced waits go to the cheapest of them, which keeps
+    the plan optimal. An arrival at a state is skipped when an earlier one
+    reaches every later timestep for no more cost.
+
+    The heuristic must be admissible for the cheapest terrain (1 per step),
+    as manhattanHeuristic is.
+    """
+    layout = problem.layout
+    compiled = layout.compile()
+    positions = compiled.positions
+    intervalos = {}
+    hCache = {}
+
+    def seguros(celda):
+        lista = intervalos.get(celda)
+        if lista is None:
+            lista = intervalos[celda] = layout.getSafeIntervals(positions[celda])
+        return lista
+
+    def h(celda):
+        valor = hCache.get(celda)
+        if valor is None:
+            valor = hCache[celda] = heuristic(positions[celda], problem)
+        return valor
+
+    celdaInicio = compiled.positionToCell(problem.getStartState())
+    indice = next((i for i, (a, b, _) in enumerate(seguros(celdaInicio)) if a <= 0 < b), None)
+    if indice is None:
+        return []
+
+    # Nodo: (celda, intervalo, llegada, g, perfil, padre, accion, esperas
+    # repartidas entre los nodos anteriores al crearlo)
+    contador = itertools.count()
+    raiz = (celdaInicio, indice, 0, 0, [], None, None, [])
+    frontera = [(h(celdaInicio), 0, next(contador), raiz)]
+    expandidos = {}  # (celda, intervalo) -> [(llegada, g, perfil)] ya expandidos
+
+    def agregar(celda, j, llegada, g, perfil, padre, accion, esperas):
+        nodo = (celda, j, llegada, g, perfil, padre, accion, esperas)
+        heapq.heappush(frontera, (g + h(celda), llegada, next(contador), nodo))
 
-        # si es la meta se retorna el camino
-        if problem.isGoalState(estado):
-            return camino
+    tick = utils.budgetTick(problem)
 
-        # expanden los sucesores
-        for sucesor, accion, costo_paso in problem.getSuccessors(estado):
-            nuevo_costo = costo_camino + costo_paso
+    try:
+        while frontera:
+            _, _, _, nodo = heapq.heappop(frontera)
+            celda, i, llegada, g, perfil = nodo[:5]
+            intervalosCelda = seguros(celda)
+            _, finI, costoI = intervalosCelda[i]
 
-            # se actualiza si se encuentra un camino mejor
-            if nuevo_costo < mejor_costo.get(sucesor, float("inf")):
-                mejor_costo[sucesor] = nuevo_costo
-                prioridad = nuevo_costo + heuristic(sucesor, problem)
-                frontera.push((sucesor, camino + [accion], nuevo_costo), prioridad)
+            # Esperas posibles desde aqui: las de atras mas esperar en esta celda,
+            # sin salir en finI o despues
+            limite = finI - 1 - llegada
+            perfil = _recortarEsperas(_agregarEspera(perfil, costoI, limite, nodo), limite)
 
-    # En tal caso de que no se encuentre solución, se retorna una lista vacía
+            previos = expandidos.setdefault((celda, i), [])
+            if any(_dominaLlegada(otro, (llegada, g, perfil)) for otro in previos):
+                continue
+            previos.append((llegada, g, perfil))
+
+            if problem.isGoalState(positions[celda]):
+                return _sippPlan(nodo)
+            tick()
+            problem._expanded += 1
+
+            for vecino, accion, _ in compiled.getEdges(celda):
+                for j, (inicioJ, finJ, costoJ) in enumerate(seguros(vecino)):
+                    if finJ <= llegada + 1:
+                        continue
+                    # Se sale en t - 1, que debe seguir dentro del intervalo actual
+                    t = max(llegada + 1, inicioJ)
+                    if t > finI:
+                        break
+                    costo, esperas, resto = _repartirEspera(perfil, t - 1 - llegada)
+                    resto = _recortarEsperas(resto, finJ - 1 - t)
+                    agregar(vecino, j, t, g + costo + costoJ, resto, nodo, accion, esperas)
+
+            # Quedarse hasta que cambie el costo de la celda
+            if i + 1 < len(intervalosCelda) and intervalosCelda[i + 1][0] == finI:
+                costo, esperas, _ = _repartirEspera(perfil, finI - 1 - llegada)
+                costo += g + intervalosCelda[i + 1][2]
+                agregar(celda, i + 1, finI, costo, [], nodo, Directions.STOP, esperas)
+    except utils.BudgetExceeded as agotado:
+        # nodo es el que se iba a expandir, el de menor g + h
+        return _stoppedResult(problem, agotado, _sippPlan(nodo), g + h(celda))
+
+    return []
+
+
+def _agregarEspera(perfil, costo, largo, nodo):
+    """
+    Adds the option of waiting up to largo steps at nodo, for costo each,
+    to a wait profile: a list of (cost per step, steps, node) sorted by cost.
+    """
+    if largo <= 0:
+        return perfil
+    for k, segmento in enumerate(perfil):
+        if segmento[0] > costo:
+            return perfil[:k] + [(costo, largo, nodo)] + (perfil[k:] if largo != INFINITY else [])
+    if perfil and perfil[-1][1] == INFINITY:
+        return perfil
+    return perfil + [(costo, largo, nodo)]
+
+
+def _recortarEsperas(perfil, total):
+    """
+    Keeps the cheapest total steps of a wait profile.
+    """
+    recortado = []
+    for costo, largo, nodo in perfil:
+        if total <= 0:
+            break
+        recortado.append((costo, min(largo, total), nodo))
+        if largo == INFINITY:
+            break
+        total -= largo
+    return recortado
+
+
+def _repartirEspera(perfil, pasos):
+    """
+    Places pasos waiting steps on the cheapest segments of a wait profile.
+    Returns their cost, the (node, steps) waits and the profile left.
+    """
+    costo, esperas, resto = 0, [], []
+    for costoPaso, largo, nodo in perfil:
+        if pasos > 0:
+            usados = min(largo, pasos)
+            costo += costoPaso * usados
+            esperas.append((nodo, usados))
+            pasos -= usados
+            largo -= usados
+        if largo > 0:
+            resto.append((costoPaso, largo, nodo))
+    return costo, esperas, resto
+
+
+def _costoEspera(perfil, pasos):
+    """
+    Cost of waiting pasos steps with a wait profile (inf if it can't).
+    """
+    costo = 0
+    for costoPaso, largo, _ in perfil:
+        if pasos <= 0:
+            break
+        usados = min(largo, pasos)
+        costo += costoPaso * usados
+        pasos -= usados
+    return costo if pasos <= 0 else INFINITY
+
+
+def _dominaLlegada(a, b):
+    """
+    True if arrival a = (time, g, wait profile) reaches every timestep b
+    reaches for no more cost.
+    """
+    llegadaA, gA, perfilA = a
+    llegadaB, gB, perfilB = b
+    if llegadaA > llegadaB:
+        return False
+
+    # Ambas funciones son lineales por tramos; basta comparar en los quiebres
+    puntos = {llegadaB}
+    for llegada, perfil in ((llegadaA, perfilA), (llegadaB, perfilB)):
+        t = llegada
+        for _, largo, _ in perfil:
+            if largo == INFINITY:
+                break
+            t += largo
+            if t > llegadaB:
+                puntos.add(t)
+    return all(
+        gA + _costoEspera(perfilA, t - llegadaA) <= gB + _costoEspera(perfilB, t - llegadaB)
+        for t in puntos
+    )
+
+
+def _sippPlan(nodo):
+    """
+    Rebuilds the actions of a safeIntervalPathPlanning node, with the waits
+    placed where the search decided.
+    """
+    camino = []
+    while nodo is not None:
+        camino.append(nodo)
+        nodo = nodo[5]
+    camino.reverse()
+
+    esperas = {}
+    for nodo in camino:
+        for donde, pasos in nodo[7]:
+            esperas[id(donde)] = esperas.get(id(donde), 0) + pasos
+
+    plan = []
+    for anterior, nodo in zip(camino, camino[1:]):
+        plan += [Directions.STOP] * esperas.get(id(anterior), 0)
+        plan.append(nodo[6])
+    return plan
+
+
+# Default number of states kept in the transposition table / cache of the
+# memory-bounded searches
+SEARCH_CACHE_SIZE = 100000
+
+
+def iterativeDeepeningAStarSearch(
+    problem: SearchProblem, heuristic=nullHeuristic, cacheSize=SEARCH_CACHE_SIZE
+):
+    """
+    IDA*: repeated depth-first searches bounded by f(n) = g(n) + h(n), each
+    one with the bound raised to the lowest f that exceeded the previous
+    one. Only the current path (and its pending successors) is kept, so
+    memory grows with the solution depth, plus a transposition table of at
+    most cacheSize states. The table keeps the best g of each state over
+    all iterations and prunes a state reached at a higher g (in any
+    iteration) or at the same g (in the same iteration), so every iteration
+    expands each state it remembers at most once, along its cheapest path.
+
+    Sets problem._iterations and problem._reexpanded (expansions of states
+    expanded before, as far as the table remembers them).
+    """
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
+    infinito = float("inf")
+
+    inicio = problem.getStartState()
+    limite = heuristic(inicio, problem)
+    tabla = {}  # estado -> [mejor g, iteracion en la que se vio]
+    iteracion = reexpandidos = 0
+
+    try:
+        while limite < infinito:
+            iteracion += 1
+            siguiente = infinito
+
+            # Cada nivel de la pila: [estado, g, sucesores, proximo sucesor]
+            pila = [[inicio, 0, None, 0]]
+            acciones = []
+            enCamino = {inicio}
+
+            while pila:
+                nivel = pila[-1]
+                estado, g, sucesores, i = nivel
+
+                if sucesores is None:
+                    f = g + heuristic(estado, problem)
+                    entrada = tabla.get(estado)
+                    # Se poda lo ya alcanzado con menor g en cualquier iteracion,
+                    # o con el mismo g en esta
+                    podar = f > limite or (
+                        entrada is not None
+                        and (entrada[0] < g or (entrada[0] == g and entrada[1] == iteracion))
+                    )
+                    if f > limite and f < siguiente:
+                        siguiente = f
+                    if not podar and isGoalState(estado):
+                        problem._iterations, problem._reexpanded = iteracion, reexpandidos
+                        return acciones
+                    if podar:
+                        pila.pop()
+                        enCamino.discard(estado)
+                        if acciones:
+                            acciones.pop()
+                        continue
+
+                    if entrada is not None:
+                        reexpandidos += 1
+                        entrada[0], entrada[1] = g, iteracion
+                    elif len(tabla) < cacheSize:
+                        tabla[estado] = [g, iteracion]
+                    sucesores = nivel[2] = getSuccessors(estado)
+
+                if i < len(sucesores):
+                    nivel[3] = i + 1
+                    sucesor, accion, paso = sucesores[i]
+                    if sucesor not in enCamino:
+                        enCamino.add(sucesor)
+                        acciones.append(accion)
+                        pila.append([sucesor, g + paso, None, 0])
+                else:
+                    pila.pop()
+                    enCamino.discard(estado)
+                    if acciones:
+                        acciones.pop()
+
+            limite = siguiente
+    except utils.BudgetExceeded as agotado:
+        # acciones lleva al nodo que se estaba expandiendo; ninguna
+        # iteracion anterior encontro un plan de costo menor que limite
+        problem._iterations, problem._reexpanded = iteracion, reexpandidos
+        return _stoppedResult(problem, agotado, list(acciones), limite)
+
+    problem._iterations, problem._reexpanded = iteracion, reexpandidos
+    return []
+
+
+def fringeSearch(problem: SearchProblem, heuristic=nullHeuristic, cacheSize=SEARCH_CACHE_SIZE):
+    """
+    Fringe Search: like IDA* it works in iterations bounded by f, but the
+    nodes left over the bound are kept in a "later" list and resumed in the
+    next iteration instead of searching again from the start. Successors
+    are visited right after their parent, depth-first.
+
+    The cache of best g per state (used to skip duplicates) holds at most
+    cacheSize states; states beyond it may be queued more than once, which
+    costs time but not optimality. Nodes keep parent pointers, so plans are
+    rebuilt without the cache.
+
+    Sets problem._iterations and problem._reexpanded.
+    """
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
+    infinito = float("inf")
+
+    inicio = problem.getStartState()
+    cache = {inicio: [0, False]}  # estado -> [mejor g, ya expandido]
+    ahora = [utils.SearchNode(inicio)]
+    limite = heuristic(inicio, problem)
+    iteracion = reexpandidos = 0
+
+    try:
+        while ahora:
+            iteracion += 1
+            despues = []
+            siguiente = infinito
+
+            while ahora:
+                nodo = ahora.pop()
+                estado = nodo.state
+                entrada = cache.get(estado)
+
+                # entrada vieja: el estado ya se alcanzo por un camino mas barato
+                if entrada is not None and nodo.cost > entrada[0]:
+                    continue
+
+                f = nodo.cost + heuristic(estado, problem)
+                if f > limite:
+                    siguiente = min(siguiente, f)
+                    despues.append(nodo)
+                    continue
+
+                if isGoalState(estado):
+                    problem._iterations, problem._reexpanded = iteracion, reexpandidos
+                    return nodo.getPath()
+
+                if entrada is not None:
+                    if entrada[1]:
+                        reexpandidos += 1
+                    entrada[1] = True
+
+                # Los hijos se meten al reves para visitarlos en orden, justo
+                # despues del padre
+                for sucesor, accion, paso in reversed(getSuccessors(estado)):
+                    nuevoCosto = nodo.cost + paso
+                    previa = cache.get(sucesor)
+                    if previa is not None:
+                        if nuevoCosto >= previa[0]:
+                            continue
+                        previa[0] = nuevoCosto
+                    elif len(cache) < cacheSize:
+                        cache[sucesor] = [nuevoCosto, False]
+                    ahora.append(utils.SearchNode(sucesor, nodo, accion, nuevoCosto))
+
+            # Los nodos que pasaron el limite se retoman en el mismo orden
+            despues.reverse()
+            ahora = despues
+            limite = siguiente
+    except utils.BudgetExceeded as agotado:
+        problem._iterations, problem._reexpanded = iteracion, reexpandidos
+        return _stoppedResult(problem, agotado, nodo.getPath(), limite)
+
+    problem._iterations, problem._reexpanded = iteracion, reexpandidos
+    return []
+
+
+# Default number of nodes smaMemoryBoundedSearch keeps in memory
+MAX_NODES = 100000
+
+
+def smaMemoryBoundedSearch(problem: SearchProblem, heuristic=nullHeuristic, maxNodes=MAX_NODES):
+    """
+    Simplified memory-bounded A* (SMA*). Works like A* on a search tree of
+    at most maxNodes nodes: when the tree is full, the worst leaf (highest
+    f, shallowest) is dropped and its f-value is backed up into its parent,
+    which goes back to the frontier to regenerate it if that subtree turns
+    out to be the best one again.
+
+    A state reached again through a path that is not cheaper than the copy
+    already in memory is not generated. The plan is optimal whenever the
+    optimal path fits in maxNodes nodes; if no solution fits, returns [].
+
+    Sets problem._reexpanded to the number of regenerations.
+    """
+    if maxNodes < 2:
+        raise ValueError("maxNodes must be at least 2")
+
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
+    infinito = float("inf")
+    contador = itertools.count()
+
+    abiertos = []  # (f, -profundidad, n, version, nodo): el mejor a expandir
+    hojas = []  # (-f, profundidad, n, version, nodo): la peor hoja a olvidar
+
+    def refrescar(nodo):
+        # Invalida las entradas viejas del nodo y lo vuelve a encolar segun
+        # su estado actual
+        nodo.version += 1
+        if not nodo.expanded:
+            heapq.heappush(abiertos, (nodo.f, -nodo.depth, next(contador), nodo.version, nodo))
+        elif nodo.forgotten:
+            fOlvidado = min(nodo.forgotten.values())
+            heapq.heappush(abiertos, (fOlvidado, -nodo.depth, next(contador), nodo.version, nodo))
+        if not nodo.children and nodo.parent is not None:
+            heapq.heappush(hojas, (-nodo.f, nodo.depth, next(contador), nodo.version, nodo))
+
+    def respaldar(nodo):
+        # El f de un nodo expandido es el menor f de sus hijos (en memoria u
+        # olvidados); los cambios suben hacia la raiz
+        while nodo is not None and nodo.expanded:
+            nuevo = min([hijo.f for hijo in nodo.children] + list(nodo.forgotten.values()) or [infinito])
+            if nuevo == nodo.f:
+                return
+            nodo.f = nuevo
+            refrescar(nodo)
+            nodo = nodo.parent
+
+    def reconstruir():
+        # Descarta las entradas invalidas para que los monticulos no crezcan
+        # mas alla del limite de memoria
+        del abiertos[:], hojas[:]
+        pendientes = [raiz]
+        while pendientes:
+            nodo = pendientes.pop()
+            refrescar(nodo)
+            pendientes.extend(nodo.children)
+
+    inicio = problem.getStartState()
+    raiz = utils.BoundedSearchNode(inicio, f=heuristic(inicio, problem))
+    enMemoria = {inicio: raiz}  # estado -> nodo mas barato en memoria
+    nodos = 1
+    regenerados = 0
+    refrescar(raiz)
+
+    try:
+        while abiertos:
+            fMejor, _, _, version, mejor = heapq.heappop(abiertos)
+            if not mejor.alive or version != mejor.version:
+                continue
+            if mejor.f == infinito:
+                break
+
+            if not mejor.expanded:
+                if isGoalState(mejor.state):
+                    problem._reexpanded = regenerados
+                    return mejor.getPath()
+                olvidados = None
+                mejor.expanded = True
+            else:
+                # Regenera solo los hijos que se habian olvidado
+                olvidados = mejor.forgotten
+                mejor.forgotten = {}
+                regenerados += 1
+
+            for sucesor, accion, paso in getSuccessors(mejor.state):
+                fPrevio = 0
+                if olvidados is not None:
+                    if sucesor not in olvidados:
+                        continue
+                    fPrevio = olvidados[sucesor]
+                nuevoCosto = mejor.cost + paso
+                otro = enMemoria.get(sucesor)
+                if otro is not None and otro.cost <= nuevoCosto:
+                    continue
+
+                hijo = utils.BoundedSearchNode(sucesor, mejor, accion, nuevoCosto)
+                if hijo.depth >= maxNodes - 1 and not isGoalState(sucesor):
+                    # El camino ya no cabe en memoria
+                    hijo.f = infinito
+                else:
+                    hijo.f = max(nuevoCosto + heuristic(sucesor, problem), mejor.f, fPrevio)
+                mejor.children.append(hijo)
+                enMemoria[sucesor] = hijo
+                nodos += 1
+                refrescar(hijo)
+
+            refrescar(mejor)
+            respaldar(mejor)
+
+            # Memoria llena: se olvida la peor hoja y su f sube al padre
+            while nodos > maxNodes and hojas:
+                _, _, _, version, peor = heapq.heappop(hojas)
+                if not peor.alive or version != peor.version or peor.children:
+                    continue
+                peor.alive = False
+                nodos -= 1
+                if enMemoria.get(peor.state) is peor:
+                    del enMemoria[peor.state]
+                padre = peor.parent
+                padre.children.remove(peor)
+                padre.forgotten[peor.state] = min(peor.f, padre.forgotten.get(peor.state, infinito))
+                refrescar(padre)
+                respaldar(padre)
+
+            if len(abiertos) + len(hojas) > 4 * maxNodes:
+                reconstruir()
+    except utils.BudgetExceeded as agotado:
+        # mejor es el nodo que se estaba expandiendo, el de menor f
+        problem._reexpanded = regenerados
+        return _stoppedResult(problem, agotado, mejor.getPath(), fMejor)
+
+    problem._reexpanded = regenerados
     return []
 
 
+# Configurations raced by portfolioSearch: (search function, heuristic or
+# None, whether its plans are optimal)
+PORTFOLIO = (
+    ("aStarSearch", "mazeSurvivorHeuristic", True),
+    ("aStarSearch", "survivorHeuristic", True),
+    ("heldKarpSearch", None, True),
+    ("explicitEstimationSearch", "mazeSurvivorHeuristic", False),
+    ("greedySearch", "greedyTourHeuristic", False),
+)
+SIMPLE_PORTFOLIO = (
+    ("aStarSearch", "mazeDistanceHeuristic", True),
+    ("bidirectionalAStarSearch", "manhattanHeuristic", True),
+    ("jumpPointSearch", "manhattanHeuristic", True),
+)
+# With a schedule only SIPP plans for the timed costs getCostOfActions uses;
+# the other searches see the static map, so their plans may cost more (or
+# cross a blocked cell)
+TIMED_PORTFOLIO = (
+    ("safeIntervalPathPlanning", "manhattanHeuristic", True),
+    ("aStarSearch", "manhattanHeuristic", False),
+)
+
+
+def portfolioSearch(problem: SearchProblem, timeBudget=None, portfolio=None, workers=None):
+    """
+    Races several search configurations in a process pool. Returns the plan
+    of the first optimal configuration that finishes. When timeBudget
+    (seconds) runs out first it returns a SearchResult: INCUMBENT with the
+    cheapest plan found so far, or TIME with no plan if none finished. The
+    remaining workers are cancelled.
+
+    portfolio: tuple of (function name, heuristic name or None, optimal);
+        by default PORTFOLIO, SIMPLE_PORTFOLIO or, on a layout with a
+        schedule, TIMED_PORTFOLIO, depending on the problem. optimal must
+        hold for the costs of problem.getCostOfActions, which also ranks
+        the plans.
+
+    Every worker rebuilds the problem from the text and the schedule of its
+    layout and its start state, so the problem must use the default
+    terrain costs. Configurations that fail or stop without a plan in a
+    worker are ignored. Of a search budget attached to the problem only the
+    time limit applies, and a plan found before it runs out is kept.
+    """
+    if isinstance(problem, SimpleSurvivorProblem) and problem.compiled is None:
+        raise ValueError("portfolioSearch needs the default terrain costs")
+    if portfolio is None:
+        if not isinstance(problem, SimpleSurvivorProblem):
+            portfolio = PORTFOLIO
+        elif problem.layout.isTimed():
+            portfolio = TIMED_PORTFOLIO
+        else:
+            portfolio = SIMPLE_PORTFOLIO
+    argumentos = _workerProblemArgs(problem)
+
+    limite = None if timeBudget is None else time.perf_counter() + timeBudget
+    # Los workers no cuentan expansiones: del presupuesto se aplica el
+    # limite de tiempo, desde este proceso
+    budget = getattr(problem, "_budget", None)
+    agotado = None
+    executor = ProcessPoolExecutor(max_workers=workers or min(len(portfolio), os.cpu_count() or 1))
+    mejor = None  # (costo, acciones, expandidos, configuracion)
+    terminado = False
+    try:
+        futuros = {
+            executor.submit(
+                _portfolioWorker,
+                type(problem),
+                _workerLayout(problem),
+                argumentos,
+                _workerStart(problem),
+                *configuracion[:2],
+            ): configuracion
+            for configuracion in portfolio
+        }
+        pendientes = set(futuros)
+        while pendientes:
+            restante = None
+            if limite is not None:
+                restante = max(0, limite - time.perf_counter())
+            if budget is not None and budget.deadline is not None:
+                hastaElLimite = max(0, budget.deadline - time.perf_counter())
+                restante = hastaElLimite if restante is None else min(restante, hastaElLimite)
+            listos, pendientes = wait(pendientes, timeout=restante, return_when=FIRST_COMPLETED)
+            if not listos:
+                # Se acabo el tiempo (timeBudget o el del presupuesto)
+                agotado = utils.BudgetExceeded(utils.SearchResult.TIME)
+                break
+
+            for futuro in listos:
+                try:
+                    resultado = futuro.result()
+                except Exception:
+                    continue
+                if resultado is None:
+                    continue
+                # El costo se mide con el problema que se devuelve
+                acciones, expandidos = resultado
+                costo = problem.getCostOfActions(acciones)
+                if mejor is None or costo < mejor[0]:
+                    mejor = (costo, acciones, expandidos, futuros[futuro])
+                if futuros[futuro][2]:
+                    terminado = True
+            if terminado:
+                break
+    finally:
+        # Cancela lo que no empezo y detiene lo que sigue corriendo. Los
+        # procesos se toman antes de shutdown, que vacia executor._processes
+        procesos = list((getattr(executor, "_processes", None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for proceso in procesos:
+            proceso.terminate()
+        for proceso in procesos:
+            proceso.join()
+
+    if mejor is None:
+        problem._expanded = 0
+        return [] if agotado is None else _stoppedResult(problem, agotado, [])
+    costo, acciones, expandidos, (funcion, heuristica, _) = mejor
+    print("Portfolio winner: %s%s" % (funcion, "" if heuristica is None else " with " + heuristica))
+    problem._expanded = expandidos
+    if agotado is not None and not terminado:
+        return _stoppedResult(problem, agotado, acciones, completo=True)
+    return acciones
+
+
+def _workerProblemArgs(problem):
+    """
+    Extra constructor arguments a worker process needs to rebuild problem
+    from its layout text.
+    """
+    if isinstance(problem, SimpleSurvivorProblem):
+        return dict(start=problem.startState, goal=problem.goal, warn=False, visualize=False)
+    return {}
+
+
+def _workerStart(problem):
+    """
+    Rescuer position and survivor positions of the start state of a
+    multi-survivor problem, which may differ from the ones in its layout
+    text when the agent plans again mid-mission. None for
+    SimpleSurvivorProblem, whose start is one of the constructor arguments.
+    """
+    if isinstance(problem, SimpleSurvivorProblem):
+        return None
+    inicio = problem.getStartState()
+    return problem.getRescuerPosition(inicio), problem.getSurvivorPositions(inicio)
+
+
+def _workerLayout(problem):
+    """
+    What a worker process needs to rebuild the layout of problem: its text
+    (kept in sync with the changes reported so far) and its schedule.
+    """
+    layout = problem.layout
+    return layout.layoutText, layout.timedTerrain, layout.blockedIntervals
+
+
+def _workerProblem(problemClass, workerLayout, problemArgs, start):
+    """
+    Rebuilds a search problem in a worker process from its layout
+    (_workerLayout), the extra constructor arguments (_workerProblemArgs)
+    and the start (_workerStart).
+    """
+    layoutText, timedTerrain, blockedIntervals = workerLayout
+    layout = RescueLayout(layoutText)
+    layout.timedTerrain, layout.blockedIntervals = timedTerrain, blockedIntervals
+    if start is not None:
+        rescatista, sobrevivientes = start
+        layout.agentPositions = [rescatista]
+        for x, y in layout.survivors.asList():
+            if (x, y) not in sobrevivientes:
+                layout.survivors[x][y] = False
+    estado = RescueState()
+    estado.initialize(layout)
+    return problemClass(estado, **problemArgs)
+
+
+def _portfolioWorker(problemClass, workerLayout, problemArgs, start, fn, heuristic):
+    """
+    Runs one portfolio configuration on a problem rebuilt from its layout.
+    Returns (actions, expanded nodes), or None if no plan was found.
+    """
+    problem = _workerProblem(problemClass, workerLayout, problemArgs, start)
+
+    funcion = globals()[fn]
+    if heuristic is None:
+        acciones = funcion(problem)
+    else:
+        acciones = funcion(problem, heuristic=getattr(heuristics, heuristic))
+
+    # Una busqueda detenida antes de terminar no cuenta como resultado
+    if isinstance(acciones, utils.SearchResult):
+        return None
+    if not acciones and not problem.isGoalState(problem.getStartState()):
+        return None
+    return acciones, getattr(problem, "_expanded", 0)
+
+
+# Nodes sent together in one message between hdaStarSearch workers
+HDA_BATCH_SIZE = 64
+
+# Messages of hdaStarSearch. To a worker:
+_HdaStart = namedtuple("_HdaStart", "")  # to worker 0, which passes the start to its owner
+_HdaNodes = namedtuple("_HdaNodes", "nodes")  # [(state, g, parent, action)]
+_HdaBound = namedtuple("_HdaBound", "cost")  # cost of a solution found
+_HdaProbe = namedtuple("_HdaProbe", "wave")  # termination probe
+_HdaStop = namedtuple("_HdaStop", "")
+# To the coordinator:
+_HdaGoal = namedtuple("_HdaGoal", "cost state")
+# Answer to a probe; top is the (f, state) of the best open node or None
+_HdaStatus = namedtuple("_HdaStatus", "wave worker sent received idle expanded top")
+_HdaParents = namedtuple("_HdaParents", "parents expanded")  # answer to stop
+
+
+def hdaStarSearch(problem: SearchProblem, heuristic=nullHeuristic, workers=None):
+    """
+    Hash-distributed parallel A* (HDA*). Every state belongs to the worker
+    process given by hash(state) % workers; each worker keeps its own open
+    and closed lists, expands its states in f order and sends the successors
+    it does not own to their owners, HDA_BATCH_SIZE at a time. Before every
+    expansion a worker reads the nodes and bounds already in its mailbox.
+
+    Workers rebuild the problem from its layout text; multi-survivor
+    problems are solved as CompactMultiSurvivorProblem, so states are
+    (cell, survivors mask) pairs that are cheap to hash and send. Every
+    solution found lowers a shared bound U, and nodes with f >= U are not
+    expanded. The search ends when every worker is idle and no message is
+    in flight, checked by two consecutive identical waves of message
+    counters, so U is then the optimal cost (h must be admissible and a
+    module-level function, so it can be sent to the workers).
+
+    A search budget attached to the problem is enforced by the coordinator,
+    with the expansions the workers report when probed.
+
+    Only worth it with several CPUs: the workers duplicate some expansions
+    and pay for process start-up and messages. On one CPU it is slower than
+    aStarSearch on CompactMultiSurvivorProblem (see tests/benchmark_hda.py).
+    """
+    workers = workers or os.cpu_count() or 1
+    problemClass = type(problem)
+    if problemClass is MultiSurvivorProblem:
+        problemClass = CompactMultiSurvivorProblem
+    argumentos = _workerProblemArgs(problem)
+    inicio = _workerStart(problem)
+
+    contexto = multiprocessing.get_context()
+    buzones = [contexto.Queue() for _ in range(workers)]
+    central = contexto.Queue()
+    procesos = [
+        contexto.Process(
+            target=_hdaWorker,
+            args=(i, buzones, central, problemClass, _workerLayout(problem), argumentos, inicio, heuristic),
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+    for proceso in procesos:
+        proceso.start()
+
+    cota, meta = float("inf"), None
+    ola, respuestas, anterior = 0, {}, None
+    # Presupuesto: el coordinador suma las expansiones que informa cada
+    # worker y mira el reloj y la memoria en cada vuelta
+    budget = getattr(problem, "_budget", None)
+    expansiones, topes = {}, {}  # worker -> expansiones, mejor (f, estado) abierto
+    agotado = None
+    try:
+        buzones[0].put(_HdaStart())
+        while True:
+            try:
+                mensaje = central.get(timeout=0.005)
+            except queue.Empty:
+                mensaje = None
+
+            if budget is not None:
+                try:
+                    if type(mensaje) is _HdaStatus:
+                        topes[mensaje.worker] = mensaje.top
+                        budget.tick(mensaje.expanded - expansiones.get(mensaje.worker, 0))
+                        expansiones[mensaje.worker] = mensaje.expanded
+                    budget.check()
+                except utils.BudgetExceeded as excedido:
+                    agotado = excedido
+                    break
+
+            if mensaje is None:
+                # Sin novedades: se lanza una ola de sondeo si no hay otra
+                if not respuestas and ola == 0 or len(respuestas) == workers:
+                    ola += 1
+                    respuestas = {}
+                    for buzon in buzones:
+                        buzon.put(_HdaProbe(ola))
+            elif type(mensaje) is _HdaGoal:
+                if mensaje.cost < cota:
+                    cota, meta = mensaje.cost, mensaje.state
+                    for buzon in buzones:
+                        buzon.put(_HdaBound(cota))
+            elif type(mensaje) is _HdaStatus and mensaje.wave == ola:
+                respuestas[mensaje.worker] = (mensaje.sent, mensaje.received, mensaje.idle)
+                if len(respuestas) == workers:
+                    # Terminado: todos ociosos, nada en transito y nada
+                    # cambio desde la ola anterior
+                    total = [sum(r[k] for r in respuestas.values()) for k in (0, 1)]
+                    if all(r[2] for r in respuestas.values()) and total[0] == total[1]:
+                        if respuestas == anterior:
+                            break
+                        anterior = dict(respuestas)
+                    else:
+                        anterior = None
+                    ola += 1
+                    respuestas = {}
+                    for buzon in buzones:
+                        buzon.put(_HdaProbe(ola))
+
+        for buzon in buzones:
+            buzon.put(_HdaStop())
+        padres, expandidos = {}, 0
+        for _ in range(workers):
+            mensaje = central.get()
+            while type(mensaje) is not _HdaParents:
+                mensaje = central.get()
+            padres.update(mensaje.parents)
+            expandidos += mensaje.expanded
+    finally:
+        for proceso in procesos:
+            proceso.join(timeout=1)
+            if proceso.is_alive():
+                proceso.terminate()
+
+    problem._expanded = expandidos
+
+    def camino(estado):
+        acciones = []
+        while estado in padres:
+            estado, accion = padres[estado]
+            acciones.append(accion)
+        acciones.reverse()
+        return acciones
+
+    if agotado is not None:
+        if meta is not None:
+            return _stoppedResult(problem, agotado, camino(meta), completo=True)
+        # Camino al nodo abierto de menor f que informaron los workers; con
+        # nodos en transito su f no acota el optimo
+        abiertos = [tope for tope in topes.values() if tope is not None]
+        if not abiertos:
+            return _stoppedResult(problem, agotado, [])
+        return _stoppedResult(problem, agotado, camino(min(abiertos, key=lambda tope: tope[0])[1]))
+    if meta is None:
+        return []
+    return camino(meta)
+
+
+def _hdaWorker(yo, buzones, central, problemClass, workerLayout, problemArgs, start, heuristic):
+    """
+    One HDA* worker: A* over the states it owns. Reports solutions and the
+    counters of node messages to the coordinator, and at the end its
+    parent pointers ({state: (parent state, action)}) and expansions.
+    """
+    problem = _workerProblem(problemClass, workerLayout, problemArgs, start)
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
+    workers = len(buzones)
+    buzon = buzones[yo]
+
+    mejorCosto = {}  # estado -> mejor g conocido
+    padres = {}
+    frontera = []  # (f, n, estado, g)
+    contador = itertools.count()
+    salida = [[] for _ in range(workers)]  # lotes por enviar a cada worker
+    cota = float("inf")
+    enviados = recibidos = 0
+
+    def relajar(sucesor, g, padre, accion):
+        if g < mejorCosto.get(sucesor, cota):
+            mejorCosto[sucesor] = g
+            if padre is not None:
+                padres[sucesor] = (padre, accion)
+            f = g + heuristic(sucesor, problem)
+            heapq.heappush(frontera, (f, next(contador), sucesor, g))
+
+    def vaciar():
+        nonlocal enviados
+        for destino, lote in enumerate(salida):
+            if lote:
+                buzones[destino].put(_HdaNodes(lote))
+                salida[destino] = []
+                enviados += 1
+
+    def tieneTrabajo():
+        while frontera:
+            f, _, s, g = frontera[0]
+            if g > mejorCosto[s]:
+                heapq.heappop(frontera)
+                continue
+            return f < cota
+        return False
+
+    while True:
+        # Mensajes: con trabajo se leen todos los que ya llegaron; sin
+        # trabajo se bloquea esperando uno
+        ocupado = tieneTrabajo()
+        while True:
+            try:
+                mensaje = buzon.get_nowait() if ocupado else buzon.get()
+            except queue.Empty:
+                break
+            tipo = type(mensaje)
+            if tipo is _HdaNodes:
+                recibidos += 1
+                for sucesor, g, padre, accion in mensaje.nodes:
+                    relajar(sucesor, g, padre, accion)
+            elif tipo is _HdaStart:
+                inicio = problem.getStartState()
+                if hash(inicio) % workers == yo:
+                    relajar(inicio, 0, None, None)
+                else:
+                    salida[hash(inicio) % workers].append((inicio, 0, None, None))
+                    vaciar()
+            elif tipo is _HdaBound:
+                cota = min(cota, mensaje.cost)
+            elif tipo is _HdaProbe:
+                vaciar()
+                ocioso = not tieneTrabajo()
+                tope = None if ocioso else (frontera[0][0], frontera[0][2])
+                expandidos = getattr(problem, "_expanded", 0)
+                central.put(_HdaStatus(mensaje.wave, yo, enviados, recibidos, ocioso, expandidos, tope))
+            elif tipo is _HdaStop:
+                central.put(_HdaParents(padres, getattr(problem, "_expanded", 0)))
+                return
+            ocupado = tieneTrabajo()
+
+        # Expande un solo nodo propio: la cota y los nodos que llegan se
+        # miran antes de cada expansion, asi no se expanden nodos con f >= U
+        # ni se adelanta a mejores nodos que ya estan en el buzon
+        if ocupado:
+            f, _, s, g = heapq.heappop(frontera)
+            if isGoalState(s):
+                if g < cota:
+                    cota = g
+                    central.put(_HdaGoal(g, s))
+            else:
+                for sucesor, accion, paso in getSuccessors(s):
+                    destino = hash(sucesor) % workers
+                    if destino == yo:
+                        relajar(sucesor, g + paso, s, accion)
+                    else:
+                        salida[destino].append((sucesor, g + paso, s, accion))
+                        if len(salida[destino]) >= HDA_BATCH_SIZE:
+                            buzones[destino].put(_HdaNodes(salida[destino]))
+                            salida[destino] = []
+                            enviados += 1
+        if not tieneTrabajo():
+            vaciar()
+
+
+# Largest number of survivors heldKarpSearch solves exactly; the DP table has
+# 2^k * k entries (16 survivors: about 0.07 s and 4 MB with NumPy, while the
+# pure-Python DP already takes 1.5 s there)
+MAX_HELD_KARP_SURVIVORS = 16
+MAX_HELD_KARP_SURVIVORS_PYTHON = 13
+
+
+def heldKarpSearch(problem: SearchProblem, maxSurvivors=MAX_HELD_KARP_SURVIVORS):
+    """
+    Exact solver for MultiSurvivorProblem (and CompactMultiSurvivorProblem).
+
+    Instead of searching cells x survivor subsets, it runs one Dijkstra from
+    the rescuer and from each survivor to build the matrix of cheapest
+    terrain-aware costs between them, solves the best visiting order with
+    the Held-Karp bitmask DP, and expands that order back into actions.
+    Walking a cheapest path may rescue other survivors on the way, which
+    never makes the plan more expensive, so its cost is the optimal one.
+
+    With more than maxSurvivors survivors (MAX_HELD_KARP_SURVIVORS_PYTHON
+    without NumPy) it raises ValueError before searching. The DP entries
+    filled are counted in problem._expanded and against the search budget
+    of the problem, if any; when that runs out the nearest-neighbor order is
+    used instead.
+    """
+    layout = problem.compiled
+    inicio = problem.getStartState()
+    origen = layout.positionToCell(problem.getRescuerPosition(inicio))
+    sobrevivientes = [layout.positionToCell(pos) for pos in problem.getSurvivorPositions(inicio)]
+    k = len(sobrevivientes)
+
+    if k == 0:
+        return []
+    if np is None:
+        maxSurvivors = min(maxSurvivors, MAX_HELD_KARP_SURVIVORS_PYTHON)
+    if k > maxSurvivors:
+        raise ValueError(
+            "heldKarpSearch solves at most %d survivors (this problem has %d); "
+            "use aStarSearch or nearestSurvivorSearch" % (maxSurvivors, k)
+        )
+
+    # distancias[i][j]: costo minimo del nodo i al sobreviviente j, donde los
+    # nodos 0..k-1 son los sobrevivientes y el nodo k es el rescatista
+    nodos = sobrevivientes + [origen]
+    distancias = []
+    for nodo in nodos:
+        arbol = layout.getShortestPathTree(nodo)[0]
+        distancias.append([arbol[destino] for destino in sobrevivientes])
+
+    # Si algun sobreviviente es inalcanzable no hay solucion
+    if float("inf") in distancias[k]:
+        return []
+
+    def plan(orden):
+        # Se expande el orden de visita en acciones primitivas
+        acciones = []
+        actual = origen
+        for j in orden:
+            acciones += layout.getPath(actual, sobrevivientes[j])
+            actual = sobrevivientes[j]
+        return acciones
+
+    budgetTick = utils.budgetTick(problem)
+
+    def tick(entradas):
+        # Las entradas de la tabla cuentan como nodos expandidos
+        problem._expanded += entradas
+        budgetTick(entradas)
+
+    try:
+        if np is not None:
+            orden = _heldKarpOrderNumpy(distancias, k, tick)
+        else:
+            orden = _heldKarpOrder(distancias, k, tick)
+    except utils.BudgetExceeded as agotado:
+        # Sin la tabla completa se usa el vecino mas cercano segun distancias
+        orden, actual = [], k
+        while len(orden) < k:
+            actual = min((j for j in range(k) if j not in orden), key=lambda j: distancias[actual][j])
+            orden.append(actual)
+        return _stoppedResult(problem, agotado, plan(orden), completo=True)
+    return plan(orden)
+
+
+def _heldKarpOrder(distancias, k, tick):
+    """
+    Held-Karp DP in pure Python. costo[mask][j] is the cheapest cost of
+    leaving the rescuer, visiting exactly the survivors in mask and ending
+    at survivor j. Returns the optimal visiting order. tick is called with
+    the number of DP entries extended from each mask.
+    """
+    infinito = float("inf")
+    completo = (1 << k) - 1
+    costo = [None] * (completo + 1)
+    for j in range(k):
+        costo[1 << j] = [infinito] * k
+        costo[1 << j][j] = distancias[k][j]
+
+    for mask in range(1, completo + 1):
+        fila = costo[mask]
+        if fila is None:
+            continue
+        tick(bin(mask).count("1"))
+        for i in range(k):
+            base = fila[i]
+            if base == infinito:
+                continue
+            desde = distancias[i]
+            for j in range(k):
+                bit = 1 << j
+                if mask & bit:
+                    continue
+                siguiente = costo[mask | bit]
+                if siguiente is None:
+                    siguiente = costo[mask | bit] = [infinito] * k
+                if base + desde[j] < siguiente[j]:
+                    siguiente[j] = base + desde[j]
+
+    return _heldKarpBacktrack(lambda mask, j: costo[mask][j], distancias, k)
+
+
+def _heldKarpOrderNumpy(distancias, k, tick):
+    """
+    Same DP as _heldKarpOrder, vectorized with NumPy one layer (number of
+    visited survivors) at a time. tick is called once per layer with the
+    number of DP entries it fills.
+    """
+    infinito = 2**30
+    tamano = 1 << k
+    dist = np.array(distancias, dtype=np.int64).astype(np.int32)
+    costo = np.full((tamano, k), infinito, dtype=np.int32)
+    bits = np.arange(k)
+    costo[1 << bits, bits] = dist[k]
+
+    mascaras = np.arange(tamano)
+    visitados = np.zeros(tamano, dtype=np.int8)
+    for j in range(k):
+        visitados += (mascaras >> j) & 1
+
+    for capa in range(2, k + 1):
+        enCapa = mascaras[visitados == capa]
+        tick(len(enCapa) * capa)
+        for j in range(k):
+            terminanEnJ = enCapa[(enCapa >> j) & 1 == 1]
+            previas = terminanEnJ ^ (1 << j)
+            costo[terminanEnJ, j] = (costo[previas] + dist[:k, j]).min(axis=1)
+
+    return _heldKarpBacktrack(lambda mask, j: int(costo[mask, j]), distancias, k)
+
+
+def _heldKarpBacktrack(costo, distancias, k):
+    """
+    Rebuilds the visiting order from a filled Held-Karp table by looking for
+    the predecessor that produced each entry.
+    """
+    mask = (1 << k) - 1
+    j = min(range(k), key=lambda j: costo(mask, j))
+    orden = [j]
+    while mask != 1 << j:
+        previa = mask ^ (1 << j)
+        objetivo = costo(mask, j)
+        for i in range(k):
+            if previa >> i & 1 and costo(previa, i) + distancias[i][j] == objetivo:
+                break
+        mask, j = previa, i
+        orden.append(j)
+    orden.reverse()
+    return orden
+
+
+# Longest run of consecutive survivors Or-opt moves at once
+OR_OPT_SEGMENT = 3
+
+
+def nearestSurvivorSearch(problem: SearchProblem, improve=True):
+    """
+    Fast, near-optimal planner for MultiSurvivorProblem (and
+    CompactMultiSurvivorProblem): it walks to the nearest survivor still to
+    be rescued by true terrain-aware cost, again and again, then improves
+    the visiting order with 2-opt and Or-opt moves (improve=False skips
+    this) and expands it into actions.
+
+    Distances come from the Dijkstra trees of the compiled layout, which
+    are cached per source cell, so each survivor's tree is built once and
+    reused by every leg and every move that needs it. Survivors rescued on
+    the way to another one are skipped.
+    """
+    layout = problem.compiled
+    inicio = problem.getStartState()
+    origen = layout.positionToCell(problem.getRescuerPosition(inicio))
+    sobrevivientes = [layout.positionToCell(pos) for pos in problem.getSurvivorPositions(inicio)]
+    indice = {celda: i for i, celda in enumerate(sobrevivientes)}
+    k = len(sobrevivientes)
+
+    # Vecino mas cercano; los que quedan en el camino se rescatan al pasar
+    tick = utils.budgetTick(problem)
+    orden = []
+    pendientes = set(range(k))
+    agotado = None
+    try:
+        actual = origen
+        while pendientes:
+            tick()
+            distancias = layout.getShortestPathTree(actual)[0]
+            j = min(pendientes, key=lambda j: (distancias[sobrevivientes[j]], j))
+            if distancias[sobrevivientes[j]] == float("inf"):
+                return []
+            for celda in _celdasDelCamino(layout, actual, sobrevivientes[j]):
+                i = indice.get(celda)
+                if i in pendientes:
+                    pendientes.discard(i)
+                    orden.append(i)
+            actual = sobrevivientes[j]
+
+        if improve and k > 2:
+            # distancias[i][j]: costo minimo del nodo i al sobreviviente j, donde
+            # los nodos 0..k-1 son los sobrevivientes y el nodo k es el rescatista
+            distancias = [
+                [arbol[destino] for destino in sobrevivientes]
+                for arbol in (layout.getShortestPathTree(nodo)[0] for nodo in sobrevivientes + [origen])
+            ]
+            costos = [layout.costs[celda] for celda in sobrevivientes]
+            mejoro = True
+            while mejoro:
+                tick(k)
+                mejoro = _twoOpt(orden, distancias, costos, k) | _orOpt(orden, distancias, k)
+    except utils.BudgetExceeded as excedido:
+        # Se sigue el orden armado hasta ahora, completo o no
+        agotado = excedido
+
+    plan = []
+    rescatados = set()
+    actual = origen
+    for j in orden:
+        if j in rescatados:
+            continue
+        for celda in _celdasDelCamino(layout, actual, sobrevivientes[j]):
+            if celda in indice:
+                rescatados.add(indice[celda])
+        plan += layout.getPath(actual, sobrevivientes[j])
+        actual = sobrevivientes[j]
+    if agotado is not None:
+        return _stoppedResult(problem, agotado, plan, completo=not pendientes)
+    return plan
+
+
+def _celdasDelCamino(layout, origen, destino):
+    """
+    Returns the cells of the cheapest path from origen to destino, in
+    order and without origen.
+    """
+    padres = layout.getShortestPathTree(origen)[1]
+    celdas = []
+    while destino != origen:
+        celdas.append(destino)
+        destino = padres[destino]
+    celdas.reverse()
+    return celdas
+
+
+def _twoOpt(orden, distancias, costos, k):
+    """
+    Applies every improving 2-opt move (reversing orden[i..j]) to the open
+    route that starts at the rescuer (node k). Returns True if any did.
+
+    Entering a cell costs its terrain, so distancias isn't symmetric, but
+    d(a, b) - d(b, a) = cost(b) - cost(a): a reversed stretch costs the
+    same plus cost(first) - cost(last), and each move is checked in O(1).
+    """
+    n = len(orden)
+    mejoro = False
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            a = orden[i - 1] if i > 0 else k
+            primero, ultimo = orden[i], orden[j]
+            delta = distancias[a][ultimo] - distancias[a][primero] + costos[primero] - costos[ultimo]
+            if j + 1 < n:
+                b = orden[j + 1]
+                delta += distancias[primero][b] - distancias[ultimo][b]
+            if delta < 0:
+                orden[i:j + 1] = orden[i:j + 1][::-1]
+                mejoro = True
+    return mejoro
+
+
+def _orOpt(orden, distancias, k):
+    """
+    Applies every improving Or-opt move (moving a run of up to
+    OR_OPT_SEGMENT survivors elsewhere in the route, in the same
+    direction). Returns True if any did.
+    """
+    mejoro = False
+    for largo in range(1, OR_OPT_SEGMENT + 1):
+        i = 0
+        while i + largo <= len(orden):
+            tramo = orden[i:i + largo]
+            resto = orden[:i] + orden[i + largo:]
+            a = orden[i - 1] if i > 0 else k
+            ahorro = distancias[a][tramo[0]]
+            if i + largo < len(orden):
+                b = orden[i + largo]
+                ahorro += distancias[tramo[-1]][b] - distancias[a][b]
+
+            # Mejor lugar para reinsertar el tramo: despues de resto[p]
+            mejor, lugar = 0, None
+            for p in range(-1, len(resto)):
+                x = resto[p] if p >= 0 else k
+                costo = distancias[x][tramo[0]] - ahorro
+                if p + 1 < len(resto):
+                    y = resto[p + 1]
+                    costo += distancias[tramo[-1]][y] - distancias[x][y]
+                if costo < mejor:
+                    mejor, lugar = costo, p
+            if lugar is not None:
+                orden[:] = resto[:lugar + 1] + tramo + resto[lugar + 1:]
+                mejoro = True
+            i += 1
+    return mejoro
+
+
 # Abbreviations (you can use them for the -f option in main.py)
 bfs = breadthFirstSearch
 dfs = depthFirstSearch
 astar = aStarSearch
 ucs = uniformCostSearch
+wastar = weightedAStarSearch
+bbastar = branchAndBoundAStarSearch
+arastar = anytimeRepairingAStarSearch
+greedy = greedySearch
+focal = focalSearch
+ees = explicitEstimationSearch
+heldkarp = heldKarpSearch
+nearest = nearestSurvivorSearch
+biucs = bidirectionalUniformCostSearch
+biastar = bidirectionalAStarSearch
+jps = jumpPointSearch
+dstar = dStarLiteSearch
+sipp = safeIntervalPathPlanning
+ch = contractionHierarchySearch
+portfolio = portfolioSearch
+hdastar = hdaStarSearch
+idastar = iterativeDeepeningAStarSearch
+fringe = fringeSearch
+smastar = smaMemoryBoundedSearch
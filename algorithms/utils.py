@@ -1,6 +1,221 @@
+import os
 import sys
+import time
 import inspect
 import heapq
+from collections import deque
+
+try:
+    import resource
+except ImportError:  # not available on Windows; memory limits are then ignored
+    resource = None
+
+
+class SearchNode:
+    """
+    A node of the search tree.
+
+    Instead of carrying the full list of actions taken so far (which costs
+    O(depth) time and memory on every push), each node stores the action that
+    produced it once, plus a back-pointer to its parent. The plan is rebuilt
+    by walking the parent chain only when a goal is found.
+    """
+
+    __slots__ = ("state", "parent", "action", "cost")
+
+    def __init__(self, state, parent=None, action=None, cost=0):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.cost = cost
+
+    def getPath(self):
+        """
+        Returns the list of actions that leads from the root to this node
+        """
+        actions = []
+        node = self
+        while node.parent is not None:
+            actions.append(node.action)
+            node = node.parent
+        actions.reverse()
+        return actions
+
+
+class BoundedSearchNode(SearchNode):
+    """
+    A node of a memory-bounded search tree (SMA*).
+
+    Besides the SearchNode fields it keeps its (backed-up) f-value, its
+    depth, the children currently in memory and the best f-value of every
+    child that was dropped to make room, so the subtree can be regenerated
+    later if it becomes promising again.
+    """
+
+    __slots__ = ("f", "depth", "children", "forgotten", "expanded", "alive", "version")
+
+    def __init__(self, state, parent=None, action=None, cost=0, f=0):
+        SearchNode.__init__(self, state, parent, action, cost)
+        self.f = f
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.children = []
+        self.forgotten = {}
+        self.expanded = False
+        self.alive = True
+        self.version = 0
+
+
+class BudgetExceeded(Exception):
+    """
+    Raised from inside a search when its SearchBudget runs out. reason is
+    one of SearchResult.EXPANSIONS, SearchResult.TIME or SearchResult.MEMORY.
+    """
+
+    def __init__(self, reason):
+        Exception.__init__(self, "search budget exceeded: " + reason)
+        self.reason = reason
+
+
+class SearchResult:
+    """
+    Outcome of a search stopped by its budget.
+
+    status: SOLVED, FAILED, the limit that was hit (EXPANSIONS, TIME,
+        MEMORY), or INCUMBENT if a limit was hit after a complete plan had
+        been found
+    actions: the plan if solved, the best complete plan found (INCUMBENT);
+        otherwise the partial plan to the most promising node reached, or
+        [] if the search can't tell
+    bound: lower bound on the optimal cost proven so far (the lowest
+        priority left in an A*/UCS frontier), or None if unknown
+    expanded: nodes expanded before stopping
+    """
+
+    SOLVED = "solved"
+    FAILED = "failed"
+    EXPANSIONS = "expansions"
+    TIME = "time"
+    MEMORY = "memory"
+    INCUMBENT = "incumbent"
+
+    def __init__(self, status, actions=None, bound=None, expanded=0):
+        self.status = status
+        self.actions = actions if actions is not None else []
+        self.bound = bound
+        self.expanded = expanded
+
+    def __repr__(self):
+        return "SearchResult(%s, %d actions, bound=%s, expanded=%d)" % (
+            self.status,
+            len(self.actions),
+            self.bound,
+            self.expanded,
+        )
+
+
+class SearchBudget:
+    """
+    Limits on the expansions, wall-clock time (seconds) and resident memory
+    (MB) of a search. None means no limit. The memory is the one the process
+    uses now (see currentMemoryMB), so it can go back under the limit when an
+    earlier search frees its memory.
+
+    attach(problem) wraps the successor functions of the problem, so every
+    search checks the budget on each expansion without any change: the
+    expansion count on every call, the clock and the memory only every
+    checkEvery expansions. Searches that don't call getSuccessors count
+    their work with tick() (see budgetTick). When a limit is hit
+    BudgetExceeded is raised.
+    """
+
+    def __init__(self, maxExpansions=None, timeLimit=None, maxMemoryMB=None, checkEvery=256):
+        self.maxExpansions = maxExpansions
+        self.timeLimit = timeLimit
+        self.maxMemoryMB = maxMemoryMB
+        self.checkEvery = checkEvery
+        self.expanded = 0
+        self.nextCheck = checkEvery
+        self.deadline = None
+
+    def attach(self, problem):
+        """
+        Starts the clock and makes problem.getSuccessors (and
+        problem.getPredecessors, if any) check the budget. The budget is
+        left in problem._budget.
+        """
+        self.expanded = 0
+        self.nextCheck = self.checkEvery
+        if self.timeLimit is not None:
+            self.deadline = time.perf_counter() + self.timeLimit
+        for name in ("getSuccessors", "getPredecessors"):
+            if hasattr(problem, name):
+                setattr(problem, name, self._wrap(getattr(problem, name)))
+        problem._budget = self
+        return problem
+
+    def _wrap(self, successors):
+        def checked(state):
+            self.tick()
+            return successors(state)
+
+        return checked
+
+    def tick(self, count=1):
+        """
+        Counts count expansions (or units of equivalent work) and raises
+        BudgetExceeded if a limit was hit.
+        """
+        self.expanded += count
+        if self.maxExpansions is not None and self.expanded > self.maxExpansions:
+            raise BudgetExceeded(SearchResult.EXPANSIONS)
+        if self.expanded >= self.nextCheck:
+            self.nextCheck = self.expanded + self.checkEvery
+            self.check()
+
+    def check(self):
+        """
+        Raises BudgetExceeded if the deadline passed or the memory limit was
+        exceeded.
+        """
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise BudgetExceeded(SearchResult.TIME)
+        if self.maxMemoryMB is not None:
+            memory = currentMemoryMB()
+            if memory is not None and memory > self.maxMemoryMB:
+                raise BudgetExceeded(SearchResult.MEMORY)
+
+
+def currentMemoryMB():
+    """
+    Returns the resident memory of this process now, in MB. Where
+    /proc/self/statm doesn't exist it falls back to the peak resident memory
+    (which never goes down), and returns None if neither is available.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    # ru_maxrss esta en KB en Linux y en bytes en macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def _noTick(count=1):
+    pass
+
+
+def budgetTick(problem):
+    """
+    Returns the tick method of the SearchBudget attached to problem, or a
+    function that does nothing if it has none. For searches that don't
+    expand states through problem.getSuccessors.
+    """
+    budget = getattr(problem, "_budget", None)
+    return budget.tick if budget is not None else _noTick
 
 
 class Stack:
@@ -33,23 +248,24 @@ class Stack:
 class Queue:
     """
     A container with a first-in-first-out (FIFO) queuing policy.
+    Backed by a deque, so both push and pop are O(1).
     """
 
     def __init__(self):
-        self.list = []
+        self.list = deque()
 
     def push(self, item):
         """
         Enqueue the 'item' into the queue
         """
-        self.list.insert(0, item)
+        self.list.append(item)
 
     def pop(self):
         """
         Dequeue the earliest enqueued item still in the queue. This
         operation removes the item from the queue.
         """
-        return self.list.pop()
+        return self.list.popleft()
 
     def isEmpty(self):
         """
@@ -79,6 +295,12 @@ class PriorityQueue:
         (_, _, item) = heapq.heappop(self.heap)
         return item
 
+    def peekPriority(self):
+        """
+        Returns the lowest priority in the queue without removing its item
+        """
+        return self.heap[0][0]
+
     def isEmpty(self):
         return len(self.heap) == 0
 
@@ -98,6 +320,254 @@ class PriorityQueue:
             self.push(item, priority)
 
 
+class IndexedPriorityQueue:
+    """
+    A binary heap that also maps every item to its position in the heap, so
+    an item's priority can be lowered in O(log n) (decrease-key) instead of
+    pushing a duplicate entry or re-heapifying.
+
+    Items are identified by their key: the state of a SearchNode, or the item
+    itself for anything else. Pushing an item whose key is already queued
+    behaves like PriorityQueue.update: the entry is replaced only if the new
+    priority is lower, or equal with a cheaper SearchNode (with f = h, as in
+    greedy search, every path to a state has the same priority). Replaced
+    entries are ordered as if freshly pushed, so ties are broken exactly as
+    with lazy deletion on a PriorityQueue.
+    """
+
+    def __init__(self):
+        self.heap = []  # Entries are [priority, count, item]
+        self.position = {}  # key -> index of its entry in self.heap
+        self.count = 0
+
+    @staticmethod
+    def keyOf(item):
+        return item.state if isinstance(item, SearchNode) else item
+
+    def push(self, item, priority):
+        key = self.keyOf(item)
+        index = self.position.get(key)
+        if index is None:
+            self.heap.append([priority, self.count, item])
+            self.count += 1
+            self._siftUp(len(self.heap) - 1)
+        else:
+            self.decreaseKey(item, priority)
+
+    def update(self, item, priority):
+        self.push(item, priority)
+
+    def decreaseKey(self, item, priority):
+        """
+        Lowers the priority of a queued item (and replaces it with 'item').
+        Does nothing if the queued priority is already lower, or equal and
+        'item' is not a cheaper SearchNode than the queued one.
+        """
+        index = self.position[self.keyOf(item)]
+        entry = self.heap[index]
+        if entry[0] < priority:
+            return
+        if entry[0] == priority and not (
+            isinstance(item, SearchNode) and item.cost < entry[2].cost
+        ):
+            return
+        entry[0] = priority
+        entry[1] = self.count
+        entry[2] = item
+        self.count += 1
+        self._siftUp(index)
+
+    def pop(self):
+        heap = self.heap
+        last = heap.pop()
+        if heap:
+            entry = heap[0]
+            heap[0] = last
+            self._siftDown(0)
+        else:
+            entry = last
+        del self.position[self.keyOf(entry[2])]
+        return entry[2]
+
+    def isEmpty(self):
+        return len(self.heap) == 0
+
+    def __contains__(self, item):
+        return self.keyOf(item) in self.position
+
+    def __len__(self):
+        return len(self.heap)
+
+    def _siftUp(self, index):
+        heap, position, keyOf = self.heap, self.position, self.keyOf
+        entry = heap[index]
+        while index > 0:
+            parentIndex = (index - 1) >> 1
+            parent = heap[parentIndex]
+            if entry >= parent:
+                break
+            heap[index] = parent
+            position[keyOf(parent[2])] = index
+            index = parentIndex
+        heap[index] = entry
+        position[keyOf(entry[2])] = index
+
+    def _siftDown(self, index):
+        heap, position, keyOf = self.heap, self.position, self.keyOf
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[index] = heap[child]
+            position[keyOf(heap[index][2])] = index
+            index = child
+        heap[index] = entry
+        position[keyOf(entry[2])] = index
+
+
+class BucketQueue:
+    """
+    A monotone bucket queue (Dial's algorithm) for small non-negative integer
+    priorities, such as terrain step costs and integer heuristics.
+
+    Has the same push/pop/isEmpty interface as PriorityQueue. There is one
+    FIFO bucket per priority value, so push is O(1) and pop is O(1) amortized
+    while priorities grow monotonically (as in UCS, or A* with a consistent
+    heuristic). Items with equal priority come out in insertion order, the
+    same tie-breaking as PriorityQueue. Non-integer priorities (e.g. a
+    euclidean heuristic) go to a binary heap instead, so they still come out
+    in order, only without the speed-up.
+    """
+
+    # Only pays off when priorities are f = g + h (see bestFirstSearch)
+    monotone = True
+
+    def __init__(self):
+        self.buckets = []
+        self.current = 0  # No bucket below this one holds items
+        self.size = 0
+        self.count = 0
+        self.late = []  # heap of (priority, count, item) that don't fit a bucket
+
+    def push(self, item, priority):
+        if priority < 0:
+            raise ValueError("BucketQueue priorities must be non-negative")
+        self.size += 1
+        if priority != int(priority):
+            heapq.heappush(self.late, (priority, self.count, item))
+            self.count += 1
+            return
+        priority = int(priority)
+        buckets = self.buckets
+        while len(buckets) <= priority:
+            buckets.append(deque())
+        buckets[priority].append(item)
+        # Non-monotone pushes (inconsistent heuristics) just rewind the cursor
+        if priority < self.current:
+            self.current = priority
+
+    def pop(self):
+        if self.size == 0:
+            raise IndexError("pop from an empty BucketQueue")
+        late = self.late
+        self.size -= 1
+        if late and self.size + 1 == len(late):
+            return heapq.heappop(late)[2]
+        buckets = self.buckets
+        current = self.current
+        while not buckets[current]:
+            current += 1
+        self.current = current
+        # Una prioridad no entera nunca empata con la de un balde
+        if late and late[0][0] < current:
+            return heapq.heappop(late)[2]
+        return buckets[current].popleft()
+
+    def isEmpty(self):
+        return self.size == 0
+
+
+class RadixHeap:
+    """
+    A monotone radix heap for non-negative integer priorities with a large
+    range, where one bucket per value (BucketQueue) would be wasteful.
+
+    Has the same push/pop/isEmpty interface as PriorityQueue. Bucket i holds
+    the items whose priority first differs from the last popped priority at
+    bit i - 1, so each item is moved at most O(log C) times, C being the
+    largest priority. Items with equal priority come out in insertion order.
+
+    Priorities lower than the last popped one (an inconsistent heuristic)
+    or not integers can't go in a bucket; they go to a binary heap that pop
+    also looks at, so the order stays right and only those items lose the
+    speed-up.
+    """
+
+    # Only pays off when priorities are f = g + h (see bestFirstSearch)
+    monotone = True
+
+    def __init__(self):
+        self.buckets = [deque()]
+        self.last = 0
+        self.count = 0
+        self.size = 0
+        self.late = []  # heap of (priority, count, item) that don't fit a bucket
+
+    def push(self, item, priority):
+        self.size += 1
+        if priority < self.last or priority != int(priority):
+            heapq.heappush(self.late, (priority, self.count, item))
+            self.count += 1
+            return
+        priority = int(priority)
+        index = (priority ^ self.last).bit_length()
+        buckets = self.buckets
+        while len(buckets) <= index:
+            buckets.append([])
+        buckets[index].append((priority, self.count, item))
+        self.count += 1
+
+    def pop(self):
+        if self.size == 0:
+            raise IndexError("pop from an empty RadixHeap")
+        late = self.late
+        self.size -= 1
+        # Lo del heap aparte que ya quedo por debajo de last sale primero
+        if late and (self.size + 1 == len(late) or late[0][0] < self.last):
+            return heapq.heappop(late)[2]
+        buckets = self.buckets
+        if not buckets[0]:
+            # Redistribute the first non-empty bucket around its minimum
+            index = 1
+            while not buckets[index]:
+                index += 1
+            entries = buckets[index]
+            buckets[index] = []
+            last = min(entries)[0]
+            self.last = last
+            lowest = []
+            for entry in entries:
+                if entry[0] == last:
+                    lowest.append(entry)
+                else:
+                    buckets[(entry[0] ^ last).bit_length()].append(entry)
+            # Keep insertion order among the items of equal priority
+            lowest.sort()
+            buckets[0] = deque(lowest)
+        if late and late[0][:2] < buckets[0][0][:2]:
+            return heapq.heappop(late)[2]
+        return buckets[0].popleft()[2]
+
+    def isEmpty(self):
+        return self.size == 0
+
+
 class PriorityQueueWithFunction(PriorityQueue):
     """
     Implements a priority queue with the same push/pop signature of the
@@ -1,9 +1,21 @@
 import world.rescue_layout as rescue_layout
 import sys
+import os
+import io
+import glob
+import json
 import time
 import pickle
+import contextlib
+import multiprocessing
 from optparse import OptionParser
 from world.rescue_mission import RescueMission
+from world.rescue_state import RescueState
+
+try:
+    import resource
+except ImportError:  # not available on Windows; peak memory is then omitted
+    resource = None
 
 
 def readCommand(argv):
@@ -26,6 +38,17 @@ def readCommand(argv):
     PROBLEM_CHOICES = (
         "SimpleSurvivorProblem",
         "MultiSurvivorProblem",
+        "CompactMultiSurvivorProblem",
+        "ReducedSimpleSurvivorProblem",
+        "ReducedMultiSurvivorProblem",
+    )
+    parser.add_option(
+        "-a",
+        "--agent",
+        dest="agent",
+        help=default("Agent class in agents.py. e.g. SearchAgent, BudgetSearchAgent, ReplanningAgent, RealTimeAgent"),
+        metavar="AGENT",
+        default="SearchAgent",
     )
     parser.add_option(
         "-p",
@@ -49,6 +72,86 @@ def readCommand(argv):
         metavar="HEURISTIC",
         default="nullHeuristic",
     )
+    parser.add_option(
+        "--frontier",
+        dest="frontier",
+        help="Priority queue class in utils.py for UCS/A*. e.g. PriorityQueue, BucketQueue, RadixHeap",
+        metavar="FRONTIER",
+        default=None,
+    )
+    parser.add_option(
+        "--max-nodes",
+        type="int",
+        dest="maxNodes",
+        help="Most search nodes kept in memory by memory-bounded searches. e.g. smaMemoryBoundedSearch",
+        metavar="NODES",
+        default=None,
+    )
+    parser.add_option(
+        "--time-budget",
+        type="float",
+        dest="timeBudget",
+        help="Seconds to plan for anytime searches; the best plan so far is used. e.g. anytimeRepairingAStarSearch",
+        metavar="SECONDS",
+        default=None,
+    )
+    parser.add_option(
+        "--max-expansions",
+        type="int",
+        dest="maxExpansions",
+        help="Stop any search after this many expansions and follow its partial plan "
+        "(BudgetSearchAgent also doubles the budget when a plan makes no progress)",
+        metavar="NODES",
+        default=None,
+    )
+    parser.add_option(
+        "--max-time",
+        type="float",
+        dest="maxTime",
+        help="Stop any search after this many seconds and follow its partial plan",
+        metavar="SECONDS",
+        default=None,
+    )
+    parser.add_option(
+        "--max-memory",
+        type="float",
+        dest="maxMemory",
+        help="Stop any search once the process uses more than this many MB",
+        metavar="MB",
+        default=None,
+    )
+    parser.add_option(
+        "--lookahead",
+        type="int",
+        dest="lookahead",
+        help="Most expansions of each per-move search of RealTimeAgent",
+        metavar="NODES",
+        default=None,
+    )
+    parser.add_option(
+        "--ms-per-move",
+        type="float",
+        dest="msPerMove",
+        help="Milliseconds each per-move search of RealTimeAgent may take",
+        metavar="MS",
+        default=None,
+    )
+    parser.add_option(
+        "--heuristic-table",
+        dest="tableFile",
+        help="File where RealTimeAgent loads and saves its learned heuristic table",
+        metavar="FILE",
+        default=None,
+    )
+    parser.add_option(
+        "-n",
+        "--numMissions",
+        type="int",
+        dest="numMissions",
+        help=default("Number of missions to run in a row with the same agent"),
+        metavar="MISSIONS",
+        default=1,
+    )
     parser.add_option(
         "-l",
         "--layout",
@@ -116,7 +219,7 @@ def readCommand(argv):
             "Invalid problem type '%s'. Choose one of: %s"
             % (options.problem, ", ".join(PROBLEM_CHOICES))
         )
-    if not options.function:
+    if not options.function and options.agent in ("SearchAgent", "BudgetSearchAgent"):
         parser.error("-f/--function is required")
     if not options.layout:
         parser.error("-l/--layout is required")
@@ -133,12 +236,32 @@ def readCommand(argv):
     print("NumSurvivors:", len(args["layout"].survivors.asList()))
 
     # Choose a rescue agent
-    rescuerType = loadAgent("SearchAgent")
-    rescuer = rescuerType(
-        fn=options.function,
-        prob=options.problem,
-        heuristic=options.heuristic,
-    )
+    rescuerType = loadAgent(options.agent)
+    if options.agent not in ("SearchAgent", "BudgetSearchAgent"):
+        # Only the options the agent takes (and that were given) are passed
+        agentArgs = {
+            "prob": options.problem,
+            "heuristic": options.heuristic,
+            "lookahead": options.lookahead,
+            "msPerMove": options.msPerMove,
+            "tableFile": options.tableFile,
+        }
+        accepted = rescuerType.__init__.__code__.co_varnames
+        rescuer = rescuerType(
+            **{name: value for name, value in agentArgs.items() if name in accepted and value is not None}
+        )
+    else:
+        rescuer = rescuerType(
+            fn=options.function,
+            prob=options.problem,
+            heuristic=options.heuristic,
+            frontier=options.frontier,
+            maxNodes=options.maxNodes,
+            timeBudget=options.timeBudget,
+            maxExpansions=options.maxExpansions,
+            maxTime=options.maxTime,
+            maxMemory=options.maxMemory,
+        )
     args["rescuer"] = rescuer
 
     # Choose a display format
@@ -160,6 +283,7 @@ def readCommand(argv):
 
     args["record"] = options.record
     args["catchExceptions"] = options.catchExceptions
+    args["numMissions"] = options.numMissions
 
     return args
 
@@ -185,7 +309,7 @@ def loadAgent(rescuer):
     )
 
 
-def runMission(layout, rescuer, display, record, catchExceptions=False):
+def runMission(layout, rescuer, display, record, catchExceptions=False, numMissions=1):
     """
     Run rescue missions.
     """
@@ -195,24 +319,202 @@ def runMission(layout, rescuer, display, record, catchExceptions=False):
 
     rescueMission = RescueMission()
 
-    episode = rescueMission.newMission(layout, rescuer, display, False, catchExceptions)
-    episode.run()
+    for _ in range(numMissions):
+        episode = rescueMission.newMission(layout, rescuer, display, False, catchExceptions)
+        episode.run()
 
-    if record:
-        fname = ("recorded-episode") + "-".join(
-            [str(t) for t in time.localtime()[1:6]]
-        )
-        f = open(fname, "wb")
-        components = {"layout": layout, "actions": episode.moveHistory}
-        pickle.dump(components, f)
-        f.close()
+        if record:
+            fname = ("recorded-episode") + "-".join(
+                [str(t) for t in time.localtime()[1:6]]
+            )
+            f = open(fname, "wb")
+            components = {"layout": layout, "actions": episode.moveHistory}
+            pickle.dump(components, f)
+            f.close()
 
     return episode
 
 
+def readBatchCommand(argv):
+    """
+    Processes the arguments of the batch subcommand.
+    """
+    usageStr = """
+    USAGE:      python main.py batch -l LAYOUT_GLOBS -p PROBLEMS -f FUNCTIONS [options]
+    EXAMPLE:    python main.py batch -l "layouts/multiple/*.lay" -p MultiSurvivorProblem -f astar,ucs -h survivorHeuristic
+                    - runs every combination headless in a process pool and prints one JSON line per run.
+    """
+    parser = OptionParser(usageStr, add_help_option=False)
+    parser.add_option("--help", action="help", help="Show this message and exit")
+    parser.add_option(
+        "-l",
+        "--layouts",
+        dest="layouts",
+        help="Comma-separated layout globs or names (required). e.g. layouts/**/*.lay,tinyHouse",
+        metavar="GLOBS",
+    )
+    parser.add_option(
+        "-p",
+        "--problems",
+        dest="problems",
+        help="Comma-separated problem types (required)",
+        metavar="PROBLEMS",
+    )
+    parser.add_option(
+        "-f",
+        "--functions",
+        dest="functions",
+        help="Comma-separated search function names (required)",
+        metavar="FUNCTIONS",
+    )
+    parser.add_option(
+        "-h",
+        "--heuristics",
+        dest="heuristics",
+        help=default("Comma-separated heuristic names, used by the functions that take one"),
+        metavar="HEURISTICS",
+        default="nullHeuristic",
+    )
+    parser.add_option(
+        "-j",
+        "--workers",
+        type="int",
+        dest="workers",
+        help="Number of worker processes [Default: one per CPU]",
+        default=None,
+    )
+    parser.add_option(
+        "-o",
+        "--output",
+        dest="output",
+        help="File to write the JSON lines to [Default: standard output]",
+        metavar="FILE",
+        default=None,
+    )
+
+    options, otherjunk = parser.parse_args(argv)
+    if len(otherjunk) != 0:
+        raise Exception("Command line input not understood: " + str(otherjunk))
+    for option, flag in (("layouts", "-l/--layouts"), ("problems", "-p/--problems"), ("functions", "-f/--functions")):
+        if not getattr(options, option):
+            parser.error(flag + " is required")
+
+    layouts = findLayouts(options.layouts.split(","))
+    if not layouts:
+        parser.error("No layout matches " + options.layouts)
+
+    # Una corrida por combinacion; las funciones sin heuristica corren una vez
+    import algorithms.search as search
+
+    runs = []
+    for layout in layouts:
+        for problem in options.problems.split(","):
+            for function in options.functions.split(","):
+                if function not in dir(search):
+                    parser.error(function + " is not a search function in search.py.")
+                if "heuristic" in getattr(search, function).__code__.co_varnames:
+                    heuristics = options.heuristics.split(",")
+                else:
+                    heuristics = [None]
+                for heuristic in heuristics:
+                    runs.append((layout, problem, function, heuristic))
+
+    return dict(runs=runs, workers=options.workers, output=options.output)
+
+
+def findLayouts(patterns):
+    """
+    Expands layout globs into .lay paths. A pattern that matches no file is
+    looked up by name under layouts/, like getLayout, walking the directory
+    only once for all of them.
+    """
+    paths, byName = [], None
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches:
+            if byName is None:
+                byName = {}
+                for root, _dirs, files in os.walk("layouts"):
+                    for filename in files:
+                        byName.setdefault(filename, os.path.join(root, filename))
+            filename = pattern if pattern.endswith(".lay") else pattern + ".lay"
+            matches = [byName[filename]] if filename in byName else []
+        paths.extend(path for path in matches if path.endswith(".lay") and path not in paths)
+    return paths
+
+
+def runBatchJob(job):
+    """
+    Plans one (layout path, problem, function, heuristic) combination
+    without graphics and returns its JSON-ready record.
+    """
+    path, problem, function, heuristic = job
+    record = dict(
+        layout=os.path.splitext(os.path.basename(path))[0],
+        problem=problem,
+        function=function,
+        heuristic=heuristic,
+    )
+    try:
+        from algorithms.utils import SearchResult
+
+        # Los mensajes del agente y de la busqueda no van a la salida JSON
+        with contextlib.redirect_stdout(io.StringIO()):
+            rescuer = loadAgent("SearchAgent")(
+                fn=function, prob=problem, heuristic=heuristic or "nullHeuristic"
+            )
+            state = RescueState()
+            state.initialize(rescue_layout.tryToLoad(path))
+            start = time.perf_counter()
+            searchProblem = rescuer.searchType(state)
+            actions = rescuer.searchFunction(searchProblem)
+            elapsed = time.perf_counter() - start
+        # Igual que SearchAgent: del resultado de un presupuesto se toma el
+        # plan, y los pasillos de un grafo reducido vuelven a ser sus pasos
+        if isinstance(actions, SearchResult):
+            record["status"] = actions.status
+            actions = actions.actions
+        actions = actions or []
+        if "expandActions" in dir(searchProblem):
+            actions = searchProblem.expandActions(actions)
+        record.update(
+            cost=searchProblem.getCostOfActions(actions),
+            length=len(actions),
+            expanded=getattr(searchProblem, "_expanded", None),
+            time=round(elapsed, 4),
+        )
+    except Exception as e:
+        record["error"] = "%s: %s" % (type(e).__name__, e)
+
+    # Cada corrida tiene su propio proceso, asi el pico de memoria es solo suyo
+    if resource is not None:
+        scale = 1024 if sys.platform == "darwin" else 1
+        record["peakMemoryKB"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale
+    return record
+
+
+def runBatch(runs, workers=None, output=None):
+    """
+    Runs the batch in a process pool, writing one JSON line per run as they
+    finish.
+    """
+    out = open(output, "w") if output else sys.stdout
+    try:
+        with multiprocessing.Pool(processes=workers, maxtasksperchild=1) as pool:
+            for record in pool.imap_unordered(runBatchJob, runs):
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+    finally:
+        if output:
+            out.close()
+
+
 if __name__ == "__main__":
     """
     The main function is called when main.py is run from the command line.
     """
-    args = readCommand(sys.argv[1:])
-    runMission(**args)
+    if sys.argv[1:2] == ["batch"]:
+        runBatch(**readBatchCommand(sys.argv[2:]))
+    else:
+        args = readCommand(sys.argv[1:])
+        runMission(**args)
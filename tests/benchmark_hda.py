@@ -0,0 +1,53 @@
+"""
+Compares hdaStarSearch with aStarSearch on the multi-survivor layouts:
+plan cost, nodes expanded (summed over workers for HDA*) and wall time,
+including starting the worker processes. HDA* always works on
+CompactMultiSurvivorProblem, so A* is timed on both encodings. Run from
+the repository root:
+
+    python tests/benchmark_hda.py [layout ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms import heuristics, problems, search  # noqa: E402
+from world.rescue_layout import getLayout  # noqa: E402
+from world.rescue_state import RescueState  # noqa: E402
+
+LAYOUTS = ("bunkerRescue", "tinyLabyrinth", "storeRescue", "hospitalWing")
+WORKERS = (1, 2, 4)
+
+
+def run(function, name, problemClass=problems.MultiSurvivorProblem, **kwargs):
+    """
+    Returns (cost, expanded, seconds) of function on a fresh problem.
+    """
+    state = RescueState()
+    state.initialize(getLayout(name))
+    problem = problemClass(state)
+    start = time.perf_counter()
+    actions = function(problem, heuristics.survivorHeuristic, **kwargs)
+    seconds = time.perf_counter() - start
+    return problem.getCostOfActions(actions), problem._expanded, seconds
+
+
+def main(*names):
+    print("cpus: %s, HDA_BATCH_SIZE: %d" % (os.cpu_count(), search.HDA_BATCH_SIZE))
+    print("%-16s %-10s %6s %10s %10s" % ("layout", "search", "cost", "expanded", "seconds"))
+    for name in names or LAYOUTS:
+        optimal, expanded, seconds = run(search.aStarSearch, name)
+        print("%-16s %-10s %6d %10d %10.2f" % (name, "astar", optimal, expanded, seconds))
+        # HDA* resuelve siempre sobre el problema compacto
+        cost, expanded, seconds = run(search.aStarSearch, name, problems.CompactMultiSurvivorProblem)
+        print("%-16s %-10s %6d %10d %10.2f" % ("", "astar-c", cost, expanded, seconds))
+        for workers in WORKERS:
+            cost, expanded, seconds = run(search.hdaStarSearch, name, workers=workers)
+            assert cost == optimal, "%s: HDA* cost %s, A* cost %s" % (name, cost, optimal)
+            print("%-16s %-10s %6d %10d %10.2f" % ("", "hda*%d" % workers, cost, expanded, seconds))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,56 @@
+"""
+Compares jumpPointSearch with aStarSearch on every single-survivor layout:
+plan cost, nodes expanded (jump points for JPS) and planning time, best of
+a few runs. Run from the repository root:
+
+    python tests/benchmark_jps.py [heuristic]
+"""
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms import heuristics, problems, search  # noqa: E402
+from world.rescue_layout import tryToLoad  # noqa: E402
+from world.rescue_state import RescueState  # noqa: E402
+
+REPEATS = 5
+
+
+def run(function, layout, heuristic):
+    """
+    Returns (cost, expanded, best seconds) of function on a fresh problem.
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        state = RescueState()
+        state.initialize(layout)
+        layout._compiled = None  # cada corrida compila el mapa desde cero
+        problem = problems.SimpleSurvivorProblem(state, warn=False, visualize=False)
+        start = time.perf_counter()
+        actions = function(problem, heuristic)
+        best = min(best, time.perf_counter() - start)
+    return problem.getCostOfActions(actions), problem._expanded, best
+
+
+def main(heuristicName="manhattanHeuristic"):
+    heuristic = getattr(heuristics, heuristicName)
+    print("%-22s %8s %10s %10s %10s %10s" % ("layout", "cost", "A* exp", "JPS exp", "A* ms", "JPS ms"))
+    for path in sorted(glob.glob("layouts/simple/*.lay")):
+        layout = tryToLoad(path)
+        if layout.isTimed():
+            continue  # con horarios los costos no son los del mapa compilado
+        costA, expandedA, timeA = run(search.aStarSearch, layout, heuristic)
+        costJ, expandedJ, timeJ = run(search.jumpPointSearch, layout, heuristic)
+        assert costA == costJ, "%s: JPS cost %s, A* cost %s" % (path, costJ, costA)
+        name = os.path.splitext(os.path.basename(path))[0]
+        print(
+            "%-22s %8d %10d %10d %10.2f %10.2f"
+            % (name, costA, expandedA, expandedJ, timeA * 1000, timeJ * 1000)
+        )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,106 @@
+import os
+
+from algorithms import agents, heuristics, problems, search
+from view.text_display import NullGraphics
+from world import game
+from world.rescue_layout import tryToLoad
+from world.rescue_mission import RescueMission
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def layoutPath(name, kind="simple"):
+    return os.path.join(ROOT, "layouts", kind, name + ".lay")
+
+
+class CheckedReplanningAgent(agents.ReplanningAgent):
+    """
+    ReplanningAgent that, before every move, compares the cost of the
+    repaired D* Lite plan with the one of a fresh A* plan on the map as it
+    is now.
+    """
+
+    def getAction(self, state):
+        action = agents.ReplanningAgent.getAction(self, state)
+        fresh = problems.SimpleSurvivorProblem(state, warn=False, visualize=False)
+        optimal = fresh.getCostOfActions(search.astar(fresh, heuristics.manhattanHeuristic))
+        self.checks.append((fresh.getCostOfActions(self.planner.getPlan()), optimal))
+        return action
+
+
+def test_replanning_agent_repairs_its_plan_when_the_map_changes_mid_mission():
+    agent = CheckedReplanningAgent()
+    agent.checks = []
+    mission = RescueMission().newMission(tryToLoad(layoutPath("collapsingHallway")), agent, NullGraphics(), True)
+    mission.run()
+
+    assert mission.state.isWin()
+    # La pared del tiempo 2 corta el pasillo de arriba: hubo que volver
+    assert len(agent.checks) > 9
+    assert all(repaired == optimal for repaired, optimal in agent.checks)
+    assert mission.state.data.cumulativeCost == 21
+    assert len(mission.state.getLayout().changes) == 2
+
+
+def test_each_mission_applies_the_scheduled_changes_on_its_own_copy():
+    layout = tryToLoad(layoutPath("collapsingHallway"))
+    for _ in range(2):
+        agent = agents.ReplanningAgent()
+        mission = RescueMission().newMission(layout, agent, NullGraphics(), True)
+        mission.run()
+        assert mission.state.data.cumulativeCost == 21
+    assert layout.changes == [] and len(layout.changeSchedule) == 2
+
+
+def test_budget_search_agent_doubles_its_budget_until_it_reaches_the_survivor():
+    agent = agents.BudgetSearchAgent(
+        fn="astar", prob="SimpleSurvivorProblem", heuristic="manhattanHeuristic", maxExpansions=2
+    )
+    mission = RescueMission().newMission(tryToLoad(layoutPath("damagedOffice")), agent, NullGraphics(), True)
+    mission.run()
+
+    assert mission.state.isWin()
+    assert agent.currentLimits[0] > 2
+
+
+def test_search_agent_returns_the_partial_plan_without_retrying():
+    agent = agents.SearchAgent(fn="astar", prob="SimpleSurvivorProblem", heuristic="manhattanHeuristic")
+    state = RescueMission().newMission(tryToLoad(layoutPath("damagedOffice")), agent, NullGraphics(), True).state
+    result = agent.runSearch(agent.searchType(state), (2, None, None))
+
+    assert result.status == "expansions"
+    assert result.expanded <= 3
+
+
+def runMissions(agent, path, count):
+    costs = []
+    for _ in range(count):
+        mission = RescueMission().newMission(tryToLoad(path), agent, NullGraphics(), True)
+        mission.run()
+        assert mission.state.isWin()
+        costs.append(mission.state.data.cumulativeCost)
+    return costs
+
+
+def test_real_time_agent_converges_to_the_optimal_cost(monkeypatch):
+    monkeypatch.setattr(agents, "LEARNED_HEURISTICS", {})
+    # Sin la pausa de medio segundo al empezar cada mision
+    monkeypatch.setattr(game.time, "sleep", lambda seconds: None)
+    agent = agents.RealTimeAgent(heuristic="manhattanHeuristic", lookahead=8)
+    costs = runMissions(agent, layoutPath("damagedOffice"), 16)
+    # Con la tabla aprendida las ultimas misiones siguen el camino optimo
+    assert costs[0] > 61
+    assert costs[-3:] == [61, 61, 61]
+
+
+def test_real_time_agent_saves_and_reloads_its_table(monkeypatch, tmp_path):
+    monkeypatch.setattr(agents, "LEARNED_HEURISTICS", {})
+    tableFile = str(tmp_path / "learned.pkl")
+    agent = agents.RealTimeAgent(prob="MultiSurvivorProblem", heuristic="survivorHeuristic", tableFile=tableFile)
+    runMissions(agent, layoutPath("tinyAmbush", "multiple"), 1)
+    learned = {key: dict(table) for key, table in agents.LEARNED_HEURISTICS.items()}
+    assert learned
+
+    monkeypatch.setattr(agents, "LEARNED_HEURISTICS", {})
+    agents.RealTimeAgent(prob="MultiSurvivorProblem", heuristic="survivorHeuristic", tableFile=tableFile)
+    assert agents.LEARNED_HEURISTICS == learned
@@ -0,0 +1,61 @@
+import os
+import pickle
+
+from algorithms import problems
+from world import rescue_layout
+from world.rescue_layout import tryToLoad
+from world.rescue_state import RescueState
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def layoutPath(name, kind="simple"):
+    return os.path.join(ROOT, "layouts", kind, name + ".lay")
+
+
+def test_problems_see_walls_and_terrain_reported_after_they_were_built():
+    state = RescueState()
+    state.initialize(tryToLoad(layoutPath("collapsingHallway")))
+    simple = problems.SimpleSurvivorProblem(state, warn=False, visualize=False)
+    compact = problems.CompactMultiSurvivorProblem(state)
+    start = simple.getStartState()
+    assert (2, 3) in [s for s, _, _ in simple.getSuccessors(start)]
+
+    layout = state.getLayout()
+    layout.setWall((2, 3))
+    layout.setTerrain((1, 2), "^")
+    assert [(s, c) for s, _, c in simple.getSuccessors(start)] == [((1, 2), 3)]
+    cells = [cell for (cell, _), _, _ in compact.getSuccessors(compact.getStartState())]
+    assert cells == [compact.encodePosition((1, 2))]
+
+
+def test_scheduled_changes_apply_in_time_order_and_spare_the_rescuer():
+    layout = tryToLoad(layoutPath("collapsingHallway"))
+    assert layout.applyScheduledChanges(0) == []
+    assert layout.applyScheduledChanges(1) == [(6, 1)]
+    assert layout.getTerrainCost(6, 1) == 5
+    assert layout.applyScheduledChanges(5, keepOpen=((6, 3),)) == []
+    assert not layout.isWall((6, 3)) and layout.changes == [(6, 1)]
+
+
+def test_hierarchy_cache_is_keyed_by_version_and_lives_in_the_repository():
+    assert rescue_layout.HIERARCHY_CACHE_DIR == os.path.join(ROOT, ".hierarchies")
+
+
+def test_hierarchy_cache_rebuilds_files_of_another_version(tmp_path):
+    hierarchy = tryToLoad(layoutPath("damagedOffice")).getContractionHierarchy(str(tmp_path))
+    (filename,) = tmp_path.iterdir()
+    assert tryToLoad(layoutPath("damagedOffice")).getContractionHierarchy(str(tmp_path)).edges == hierarchy.edges
+
+    # Un archivo de otra version no se usa: se construye y se guarda de nuevo
+    with open(filename, "wb") as f:
+        pickle.dump((rescue_layout.HIERARCHY_FORMAT_VERSION - 1, "old"), f)
+    rebuilt = tryToLoad(layoutPath("damagedOffice")).getContractionHierarchy(str(tmp_path))
+    assert rebuilt.edges == hierarchy.edges
+    assert rescue_layout.ContractionHierarchy.load(filename).edges == hierarchy.edges
+
+    # El mapa cambiado tiene su propio archivo
+    layout = tryToLoad(layoutPath("damagedOffice"))
+    layout.setTerrain((1, 1), "*")
+    layout.getContractionHierarchy(str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 2
@@ -0,0 +1,14 @@
+import os
+
+import main
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_batch_length_counts_primitive_moves_on_reduced_problems():
+    path = os.path.join(ROOT, "layouts", "multiple", "bunkerRescue.lay")
+    plain = main.runBatchJob((path, "CompactMultiSurvivorProblem", "astar", "survivorHeuristic"))
+    reduced = main.runBatchJob((path, "ReducedMultiSurvivorProblem", "astar", "survivorHeuristic"))
+    assert "error" not in reduced
+    assert reduced["cost"] == plain["cost"]
+    assert reduced["length"] == plain["length"]
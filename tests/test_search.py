@@ -0,0 +1,422 @@
+import glob
+import heapq
+import multiprocessing
+import os
+import random
+import time
+
+import pytest
+
+from algorithms import heuristics, problems, search
+from algorithms.utils import SearchResult
+from world.game import Actions, Directions
+from world import rescue_layout
+from world.rescue_layout import RescueLayout, tryToLoad
+from world.rescue_state import RescueState
+
+from test_utils import GraphProblem, graphHeuristic
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIMPLE_LAYOUTS = sorted(glob.glob(os.path.join(ROOT, "layouts", "simple", "*.lay")))
+# Sin horarios: el costo de un plan es el del mapa compilado
+UNTIMED_SIMPLE_LAYOUTS = [path for path in SIMPLE_LAYOUTS if not tryToLoad(path).isTimed()]
+
+
+def layoutPath(name, kind="simple"):
+    return os.path.join(ROOT, "layouts", kind, name + ".lay")
+
+
+def simpleProblem(path):
+    state = RescueState()
+    state.initialize(tryToLoad(path))
+    return problems.SimpleSurvivorProblem(state, warn=False, visualize=False)
+
+
+def multiProblem(name):
+    state = RescueState()
+    state.initialize(tryToLoad(layoutPath(name, "multiple")))
+    return problems.MultiSurvivorProblem(state)
+
+
+def layoutProblem(layout):
+    state = RescueState()
+    state.initialize(layout)
+    return problems.SimpleSurvivorProblem(state, warn=False, visualize=False)
+
+
+def solve(function, path, *args, **kwargs):
+    """
+    Runs function on a fresh SimpleSurvivorProblem of path and returns
+    (cost, nodes expanded).
+    """
+    problem = simpleProblem(path)
+    actions = function(problem, *args, **kwargs)
+    return problem.getCostOfActions(actions), problem._expanded
+
+
+@pytest.mark.parametrize("path", UNTIMED_SIMPLE_LAYOUTS)
+def test_bidirectional_searches_find_the_optimal_cost(path):
+    optimal, _ = solve(search.ucs, path)
+    assert solve(search.biucs, path)[0] == optimal
+    for heuristic in (heuristics.manhattanHeuristic, heuristics.mazeDistanceHeuristic):
+        assert solve(search.biastar, path, heuristic)[0] == optimal
+
+
+def test_bidirectional_dijkstra_expands_fewer_nodes_than_ucs():
+    path = layoutPath("bigCollapsedBuilding")
+    assert solve(search.biucs, path)[1] < solve(search.ucs, path)[1]
+    # En un pasillo cada expansion descubre una sola arista del camino:
+    # ninguna busqueda baja de largo - 1 expansiones
+    path = layoutPath("hallwayTest")
+    assert solve(search.biucs, path)[1] <= solve(search.ucs, path)[1]
+    assert solve(search.biastar, path, heuristics.manhattanHeuristic)[1] <= solve(
+        search.astar, path, heuristics.manhattanHeuristic
+    )[1]
+
+
+def test_bidirectional_astar_expands_fewer_nodes_than_ucs():
+    for name in ("bigCollapsedBuilding", "burningOffice", "floodedPlaza"):
+        path = layoutPath(name)
+        informed = solve(search.biastar, path, heuristics.manhattanHeuristic)[1]
+        assert informed < solve(search.ucs, path)[1]
+
+
+def test_arastar_bound_is_at_least_one_when_open_nodes_exceed_goal_cost():
+    # B queda abierto con g + h = 6 > 1, el costo de la meta: la cota no
+    # puede quedar por debajo de 1
+    edges = {"S": [("G", "g", 1), ("B", "b", 1)], "B": [("G", "bg", 5)]}
+    problem = GraphProblem(edges, "S", "G", {"S": 1, "G": 0, "B": 5})
+    actions = search.arastar(problem, graphHeuristic, initialWeight=2)
+    assert actions == ["g"]
+    assert 1 <= problem._weight <= 2
+
+
+@pytest.mark.parametrize("path", SIMPLE_LAYOUTS)
+def test_arastar_bound_on_simple_layouts(path):
+    problem = simpleProblem(path)
+    actions = search.arastar(problem, heuristics.manhattanHeuristic, initialWeight=3, weightStep=1)
+    assert problem._weight >= 1
+    optimal = simpleProblem(path)
+    best = optimal.getCostOfActions(search.astar(optimal, heuristics.manhattanHeuristic))
+    assert problem.getCostOfActions(actions) <= problem._weight * best
+
+
+def test_portfolio_leaves_no_worker_processes_alive():
+    path = os.path.join(ROOT, "layouts", "simple", "bigCollapsedBuilding.lay")
+    problem = simpleProblem(path)
+    # El primer optimo en terminar gana; el resto sigue corriendo y debe
+    # quedar detenido al volver
+    portfolio = (
+        ("uniformCostSearch", None, True),
+        ("aStarSearch", "manhattanHeuristic", True),
+        ("breadthFirstSearch", None, False),
+    )
+    actions = search.portfolio(problem, portfolio=portfolio, workers=3)
+    assert problem.getCostOfActions(actions) == solve(search.ucs, path)[0]
+    assert multiprocessing.active_children() == []
+
+
+def test_portfolio_honours_its_deadline_before_any_plan():
+    problem = multiProblem("tinyLabyrinth")
+    start = time.perf_counter()
+    result = search.portfolio(problem, timeBudget=0.3, portfolio=(("uniformCostSearch", None, True),))
+    assert time.perf_counter() - start < 3
+    assert isinstance(result, SearchResult)
+    assert result.status == SearchResult.TIME and result.actions == []
+    assert multiprocessing.active_children() == []
+
+
+def test_portfolio_workers_see_the_schedule_of_the_layout():
+    path = layoutPath("spreadingFire")
+    optimal, _ = solve(search.sipp, path, heuristics.manhattanHeuristic)
+    cost, _ = solve(search.portfolio, path)
+    assert cost == optimal == timeExpandedCost(tryToLoad(path))
+
+
+def timeExpandedCost(layout, horizon=80):
+    """
+    Optimal cost on a timed layout by brute force: Dijkstra over (cell,
+    timestep) pairs up to horizon, where every action (Stop included) costs
+    the terrain entered at the timestep it ends. None if the survivor can't
+    be reached.
+    """
+    problem = layoutProblem(layout)
+    start = problem.getStartState()
+    frontera = [(0, 0, start)]
+    vistos = set()
+    while frontera:
+        g, t, pos = heapq.heappop(frontera)
+        if problem.isGoalState(pos):
+            return g
+        if (pos, t) in vistos or t >= horizon:
+            continue
+        vistos.add((pos, t))
+        for action in (Directions.NORTH, Directions.SOUTH, Directions.EAST, Directions.WEST, Directions.STOP):
+            dx, dy = Actions.directionToVector(action)
+            nxt = (int(pos[0] + dx), int(pos[1] + dy))
+            if not layout.isBlockedAt(nxt, t + 1):
+                heapq.heappush(frontera, (g + layout.getTerrainCostAt(nxt[0], nxt[1], t + 1), t + 1, nxt))
+    return None
+
+
+def solveTimed(layout):
+    problem = layoutProblem(layout)
+    actions = search.sipp(problem, heuristics.manhattanHeuristic)
+    if not actions:
+        return None, actions
+    return problem.getCostOfActions(actions), actions
+
+
+TIMED_MAP = [
+    "%%%%%%%%",
+    "%R..~..%",
+    "%.%%.%.%",
+    "%..^...%",
+    "%.%.%%S%",
+    "%%%%%%%%",
+]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_sipp_matches_time_expanded_search_on_random_schedules(seed):
+    rng = random.Random(seed)
+    layout = RescueLayout(TIMED_MAP)
+    start = layout.agentPositions[0][1]
+    cells = [
+        (x, y) for x in range(layout.width) for y in range(layout.height) if not layout.isWall((x, y)) and (x, y) != start
+    ]
+    for _ in range(rng.randint(2, 8)):
+        pos = rng.choice(cells)
+        begin = rng.randint(0, 15)
+        end = rng.choice([begin + rng.randint(1, 10), None])
+        char = rng.choice(["%", "%", "~", "^", "*", "."])
+        if char == "%":
+            layout.addBlockedInterval(pos, begin, end)
+        else:
+            layout.addTimedTerrain(pos, begin, end, char)
+
+    assert solveTimed(layout)[0] == timeExpandedCost(layout)
+
+
+def test_sipp_waits_when_the_only_way_is_blocked_for_a_while():
+    layout = RescueLayout(["%%%%%", "%R.S%", "%%%%%"])
+    layout.addBlockedInterval((2, 1), 1, 4)
+    cost, actions = solveTimed(layout)
+    assert cost == timeExpandedCost(layout) == 5
+    assert actions == [Directions.STOP] * 3 + [Directions.EAST] * 2
+
+
+def test_sipp_finds_no_plan_when_the_survivor_is_blocked_for_ever():
+    layout = RescueLayout(["%%%%%%", "%R..S%", "%%%%%%"])
+    layout.addBlockedInterval((4, 1), 0)
+    assert solveTimed(layout) == (None, [])
+    assert timeExpandedCost(layout) is None
+
+    # Solo por un rato: se llega en cuanto se libera
+    layout = RescueLayout(["%%%%%%", "%R..S%", "%%%%%%"])
+    layout.addBlockedInterval((4, 1), 0, 7)
+    assert solveTimed(layout)[0] == timeExpandedCost(layout) == 7
+
+
+def test_timed_cost_of_actions_uses_the_terrain_and_blocks_at_each_timestep():
+    layout = RescueLayout(["%%%%%", "%R.S%", "%%%%%"])
+    layout.addTimedTerrain((2, 1), 2, 5, "*")
+    layout.addBlockedInterval((3, 1), 0, 3)
+    problem = layoutProblem(layout)
+    east, stop = Directions.EAST, Directions.STOP
+
+    assert problem.getCostOfActions([east, stop]) == 1 + 5
+    assert problem.getCostOfActions([stop, stop, stop, stop, east, east]) == 4 + 1 + 1
+    assert problem.getCostOfActions([east, stop, east]) == 1 + 5 + 1
+    # El sobreviviente sigue bloqueado en t = 2
+    assert problem.getCostOfActions([east, east]) == 999999
+
+
+def test_spreading_fire_schedule_is_loaded_and_solved_optimally():
+    layout = tryToLoad(layoutPath("spreadingFire"))
+    assert layout.isTimed()
+    assert layout.getTerrainCostAt(9, 1, 0) == 5 and layout.getTerrainCostAt(9, 1, 6) == 1
+    assert layout.isBlockedAt((1, 2), 6) and not layout.isBlockedAt((1, 2), 16)
+    assert layout.getSafeIntervals((6, 2))[-1] == (20, float("inf"), 3)
+
+    cost, actions = solveTimed(layout)
+    assert cost == timeExpandedCost(layout)
+    # El plan de A* que ignora el horario no es mejor con el fuego
+    problem = layoutProblem(layout)
+    assert problem.getCostOfActions(search.astar(problem, heuristics.manhattanHeuristic)) >= cost
+
+
+@pytest.mark.parametrize("path", UNTIMED_SIMPLE_LAYOUTS)
+def test_idastar_and_fringe_find_the_optimal_cost(path):
+    optimal, _ = solve(search.astar, path, heuristics.manhattanHeuristic)
+    assert solve(search.idastar, path, heuristics.manhattanHeuristic)[0] == optimal
+    assert solve(search.fringe, path, heuristics.manhattanHeuristic)[0] == optimal
+
+
+@pytest.mark.parametrize("name", ["tinyAmbush", "floodedCloset"])
+def test_idastar_and_fringe_find_the_optimal_multi_survivor_cost(name):
+    problem = multiProblem(name)
+    optimal = problem.getCostOfActions(search.astar(problem, heuristics.survivorHeuristic))
+    for function in (search.idastar, search.fringe):
+        problem = multiProblem(name)
+        assert problem.getCostOfActions(function(problem, heuristics.survivorHeuristic)) == optimal
+
+
+def test_idastar_table_keeps_the_best_g_across_iterations():
+    problem = simpleProblem(layoutPath("burningOffice"))
+    actions = search.idastar(problem, heuristics.manhattanHeuristic)
+    assert problem.getCostOfActions(actions) == 128
+    assert problem._iterations > 1
+    # Con el g de cada iteracion por separado eran 50785 expansiones, 50499
+    # de ellas repetidas
+    assert problem._reexpanded < problem._expanded < 10000
+
+    # Con una tabla chica sigue siendo optimo
+    path = layoutPath("damagedOffice")
+    assert solve(search.idastar, path, heuristics.manhattanHeuristic, cacheSize=50)[0] == 61
+
+
+@pytest.mark.parametrize("path", UNTIMED_SIMPLE_LAYOUTS)
+def test_contraction_hierarchy_finds_the_optimal_cost(path, tmp_path, monkeypatch):
+    monkeypatch.setattr(rescue_layout, "HIERARCHY_CACHE_DIR", str(tmp_path))
+    optimal, expanded = solve(search.ucs, path)
+    cost, settled = solve(search.ch, path)
+    assert cost == optimal
+    # La consulta solo sube por la jerarquia desde ambos extremos
+    assert 0 < settled < expanded
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_hdastar_finds_the_optimal_multi_survivor_cost(workers):
+    problem = multiProblem("storeRescue")
+    optimal = problem.getCostOfActions(search.astar(problem, heuristics.survivorHeuristic))
+    problem = multiProblem("storeRescue")
+    actions = search.hdastar(problem, heuristics.survivorHeuristic, workers=workers)
+    assert problem.getCostOfActions(actions) == optimal
+    assert multiprocessing.active_children() == []
+
+
+def test_arastar_stops_at_its_deadline_before_a_first_plan():
+    problem = multiProblem("tinyLabyrinth")
+    start = time.perf_counter()
+    result = search.arastar(problem, heuristics.nullHeuristic, timeBudget=0.2, initialWeight=1)
+    assert time.perf_counter() - start < 1
+    assert isinstance(result, SearchResult) and result.status == SearchResult.TIME
+    assert result.actions and 0 < result.bound <= 38
+
+
+def test_held_karp_finds_the_optimal_cost():
+    for name in ("tinyAmbush", "floodedCloset", "storeRescue"):
+        problem = multiProblem(name)
+        optimal = problem.getCostOfActions(search.astar(problem, heuristics.survivorHeuristic))
+        problem = multiProblem(name)
+        assert problem.getCostOfActions(search.heldkarp(problem)) == optimal
+
+
+def test_held_karp_refuses_too_many_survivors_before_searching():
+    problem = multiProblem("tinyRubble")
+    with pytest.raises(ValueError, match="at most 16 survivors"):
+        search.heldkarp(problem)
+    assert problem._expanded == 0
+
+
+@pytest.mark.parametrize("path", UNTIMED_SIMPLE_LAYOUTS)
+def test_jump_point_search_finds_the_optimal_cost(path):
+    optimal, _ = solve(search.astar, path, heuristics.manhattanHeuristic)
+    assert solve(search.jps, path, heuristics.manhattanHeuristic)[0] == optimal
+
+
+def test_jump_point_search_expands_fewer_nodes_than_astar():
+    for name in ("bigCollapsedBuilding", "burningOffice", "hallwayTest"):
+        path = layoutPath(name)
+        assert solve(search.jps, path, heuristics.manhattanHeuristic)[1] < solve(
+            search.astar, path, heuristics.manhattanHeuristic
+        )[1]
+
+
+@pytest.mark.parametrize("path", UNTIMED_SIMPLE_LAYOUTS)
+def test_sma_star_finds_the_optimal_cost_when_the_plan_fits(path):
+    optimal, _ = solve(search.astar, path, heuristics.manhattanHeuristic)
+    assert solve(search.smastar, path, heuristics.manhattanHeuristic, maxNodes=200)[0] == optimal
+
+
+def test_sma_star_within_a_small_node_cap():
+    # Un plan de 150 movimientos necesita 151 nodos en memoria
+    path = layoutPath("bigCollapsedBuilding")
+    assert search.smastar(simpleProblem(path), heuristics.manhattanHeuristic, maxNodes=150) == []
+    assert solve(search.smastar, path, heuristics.manhattanHeuristic, maxNodes=170)[0] == 172
+
+    for name, maxNodes in (("floodedCloset", 100), ("storeRescue", 300)):
+        problem = multiProblem(name)
+        optimal = problem.getCostOfActions(search.astar(problem, heuristics.survivorHeuristic))
+        problem = multiProblem(name)
+        actions = search.smastar(problem, heuristics.survivorHeuristic, maxNodes=maxNodes)
+        assert problem.getCostOfActions(actions) == optimal
+        assert problem._reexpanded > 0
+
+
+@pytest.mark.parametrize("name", ["tinyAmbush", "floodedCloset", "storeRescue"])
+def test_focal_and_ees_stay_within_their_bound(name):
+    problem = multiProblem(name)
+    optimal = problem.getCostOfActions(search.astar(problem, heuristics.survivorHeuristic))
+    for function in (search.focal, search.ees):
+        problem = multiProblem(name)
+        assert problem.getCostOfActions(function(problem, heuristics.survivorHeuristic, weight=1)) == optimal
+        for weight in (1.5, 2):
+            problem = multiProblem(name)
+            cost = problem.getCostOfActions(function(problem, heuristics.survivorHeuristic, weight=weight))
+            assert 1 <= problem._weight <= weight
+            assert optimal <= cost <= problem._weight * optimal
+
+
+@pytest.mark.parametrize("path", UNTIMED_SIMPLE_LAYOUTS)
+def test_focal_and_ees_on_simple_layouts(path):
+    optimal, _ = solve(search.astar, path, heuristics.manhattanHeuristic)
+    for function in (search.focal, search.ees):
+        assert optimal <= solve(function, path, heuristics.manhattanHeuristic, weight=1.5)[0] <= 1.5 * optimal
+
+
+def endState(problem, actions):
+    state = problem.getStartState()
+    for action in actions:
+        state = next(s for s, a, _ in problem.getSuccessors(state) if a == action)
+    return state
+
+
+@pytest.mark.parametrize("name", ["storeRescue", "hospitalWing", "burningLibrary", "tinyLabyrinth"])
+def test_nearest_survivor_plans_rescue_everyone_near_the_optimum(name):
+    problem = multiProblem(name)
+    improved = search.nearest(problem)
+    assert problem.isGoalState(endState(problem, improved))
+    plain = search.nearest(multiProblem(name), improve=False)
+    assert problem.isGoalState(endState(problem, plain))
+    # 2-opt y Or-opt nunca empeoran el orden del vecino mas cercano
+    assert problem.getCostOfActions(improved) <= problem.getCostOfActions(plain)
+
+    if name != "tinyLabyrinth":  # 20 sobrevivientes: fuera del alcance de Held-Karp
+        optimal = problem.getCostOfActions(search.heldkarp(multiProblem(name)))
+        assert optimal <= problem.getCostOfActions(improved) <= 1.2 * optimal
+
+
+@pytest.mark.parametrize("path", UNTIMED_SIMPLE_LAYOUTS)
+def test_reduced_simple_problem_keeps_the_optimal_cost_with_fewer_expansions(path):
+    optimal, expanded = solve(search.ucs, path)
+    state = RescueState()
+    state.initialize(tryToLoad(path))
+    reduced = problems.ReducedSimpleSurvivorProblem(state, warn=False, visualize=False)
+    actions = reduced.expandActions(search.ucs(reduced))
+    assert simpleProblem(path).getCostOfActions(actions) == optimal
+    assert reduced._expanded <= expanded
+
+
+@pytest.mark.parametrize("name", ["tinyAmbush", "floodedCloset", "storeRescue", "trappedMiners"])
+def test_reduced_multi_problem_keeps_the_optimal_cost(name):
+    problem = multiProblem(name)
+    optimal = problem.getCostOfActions(search.astar(problem, heuristics.survivorHeuristic))
+    state = RescueState()
+    state.initialize(tryToLoad(layoutPath(name, "multiple")))
+    reduced = problems.ReducedMultiSurvivorProblem(state)
+    actions = reduced.expandActions(search.ucs(reduced))
+    # El plan expandido rescata a todos con el costo optimo
+    assert problem.isGoalState(endState(problem, actions))
+    assert problem.getCostOfActions(actions) == optimal
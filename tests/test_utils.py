@@ -0,0 +1,125 @@
+import random
+
+import pytest
+
+from algorithms import search, utils
+from algorithms.problems import SearchProblem
+
+
+class GraphProblem(SearchProblem):
+    """
+    Search problem over an explicit graph: edges maps a state to its
+    (successor, action, cost) triples and h maps a state to its heuristic.
+    """
+
+    def __init__(self, edges, start, goal, h):
+        self.edges, self.start, self.goal, self.h = edges, start, goal, h
+        self._expanded = 0
+
+    def getStartState(self):
+        return self.start
+
+    def isGoalState(self, state):
+        return state == self.goal
+
+    def getSuccessors(self, state):
+        self._expanded += 1
+        return self.edges.get(state, [])
+
+    def getCostOfActions(self, actions):
+        state, cost = self.start, 0
+        for action in actions:
+            state, _, step = next(e for e in self.edges[state] if e[1] == action)
+            cost += step
+        return cost
+
+
+def graphHeuristic(state, problem):
+    return problem.h[state]
+
+
+def test_indexed_queue_replaces_cheaper_node_on_equal_priority():
+    queue = utils.IndexedPriorityQueue()
+    expensive = utils.SearchNode("x", cost=10)
+    cheap = utils.SearchNode("x", cost=2)
+    queue.push(expensive, 1)
+    queue.push(cheap, 1)
+    assert len(queue) == 1
+    assert queue.pop() is cheap
+
+
+def test_indexed_queue_keeps_queued_node_on_equal_priority():
+    queue = utils.IndexedPriorityQueue()
+    first = utils.SearchNode("x", cost=2)
+    queue.push(first, 1)
+    queue.push(utils.SearchNode("x", cost=5), 1)
+    assert queue.pop() is first
+
+
+def test_greedy_search_with_indexed_queue_rediscovers_state_with_equal_h():
+    # X se genera primero caro desde S y despues barato desde A, con el
+    # mismo h: la busqueda greedy solo llega a G si se queda con el barato
+    edges = {
+        "S": [("A", "a", 1), ("X", "x", 10), ("D", "d", 1)],
+        "A": [("X", "ax", 1)],
+        "X": [("G", "g", 1)],
+    }
+    h = {"S": 2, "A": 1, "X": 1, "D": 3, "G": 0}
+    problem = GraphProblem(edges, "S", "G", h)
+    actions = search.greedySearch(problem, graphHeuristic, frontier=utils.IndexedPriorityQueue)
+    assert actions == ["a", "ax", "g"]
+    assert problem.getCostOfActions(actions) == 3
+
+
+@pytest.mark.parametrize("queueClass", [utils.BucketQueue, utils.RadixHeap])
+def test_monotone_queues_keep_the_order_of_any_priorities(queueClass):
+    # Prioridades que bajan (heuristica inconsistente) y no enteras van al
+    # heap aparte; el orden de salida es el de un heap con desempate FIFO
+    rng = random.Random(4)
+    queue, reference = queueClass(), utils.PriorityQueue()
+    for step in range(2000):
+        if rng.random() < 0.6 or queue.isEmpty():
+            priority = rng.choice([rng.randint(0, 60), rng.randint(0, 60) + 0.5])
+            queue.push(step, priority)
+            reference.push(step, priority)
+        else:
+            assert queue.pop() == reference.pop()
+    while not reference.isEmpty():
+        assert queue.pop() == reference.pop()
+    assert queue.isEmpty()
+
+
+def test_monotone_frontiers_with_an_inconsistent_heuristic_or_weights():
+    # h(A) = 5 es admisible pero inconsistente: D sale con f = 2 despues de
+    # que A salio con f = 6
+    edges = {
+        "S": [("A", "a", 1), ("B", "b", 4)],
+        "A": [("D", "d", 1)],
+        "D": [("G", "g", 5)],
+        "B": [("G", "bg", 4)],
+    }
+    h = {"S": 0, "A": 5, "B": 3, "D": 0, "G": 0}
+    for frontier in (utils.BucketQueue, utils.RadixHeap):
+        for function, args in (
+            (search.aStarSearch, ()),
+            (search.weightedAStarSearch, (1.5,)),
+            (search.greedySearch, ()),
+        ):
+            expected = function(GraphProblem(edges, "S", "G", h), graphHeuristic, *args)
+            assert function(GraphProblem(edges, "S", "G", h), graphHeuristic, *args, frontier=frontier) == expected
+    assert search.aStarSearch(GraphProblem(edges, "S", "G", h), graphHeuristic) == ["a", "d", "g"]
+
+
+def test_memory_budget_uses_the_current_memory_and_not_the_peak():
+    before = utils.currentMemoryMB()
+    block = bytearray(200 * 1024 * 1024)
+    block[::4096] = b"x" * len(block[::4096])
+    assert utils.currentMemoryMB() > before + 150
+    del block
+
+    # El pico ya paso de before + 150 MB, pero la memoria de ahora no
+    budget = utils.SearchBudget(maxMemoryMB=before + 100)
+    budget.check()
+    budget = utils.SearchBudget(maxMemoryMB=before / 2)
+    with pytest.raises(utils.BudgetExceeded):
+        budget.check()
@@ -369,6 +369,7 @@ class GameStateData:
             self.layout = prevState.layout
             self.cumulativeCost = prevState.cumulativeCost
             self.rescuedCount = prevState.rescuedCount
+            self.time = prevState.time
 
         self.survivorsSaved = None
         self._agentMoved = None
@@ -383,6 +384,7 @@ class GameStateData:
         state.survivorsSaved = self.survivorsSaved
         state.cumulativeCost = self.cumulativeCost
         state.rescuedCount = self.rescuedCount
+        state.time = self.time
         return state
 
     def copyAgentStates(self, agentStates):
@@ -474,6 +476,7 @@ class GameStateData:
         self.layout = layout
         self.cumulativeCost = 0
         self.rescuedCount = 0
+        self.time = 0  # timesteps elapsed (one per action)
 
         self.agentStates = []
         for pos in layout.agentPositions:
@@ -1,5 +1,28 @@
-from world.game import Grid
+from world.game import Grid, Directions, Actions
+from array import array
+import hashlib
+import heapq
 import os
+import pickle
+
+# Movement cost of each terrain character; anything else costs 1
+TERRAIN_COSTS = {
+    ".": 1,  # Normal floor
+    " ": 1,  # Empty space
+    "~": 2,  # Water
+    "^": 3,  # Rubble
+    "*": 5,  # Fire
+}
+
+# End of the intervals that never end (see addTimedTerrain)
+INFINITY = float("inf")
+
+# Cost stored in the distance fields for cells that can't reach the target
+UNREACHABLE = 2**31 - 1
+
+
+def _endOf(end):
+    return INFINITY if end is None else end
 
 
 class RescueLayout:
@@ -18,6 +41,12 @@ class RescueLayout:
         self.processLayoutText(layoutText)
         self.layoutText = layoutText
         self.totalSurvivors = len(self.survivors.asList())
+        self._compiled = None
+        self._hierarchy = None
+        self.changes = []  # positions changed during the mission, in order
+        self.changeSchedule = []  # (time, pos, layoutChar) still to apply, in time order
+        self.timedTerrain = {}  # pos -> [(start, end, terrainChar)]
+        self.blockedIntervals = {}  # pos -> [(start, end)]
 
     def isWall(self, pos):
         """
@@ -43,21 +72,242 @@ class RescueLayout:
         - Rubble ('^'): 3
         - Fire ('*'): 5
         """
-        terrain_char = self.getTerrain(x, y)
-        TERRAIN_COSTS = {
-            ".": 1,  # Normal floor
-            " ": 1,  # Empty space
-            "~": 2,  # Water
-            "^": 3,  # Rubble
-            "*": 5,  # Fire
-        }
-        return TERRAIN_COSTS.get(terrain_char, 1)
+        return TERRAIN_COSTS.get(self.terrain.get((x, y), "."), 1)
+
+    def compile(self):
+        """
+        Returns the CompiledLayout of this layout, building it on first use.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledLayout(self)
+        return self._compiled
+
+    def getContractionHierarchy(self, cacheDir=None):
+        """
+        Returns the ContractionHierarchy of this layout. The preprocessing
+        is saved in cacheDir (HIERARCHY_CACHE_DIR by default; pass False
+        to keep it in memory only) under a hash of the compiled walls and
+        costs and of HIERARCHY_FORMAT_VERSION, so each map pays for it once.
+        """
+        if self._hierarchy is None:
+            if cacheDir is None:
+                cacheDir = HIERARCHY_CACHE_DIR
+            compiled = self.compile()
+            filename = None
+            if cacheDir:
+                key = (HIERARCHY_FORMAT_VERSION, compiled.height, compiled.walls, compiled.costs)
+                filename = os.path.join(cacheDir, hashlib.sha1(repr(key).encode()).hexdigest() + ".ch")
+            if filename is not None and os.path.exists(filename):
+                self._hierarchy = ContractionHierarchy.load(filename)
+            if self._hierarchy is None:
+                self._hierarchy = ContractionHierarchy(compiled)
+                if filename is not None:
+                    os.makedirs(cacheDir, exist_ok=True)
+                    self._hierarchy.save(filename)
+        return self._hierarchy
+
+    def setWall(self, pos, wall=True):
+        """
+        Reports that the cell at pos collapsed into a wall (or was cleared,
+        with wall=False).
+        """
+        x, y = pos
+        self.walls[x][y] = wall
+        self.terrain.pop(pos, None)
+        self._recordChange(pos, "%" if wall else ".")
+
+    def setTerrain(self, pos, terrainChar):
+        """
+        Reports that the terrain at pos changed, e.g. to '*' when fire
+        spreads. The cell stops being a wall.
+        """
+        if terrainChar not in TERRAIN_COSTS:
+            raise ValueError("Unknown terrain character: %r" % terrainChar)
+        x, y = pos
+        self.walls[x][y] = False
+        if TERRAIN_COSTS[terrainChar] == 1:
+            self.terrain.pop(pos, None)
+        else:
+            self.terrain[pos] = terrainChar
+        self._recordChange(pos, terrainChar)
+
+    def _recordChange(self, pos, layoutChar):
+        """
+        Logs a change, drops the compiled tables and keeps layoutText in sync
+        (survivor and rescuer markers are left in the text).
+        """
+        x, y = pos
+        row = self.height - 1 - y
+        line = self.layoutText[row]
+        if line[x] not in "SR":
+            self.layoutText[row] = line[:x] + layoutChar + line[x + 1:]
+        self._compiled = None
+        self._hierarchy = None
+        self.changes.append(pos)
+
+    def getChangesSince(self, index):
+        """
+        Returns the positions reported as changed after the first index
+        changes, so a planner can keep len(changes) and ask only for news.
+        """
+        return self.changes[index:]
+
+    def addScheduledChange(self, time, pos, layoutChar):
+        """
+        Schedules an unforeseen change for the mission: once the rescuer
+        has made time moves, pos becomes a wall ('%') or the given terrain.
+        Unlike the timed terrain of addTimedTerrain, planners only learn of
+        it when it happens (see applyScheduledChanges).
+        """
+        if layoutChar != "%" and layoutChar not in TERRAIN_COSTS:
+            raise ValueError("Unknown terrain character: %r" % layoutChar)
+        self.changeSchedule.append((time, pos, layoutChar))
+        self.changeSchedule.sort(key=lambda change: change[0])
+
+    def applyScheduledChanges(self, time, keepOpen=()):
+        """
+        Applies the scheduled changes due by the given timestep through
+        setWall / setTerrain, so they are reported in changes. Cells in
+        keepOpen (the rescuer's) never become walls. Returns the positions
+        changed.
+        """
+        changed = []
+        while self.changeSchedule and self.changeSchedule[0][0] <= time:
+            _, pos, layoutChar = self.changeSchedule.pop(0)
+            if layoutChar == "%":
+                if pos in keepOpen:
+                    continue
+                self.setWall(pos)
+            else:
+                self.setTerrain(pos, layoutChar)
+            changed.append(pos)
+        return changed
+
+    def loadChanges(self, filename):
+        """
+        Reads a change file with one entry per line:
+
+            time x y char
+
+        char is '%' for a wall or a terrain character ('.', '~', '^', '*').
+        Blank lines and lines starting with '#' are skipped.
+        """
+        with open(filename) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                time, x, y, char = line.split()
+                self.addScheduledChange(int(time), (int(x), int(y)), char)
+
+    def addTimedTerrain(self, pos, start, end, terrainChar):
+        """
+        Schedules the terrain of pos to be terrainChar for the timesteps
+        start <= t < end (end=None means forever), e.g. fire that reaches a
+        corridor at t=10 and burns out at t=30. Later entries win where
+        several overlap.
+        """
+        if terrainChar not in TERRAIN_COSTS:
+            raise ValueError("Unknown terrain character: %r" % terrainChar)
+        self.timedTerrain.setdefault(pos, []).append((start, _endOf(end), terrainChar))
+
+    def addBlockedInterval(self, pos, start, end=None):
+        """
+        Makes pos impassable for the timesteps start <= t < end (end=None
+        means forever), e.g. a flooded stairwell.
+        """
+        self.blockedIntervals.setdefault(pos, []).append((start, _endOf(end)))
+
+    def isTimed(self):
+        """
+        Returns True if any cell has a schedule.
+        """
+        return bool(self.timedTerrain or self.blockedIntervals)
+
+    def isBlockedAt(self, pos, time):
+        """
+        Returns True if pos is a wall or is blocked at the given timestep.
+        """
+        if self.isWall(pos):
+            return True
+        return any(start <= time < end for start, end in self.blockedIntervals.get(pos, ()))
+
+    def getTerrainCostAt(self, x, y, time):
+        """
+        Get the cost of entering (x, y) at the given timestep: the scheduled
+        terrain if one is active, the static terrain otherwise.
+        """
+        for start, end, terrainChar in reversed(self.timedTerrain.get((x, y), ())):
+            if start <= time < end:
+                return TERRAIN_COSTS[terrainChar]
+        return self.getTerrainCost(x, y)
+
+    def getSafeIntervals(self, pos):
+        """
+        Returns the maximal (start, end, cost) intervals, in time order, in
+        which pos is not blocked and the cost of entering it doesn't change.
+        end is exclusive and float('inf') for the last one. A wall has none.
+        """
+        if self.isWall(pos):
+            return []
+        blocked = self.blockedIntervals.get(pos, ())
+        timed = self.timedTerrain.get(pos, ())
+        if not blocked and not timed:
+            return [(0, INFINITY, self.getTerrainCost(*pos))]
+
+        # Instantes donde algo cambia; entre dos seguidos todo es constante
+        cortes = {0}
+        for intervalo in list(blocked) + list(timed):
+            cortes.update(t for t in intervalo[:2] if 0 < t < INFINITY)
+        cortes = sorted(cortes)
+
+        intervals = []
+        for inicio, fin in zip(cortes, cortes[1:] + [INFINITY]):
+            if self.isBlockedAt(pos, inicio):
+                continue
+            costo = self.getTerrainCostAt(pos[0], pos[1], inicio)
+            if intervals and intervals[-1][1] == inicio and intervals[-1][2] == costo:
+                intervals[-1] = (intervals[-1][0], fin, costo)
+            else:
+                intervals.append((inicio, fin, costo))
+        return intervals
+
+    def loadSchedule(self, filename):
+        """
+        Reads a schedule file with one entry per line:
+
+            x y start end char
+
+        char is a terrain character ('.', '~', '^', '*') or '%' for a
+        blocked interval, and end is '-' for an entry that never ends.
+        Blank lines and lines starting with '#' are skipped.
+        """
+        with open(filename) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                x, y, start, end, char = line.split()
+                pos = (int(x), int(y))
+                end = None if end == "-" else int(end)
+                if char == "%":
+                    self.addBlockedInterval(pos, int(start), end)
+                else:
+                    self.addTimedTerrain(pos, int(start), end, char)
 
     def __str__(self):
         return "\n".join(self.layoutText)
 
     def deepCopy(self):
-        return RescueLayout(self.layoutText[:])
+        layout = RescueLayout(self.layoutText[:])
+        if self.changes:
+            layout.walls = self.walls.copy()
+            layout.terrain = dict(self.terrain)
+            layout.changes = list(self.changes)
+        layout.changeSchedule = list(self.changeSchedule)
+        layout.timedTerrain = {pos: list(entries) for pos, entries in self.timedTerrain.items()}
+        layout.blockedIntervals = {pos: list(entries) for pos, entries in self.blockedIntervals.items()}
+        return layout
 
     def processLayoutText(self, layoutText):
         """
@@ -105,6 +355,488 @@ class RescueLayout:
         # They don't create walls, survivors, or special terrain
 
 
+class CompiledLayout:
+    """
+    Flat lookup tables built once from a RescueLayout.
+
+    Cells are indexed as x * height + y (the same order used by Grid), and
+    hold:
+    - walls[cell]: True if the cell is a wall
+    - costs[cell]: terrain cost of entering the cell
+    - a CSR-style adjacency table: the legal moves out of a cell are
+      edges[edgeStart[cell]:edgeStart[cell + 1]], each one a
+      (neighborCell, action, cost) triple
+
+    Moves are listed in NORTH, SOUTH, EAST, WEST order, the same order the
+    search problems use, so searches over the tables expand nodes in the
+    same order as before.
+    """
+
+    ACTIONS = [Directions.NORTH, Directions.SOUTH, Directions.EAST, Directions.WEST]
+
+    def __init__(self, layout):
+        self.width = layout.width
+        self.height = layout.height
+        numCells = self.width * self.height
+
+        self.positions = [self.cellToPosition(cell) for cell in range(numCells)]
+        self.walls = [layout.walls[x][y] for x, y in self.positions]
+        self.costs = [layout.getTerrainCost(x, y) for x, y in self.positions]
+
+        self.edgeStart = [0] * (numCells + 1)
+        self.edges = []
+        for cell, (x, y) in enumerate(self.positions):
+            self.edgeStart[cell] = len(self.edges)
+            if self.walls[cell]:
+                continue
+            for action in self.ACTIONS:
+                dx, dy = Actions.directionToVector(action)
+                nextx, nexty = int(x + dx), int(y + dy)
+                if not (0 <= nextx < self.width and 0 <= nexty < self.height):
+                    continue
+                nextCell = self.positionToCell((nextx, nexty))
+                if not self.walls[nextCell]:
+                    self.edges.append((nextCell, action, self.costs[nextCell]))
+        self.edgeStart[numCells] = len(self.edges)
+
+        # Shortest-path trees and distance fields already computed, by cell
+        self._trees = {}
+        self._fields = {}
+        self._reduced = {}
+
+    def positionToCell(self, position):
+        """
+        Returns the cell index of an (x, y) position.
+        """
+        x, y = position
+        return x * self.height + y
+
+    def cellToPosition(self, cell):
+        """
+        Returns the (x, y) position of a cell index.
+        """
+        return divmod(cell, self.height)
+
+    def getEdges(self, cell):
+        """
+        Returns the (neighborCell, action, cost) moves out of a cell.
+        """
+        return self.edges[self.edgeStart[cell]:self.edgeStart[cell + 1]]
+
+    def getShortestPathTree(self, source):
+        """
+        Runs Dijkstra from the source cell over the terrain costs (the cost of
+        a move is the cost of the entered cell) and returns the tree as
+        (distances, parents, actions), three lists indexed by cell:
+        - distances[cell]: cost of the cheapest path from source (inf if unreachable)
+        - parents[cell]: previous cell on that path (-1 for source/unreachable)
+        - actions[cell]: action that enters the cell on that path
+
+        Trees are cached per source cell, so repeated queries are free.
+        """
+        if source in self._trees:
+            return self._trees[source]
+
+        numCells = len(self.walls)
+        distances = [float("inf")] * numCells
+        parents = [-1] * numCells
+        actions = [None] * numCells
+        edges, edgeStart = self.edges, self.edgeStart
+
+        distances[source] = 0
+        heap = [(0, source)]
+        while heap:
+            dist, cell = heapq.heappop(heap)
+            if dist > distances[cell]:
+                continue
+            for i in range(edgeStart[cell], edgeStart[cell + 1]):
+                nextCell, action, cost = edges[i]
+                nextDist = dist + cost
+                if nextDist < distances[nextCell]:
+                    distances[nextCell] = nextDist
+                    parents[nextCell] = cell
+                    actions[nextCell] = action
+                    heapq.heappush(heap, (nextDist, nextCell))
+
+        self._trees[source] = (distances, parents, actions)
+        return self._trees[source]
+
+    def getDistancesTo(self, target):
+        """
+        Runs Dijkstra backwards from the target cell and returns an
+        array('l') with, for every cell, the cost of the cheapest path from
+        that cell to the target (UNREACHABLE if it can't reach it). Moving
+        into a cell costs that cell's terrain, so the cost of a move into
+        'cell' is costs[cell].
+
+        Fields are cached per target cell, only in this compact form: a
+        machine integer per cell instead of a list of Python numbers.
+        """
+        if target in self._fields:
+            return self._fields[target]
+
+        numCells = len(self.walls)
+        distances = [float("inf")] * numCells
+        edges, edgeStart, costs = self.edges, self.edgeStart, self.costs
+
+        distances[target] = 0
+        heap = [(0, target)]
+        while heap:
+            dist, cell = heapq.heappop(heap)
+            if dist > distances[cell]:
+                continue
+            # Moves are reversible: every neighbor can step into this cell
+            prevDist = dist + costs[cell]
+            for i in range(edgeStart[cell], edgeStart[cell + 1]):
+                prevCell = edges[i][0]
+                if prevDist < distances[prevCell]:
+                    distances[prevCell] = prevDist
+                    heapq.heappush(heap, (prevDist, prevCell))
+
+        field = array("l", [UNREACHABLE if d == INFINITY else d for d in distances])
+        self._fields[target] = field
+        return field
+
+    def getPath(self, source, target):
+        """
+        Returns the actions of a cheapest path between two cells, or None if
+        the target can't be reached.
+        """
+        distances, parents, actions = self.getShortestPathTree(source)
+        if distances[target] == float("inf"):
+            return None
+        path = []
+        cell = target
+        while cell != source:
+            path.append(actions[cell])
+            cell = parents[cell]
+        path.reverse()
+        return path
+
+    def reduce(self, keep):
+        """
+        Returns the ReducedLayout of these tables that keeps the given cells
+        (survivors and rescuer) as nodes, building it on first use.
+        """
+        keep = frozenset(keep)
+        if keep not in self._reduced:
+            self._reduced[keep] = ReducedLayout(self, keep)
+        return self._reduced[keep]
+
+
+class ReducedLayout:
+    """
+    The graph of a CompiledLayout with its dead ends and corridors removed.
+
+    - Dead ends: cells with a single open neighbor are dropped, repeatedly,
+      unless they are kept (survivors, rescuer), so every branch that leads
+      nowhere useful disappears.
+    - Corridors: the nodes left are the kept cells and the junctions (cells
+      without exactly two neighbors); every chain of two-neighbor cells
+      between two nodes becomes one edge carrying its actions and the sum
+      of the terrain costs it enters.
+
+    Nodes are cell indices of the compiled layout, and getEdges(cell) lists
+    (nextNode, actions, cost) triples, with actions a tuple of primitive
+    moves. Only the cheapest edge between two nodes is kept.
+    """
+
+    def __init__(self, compiled, keep):
+        self.compiled = compiled
+        self.keep = keep
+        numCells = len(compiled.walls)
+
+        # Poda de callejones sin salida
+        vecinos = [[edge[0] for edge in compiled.getEdges(cell)] for cell in range(numCells)]
+        grado = [len(lista) for lista in vecinos]
+        vivo = [not pared for pared in compiled.walls]
+        pendientes = [c for c in range(numCells) if vivo[c] and grado[c] <= 1 and c not in keep]
+        while pendientes:
+            celda = pendientes.pop()
+            if not vivo[celda]:
+                continue
+            vivo[celda] = False
+            for vecino in vecinos[celda]:
+                grado[vecino] -= 1
+                if vivo[vecino] and grado[vecino] <= 1 and vecino not in keep:
+                    pendientes.append(vecino)
+
+        self.cells = sum(vivo)
+        self.pruned = numCells - sum(compiled.walls) - self.cells
+        self.nodes = [c for c in range(numCells) if vivo[c] and (grado[c] != 2 or c in keep)]
+        esNodo = set(self.nodes)
+
+        # Contraccion de pasillos: se camina cada cadena desde sus dos nodos
+        self.edges = {}
+        for nodo in self.nodes:
+            mejores = {}
+            for siguiente, action, cost in compiled.getEdges(nodo):
+                if not vivo[siguiente]:
+                    continue
+                anterior, celda = nodo, siguiente
+                acciones, costo = [action], cost
+                while celda not in esNodo:
+                    for paso in compiled.getEdges(celda):
+                        if vivo[paso[0]] and paso[0] != anterior:
+                            break
+                    anterior, celda = celda, paso[0]
+                    acciones.append(paso[1])
+                    costo += paso[2]
+                if celda != nodo and costo < mejores.get(celda, (None, float("inf")))[1]:
+                    mejores[celda] = (tuple(acciones), costo)
+            self.edges[nodo] = [
+                (destino, acciones, costo) for destino, (acciones, costo) in mejores.items()
+            ]
+
+    def getEdges(self, cell):
+        """
+        Returns the (nextNode, actions, cost) edges out of a node.
+        """
+        return self.edges[cell]
+
+
+# Directory where ContractionHierarchy preprocessing is saved, one file per
+# map (see RescueLayout.getContractionHierarchy), in the repository root
+HIERARCHY_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".hierarchies"
+)
+
+# Version of the saved hierarchies: bump it whenever ContractionHierarchy
+# changes, so files written by older code are built again
+HIERARCHY_FORMAT_VERSION = 1
+
+# Most nodes each witness search settles while contracting; a lower limit
+# builds faster but adds more (harmless) shortcuts
+WITNESS_SETTLE_LIMIT = 60
+
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchy (Geisberger et al.) of a CompiledLayout, for many
+    cheapest-path queries on the same static map.
+
+    Preprocessing contracts the open cells one at a time, cheapest first by
+    edge difference: a cell is removed and, for every pair of neighbors u, w
+    whose cheapest path went through it, a shortcut u -> w is added that
+    remembers the cell in the middle. A query then runs a bidirectional
+    Dijkstra that only climbs to higher-ranked cells, and its shortcuts are
+    unpacked back into moves.
+
+    Moves are directed (entering a cell costs its terrain), so cells keep
+    upward edges in both directions. Positions are (x, y) tuples.
+    """
+
+    def __init__(self, compiled):
+        self.height = compiled.height
+        numCells = len(compiled.walls)
+        cells = [c for c in range(numCells) if not compiled.walls[c]]
+
+        # edges[(u, w)] = (costo, celda del medio o None si es un paso)
+        self.edges = {}
+        salida = {c: {} for c in cells}
+        entrada = {c: {} for c in cells}
+        for u in cells:
+            for w, _, costo in compiled.getEdges(u):
+                self.edges[(u, w)] = (costo, None)
+                salida[u][w] = costo
+                entrada[w][u] = costo
+
+        self.rank = [-1] * numCells
+        self.upOut = [[] for _ in range(numCells)]
+        self.upIn = [[] for _ in range(numCells)]
+        vecinosContraidos = [0] * numCells
+
+        def atajos(v):
+            # Atajos necesarios al contraer v: (u, w, costo)
+            nuevos = []
+            for u, costoUV in entrada[v].items():
+                destinos = [(w, c) for w, c in salida[v].items() if w != u]
+                if not destinos:
+                    continue
+                limite = costoUV + max(c for _, c in destinos)
+                distancias = self._witness(salida, u, v, limite)
+                for w, costoVW in destinos:
+                    costo = costoUV + costoVW
+                    if distancias.get(w, float("inf")) > costo:
+                        nuevos.append((u, w, costo))
+            return nuevos
+
+        def prioridad(v):
+            return len(atajos(v)) - len(entrada[v]) - len(salida[v]) + vecinosContraidos[v]
+
+        cola = [(prioridad(v), v) for v in cells]
+        heapq.heapify(cola)
+        siguienteRango = 0
+        while cola:
+            _, v = heapq.heappop(cola)
+            # Actualizacion perezosa: si su prioridad subio, vuelve a la cola
+            actual = prioridad(v)
+            if cola and actual > cola[0][0]:
+                heapq.heappush(cola, (actual, v))
+                continue
+
+            for u, w, costo in atajos(v):
+                if costo < salida[u].get(w, float("inf")):
+                    salida[u][w] = entrada[w][u] = costo
+                    self.edges[(u, w)] = (costo, v)
+
+            self.rank[v] = siguienteRango
+            siguienteRango += 1
+            self.upOut[v] = list(salida[v].items())
+            self.upIn[v] = list(entrada[v].items())
+            for w in salida[v]:
+                del entrada[w][v]
+                vecinosContraidos[w] += 1
+            for u in entrada[v]:
+                del salida[u][v]
+                vecinosContraidos[u] += 1
+            del salida[v], entrada[v]
+
+        self.shortcuts = sum(1 for _, medio in self.edges.values() if medio is not None)
+
+    @staticmethod
+    def _witness(salida, source, skip, limit):
+        """
+        Dijkstra from source that avoids skip and stops past limit (or after
+        WITNESS_SETTLE_LIMIT settled cells). Returns the distances found.
+        """
+        distancias = {source: 0}
+        heap = [(0, source)]
+        asentados = 0
+        while heap:
+            dist, u = heapq.heappop(heap)
+            if dist > distancias[u]:
+                continue
+            if dist > limit or asentados >= WITNESS_SETTLE_LIMIT:
+                break
+            asentados += 1
+            for w, costo in salida[u].items():
+                if w == skip:
+                    continue
+                nueva = dist + costo
+                if nueva < distancias.get(w, float("inf")):
+                    distancias[w] = nueva
+                    heapq.heappush(heap, (nueva, w))
+        return distancias
+
+    def _query(self, source, target, tick=None):
+        """
+        Bidirectional upward Dijkstra between two cells. Returns the cost and
+        the meeting cell with both parent maps, or (inf, None, ...) if the
+        target can't be reached. tick, if given, is called once per settled
+        cell (e.g. SearchBudget.tick).
+        """
+        infinito = float("inf")
+        distancias = ({source: 0}, {target: 0})
+        padres = ({source: None}, {target: None})
+        heaps = ([(0, source)], [(0, target)])
+        aristas = (self.upOut, self.upIn)
+        mejor, encuentro = (0, source) if source == target else (infinito, None)
+
+        while heaps[0] or heaps[1]:
+            for lado in (0, 1):
+                heap = heaps[lado]
+                if not heap:
+                    continue
+                dist, u = heapq.heappop(heap)
+                if dist > distancias[lado][u]:
+                    continue
+                if dist >= mejor:
+                    heap.clear()  # este lado ya no puede mejorar el camino
+                    continue
+                if tick is not None:
+                    tick()
+                otro = distancias[1 - lado].get(u)
+                if otro is not None and dist + otro < mejor:
+                    mejor, encuentro = dist + otro, u
+                for w, costo in aristas[lado][u]:
+                    nueva = dist + costo
+                    if nueva < distancias[lado].get(w, infinito):
+                        distancias[lado][w] = nueva
+                        padres[lado][w] = u
+                        heapq.heappush(heap, (nueva, w))
+        return mejor, encuentro, padres
+
+    def _unpack(self, u, w, cells):
+        """
+        Appends to cells the cells of the edge u -> w after u, unpacking
+        shortcuts recursively.
+        """
+        pila = [(u, w)]
+        while pila:
+            a, b = pila.pop()
+            medio = self.edges[(a, b)][1]
+            if medio is None:
+                cells.append(b)
+            else:
+                pila.append((medio, b))
+                pila.append((a, medio))
+
+    def getCost(self, source, target):
+        """
+        Returns the cost of the cheapest path between two (x, y) positions,
+        or inf if the target can't be reached.
+        """
+        return self._query(self._cell(source), self._cell(target))[0]
+
+    def getPath(self, source, target, tick=None):
+        """
+        Returns the actions of a cheapest path between two (x, y) positions,
+        or None if the target can't be reached. tick: see _query.
+        """
+        origen, destino = self._cell(source), self._cell(target)
+        costo, encuentro, (haciaAdelante, haciaAtras) = self._query(origen, destino, tick)
+        if costo == float("inf"):
+            return None
+
+        # Cadena de aristas origen -> encuentro -> destino
+        tramos = []
+        celda = encuentro
+        while haciaAdelante[celda] is not None:
+            tramos.append((haciaAdelante[celda], celda))
+            celda = haciaAdelante[celda]
+        tramos.reverse()
+        celda = encuentro
+        while haciaAtras[celda] is not None:
+            tramos.append((celda, haciaAtras[celda]))
+            celda = haciaAtras[celda]
+
+        cells = [origen]
+        for u, w in tramos:
+            self._unpack(u, w, cells)
+        actions = []
+        for a, b in zip(cells, cells[1:]):
+            (ax, ay), (bx, by) = divmod(a, self.height), divmod(b, self.height)
+            actions.append(Actions.vectorToDirection((bx - ax, by - ay)))
+        return actions
+
+    def _cell(self, position):
+        x, y = position
+        return x * self.height + y
+
+    def save(self, filename):
+        """
+        Writes the hierarchy to a file, after a HIERARCHY_FORMAT_VERSION header.
+        """
+        with open(filename, "wb") as f:
+            pickle.dump((HIERARCHY_FORMAT_VERSION, self), f, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(filename):
+        """
+        Reads a hierarchy written by save. Returns None if the file can't be
+        read or was written by another version.
+        """
+        try:
+            with open(filename, "rb") as f:
+                version, hierarchy = pickle.load(f)
+        except Exception:
+            return None
+        if version != HIERARCHY_FORMAT_VERSION:
+            return None
+        return hierarchy
+
+
 def getLayout(name):
     """
     Load a layout file by name.
@@ -127,6 +859,17 @@ def tryToLoad(fullname):
         return None
     f = open(fullname)
     try:
-        return RescueLayout([line.strip() for line in f])
+        layout = RescueLayout([line.strip() for line in f])
     finally:
         f.close()
+
+    # Optional schedule of the layout: same name with a .sched extension
+    schedule = fullname[: -len(".lay")] + ".sched" if fullname.endswith(".lay") else None
+    if schedule is not None and os.path.exists(schedule):
+        layout.loadSchedule(schedule)
+
+    # Optional changes during the mission: same name with a .changes extension
+    changes = fullname[: -len(".lay")] + ".changes" if fullname.endswith(".lay") else None
+    if changes is not None and os.path.exists(changes):
+        layout.loadChanges(changes)
+    return layout
@@ -12,6 +12,9 @@ class RescueMission:
         Create a new rescue mission.
         """
         agents = [rescueAgent]
+        if layout.changeSchedule:
+            # Cada mision aplica los cambios sobre su propia copia del mapa
+            layout = layout.deepCopy()
         initState = RescueState()
         initState.initialize(layout)
 
@@ -26,8 +29,13 @@ class RescueMission:
 
     def process(self, state, mission):
         """
-        Checks to see whether it is time to end the mission.
+        Applies the layout changes scheduled for this timestep (the agent
+        sees them before its next move) and checks to see whether it is
+        time to end the mission.
         """
+        layout = state.getLayout()
+        if layout.changeSchedule:
+            layout.applyScheduledChanges(state.getTime(), keepOpen=(state.getRescuerPosition(),))
         if state.isWin():
             self.win(state, mission)
         if state.isLose():
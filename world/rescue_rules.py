@@ -14,9 +14,21 @@ class RescueRules:
         """
         Returns a list of possible actions.
         """
-        return Actions.getPossibleActions(
-            state.getRescuerState().configuration, state.data.layout.walls
-        )
+        configuration = state.getRescuerState().configuration
+        layout = state.data.layout
+        possible = Actions.getPossibleActions(configuration, layout.walls)
+        if not layout.blockedIntervals:
+            return possible
+
+        # Cells blocked at the next timestep can't be entered (or stayed in)
+        x, y = configuration.getPosition()
+        nextTime = state.data.time + 1
+        legal = []
+        for action in possible:
+            dx, dy = Actions.directionToVector(action)
+            if not layout.isBlockedAt((int(x + dx), int(y + dy)), nextTime):
+                legal.append(action)
+        return legal
 
     @staticmethod
     def applyAction(state, action):
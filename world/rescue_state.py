@@ -68,9 +68,11 @@ class RescueState:
         # Apply action
         RescueRules.applyAction(state, action)
 
-        # Update cumulative cost (terrain cost of the cell we moved to)
+        # Update cumulative cost (terrain cost of the cell we moved to, at
+        # the timestep we got there)
+        state.data.time += 1
         x, y = state.getRescuerPosition()
-        state.data.cumulativeCost += state.data.layout.getTerrainCost(x, y)
+        state.data.cumulativeCost += state.data.layout.getTerrainCostAt(x, y, state.data.time)
 
         return state
 
@@ -115,6 +117,32 @@ class RescueState:
         """
         return self.data.layout.walls
 
+    def getCompiledLayout(self):
+        """
+        Returns the CompiledLayout (flat wall/cost arrays and adjacency table)
+        of the current layout.
+        """
+        return self.data.layout.compile()
+
+    def getLayout(self):
+        """
+        Returns the RescueLayout of the mission, including the wall and
+        terrain changes reported so far.
+        """
+        return self.data.layout
+
+    def getLayoutText(self):
+        """
+        Returns the lines of text the current layout was loaded from.
+        """
+        return self.data.layout.layoutText
+
+    def getTime(self):
+        """
+        Returns the number of timesteps (actions) elapsed in the mission.
+        """
+        return self.data.time
+
     def hasSurvivor(self, x, y):
         """
         Returns True if there's a survivor at (x, y).